@@ -0,0 +1,13 @@
+"""
+Puts linkedin_scraper_api_codes on sys.path.
+
+The free scraper scripts run straight from this directory and share the URL
+helpers, output sinks and stand-in server of the API collectors; importing
+this module first is the one place that makes those modules importable.
+"""
+from pathlib import Path
+import sys
+
+API_CODES_DIR = str(Path(__file__).resolve().parent.parent / "linkedin_scraper_api_codes")
+if API_CODES_DIR not in sys.path:
+    sys.path.append(API_CODES_DIR)
@@ -0,0 +1,264 @@
+from collections import deque
+from typing import AsyncIterator, List, Optional, Tuple
+import asyncio
+
+import aiohttp
+
+from jobs_scraper import (
+    JOB_FIELDS,
+    JobData,
+    LinkedInJobsScraper,
+    ScraperConfig,
+    build_search_url,
+    check_page_status,
+    job_from_card,
+    page_retry_delay,
+    unseen_cards,
+)
+from job_parsers import JobCardParser, get_parser
+from job_index import JobIndex
+from output_sinks import FORMAT_CSV, detect_format, open_sink
+from token_bucket import AsyncTokenBucket
+
+GRID_FIELDS = ["search_keywords", "search_location"] + JOB_FIELDS
+
+
+class AsyncLinkedInJobsScraper:
+    """
+    asyncio job scraper for many keyword x location searches at once.
+
+    Every search shares one aiohttp connection pool, one concurrency limit
+    and one token bucket, so the politeness budget is global no matter how
+    large the grid is. Jobs are yielded as soon as their page is parsed,
+    and a job found by several searches of a grid is yielded only once.
+    Pass a job index to also skip jobs from earlier grids.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        pages_per_query: int = 2,
+        parser: Optional[str] = None,
+        timeout: int = 30,
+        job_index: Optional[JobIndex] = None,
+    ):
+        self.max_concurrency = max_concurrency or ScraperConfig.MAX_WORKERS
+        if requests_per_second is None:
+            requests_per_second = ScraperConfig.REQUESTS_PER_SECOND
+        self.rate_limiter = AsyncTokenBucket(
+            requests_per_second, ScraperConfig.BURST, **ScraperConfig.rate_limits()
+        )
+        self.pages_per_query = pages_per_query
+        self.parser: JobCardParser = get_parser(parser or ScraperConfig.PARSER)
+        self.timeout = timeout
+        self.job_index = job_index
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncLinkedInJobsScraper":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrency, keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=ScraperConfig.HEADERS,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def current_rate(self) -> float:
+        """
+        Live request rate (req/s) chosen by the rate limiter; 0 = unlimited.
+        """
+        return self.rate_limiter.rate
+
+    async def _fetch_job_page(self, url: str) -> str:
+        async with self._semaphore:
+            try:
+                async with self.session.get(url) as response:
+                    check_page_status(self.rate_limiter, response.status, str(response.url))
+                    return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise RuntimeError(f"Request failed: {str(e)}")
+
+    async def _scrape_page(
+        self, keywords: str, location: str, start: int, index: JobIndex
+    ) -> Optional[List[JobData]]:
+        """
+        Fetch and parse one results page; None when it has no job cards or
+        only jobs seen before. Retries follow the sync scraper's policy.
+        """
+        url = build_search_url(keywords, location, start)
+        for attempt in range(1, ScraperConfig.MAX_PAGE_ATTEMPTS + 1):
+            await self.rate_limiter.acquire()
+            try:
+                html = await self._fetch_job_page(url)
+                break
+            except RuntimeError as e:
+                await asyncio.sleep(page_retry_delay(attempt, e, start))
+        job_cards = self.parser.parse_cards(html)
+        if not job_cards:
+            return None
+        new_cards = unseen_cards(self.parser, index, job_cards)
+        if not new_cards:
+            return None
+        return [job for job in (job_from_card(self.parser, card) for card in new_cards) if job]
+
+    async def _scrape_query(
+        self,
+        keywords: str,
+        location: str,
+        max_jobs: int,
+        queue: asyncio.Queue,
+        index: JobIndex,
+    ) -> None:
+        """
+        Page through one search in order, `pages_per_query` pages ahead.
+        """
+        collected = 0
+        start = 0
+        in_flight = deque()
+        try:
+            while True:
+                while (
+                    len(in_flight) < self.pages_per_query
+                    and collected + len(in_flight) * ScraperConfig.JOBS_PER_PAGE < max_jobs
+                ):
+                    in_flight.append(
+                        asyncio.ensure_future(self._scrape_page(keywords, location, start, index))
+                    )
+                    start += ScraperConfig.JOBS_PER_PAGE
+                if not in_flight:
+                    break
+                try:
+                    jobs = await in_flight.popleft()
+                except RuntimeError as e:
+                    print(f"Scraping error ({keywords} / {location}): {str(e)}")
+                    jobs = None
+                if jobs is None:
+                    break
+                fresh = []
+                for job in jobs:
+                    if collected + len(fresh) >= max_jobs:
+                        break
+                    if index.add(JobIndex.key(job.job_link)):
+                        fresh.append(job)
+                collected += len(fresh)
+                await queue.put((keywords, location, fresh))
+                if collected >= max_jobs:
+                    break
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def scrape_grid(
+        self, keywords: List[str], locations: List[str], max_jobs: int = 100
+    ) -> AsyncIterator[Tuple[str, str, JobData]]:
+        """
+        Yield (keywords, location, job) for every search in the grid.
+
+        Jobs of one search keep their page order; different searches
+        interleave as their pages complete. `max_jobs` applies per search.
+        A search that fails on a page stops there; an unexpected error in
+        any search stops the grid and is raised here.
+        """
+        index = self.job_index if self.job_index is not None else JobIndex()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency * 2)
+        tasks = [
+            asyncio.ensure_future(self._scrape_query(keyword, location, max_jobs, queue, index))
+            for keyword in keywords
+            for location in locations
+        ]
+
+        async def finish() -> None:
+            try:
+                await asyncio.gather(*tasks)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(None)
+
+        done = asyncio.ensure_future(finish())
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                keyword, location, jobs = page
+                for job in jobs:
+                    yield keyword, location, job
+        finally:
+            for task in tasks:
+                task.cancel()
+            done.cancel()
+            await asyncio.gather(*tasks, done, return_exceptions=True)
+
+    async def scrape_jobs(self, keywords: str, location: str, max_jobs: int = 100) -> List[JobData]:
+        return [job async for _, _, job in self.scrape_grid([keywords], [location], max_jobs)]
+
+
+async def scrape_grid_to_file(
+    keywords: List[str],
+    locations: List[str],
+    max_jobs: int = 100,
+    filename: str = "linkedin_jobs_grid.ndjson",
+    format: Optional[str] = None,
+    scraper: Optional[AsyncLinkedInJobsScraper] = None,
+) -> int:
+    """
+    Stream a whole grid to a file, one record per job tagged with its search.
+
+    The format follows the extension like LinkedInJobsScraper.save_results(),
+    and so does the handling of interruptions: the jobs written so far are
+    kept. Nothing is written when there are no jobs.
+    """
+    kwargs = {"batch_size": ScraperConfig.JOBS_PER_PAGE}
+    if (format or detect_format(filename)) == FORMAT_CSV:
+        kwargs["fieldnames"] = GRID_FIELDS
+    sink = open_sink(filename, format, **kwargs)
+    owned = scraper is None
+    scraper = scraper or AsyncLinkedInJobsScraper()
+    try:
+        async for keyword, location, job in scraper.scrape_grid(keywords, locations, max_jobs):
+            sink.write({"search_keywords": keyword, "search_location": location, **vars(job)})
+            if sink.count % ScraperConfig.JOBS_PER_PAGE == 0:
+                print(f"Scraped {sink.count} jobs...")
+    except BaseException:
+        LinkedInJobsScraper._save_partial(sink)
+        raise
+    finally:
+        if owned:
+            await scraper.close()
+    if not sink.count:
+        sink.abort()
+        return 0
+    sink.close()
+    print(f"Saved {sink.count} jobs to {filename}")
+    return sink.count
+
+
+def main():
+    keywords = ["AI/ML Engineer", "Data Scientist"]
+    locations = ["London", "Berlin", "Paris"]
+    asyncio.run(scrape_grid_to_file(keywords, locations, max_jobs=50))
+
+
+if __name__ == "__main__":
+    main()
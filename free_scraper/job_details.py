@@ -0,0 +1,248 @@
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import queue
+import threading
+
+import requests
+from bs4 import BeautifulSoup
+
+from jobs_scraper import JOB_FIELDS, JobData, LinkedInJobsScraper, ScraperConfig, is_throttled
+from job_index import JobIndex
+from output_sinks import FORMAT_CSV, detect_format, open_sink
+
+
+@dataclass
+class JobDetails:
+    job_id: str
+    description: str
+    seniority_level: str
+    employment_type: str
+    job_function: str
+    industries: str
+    applicants: str
+
+
+DETAIL_FIELDS = JOB_FIELDS + [field.name for field in fields(JobDetails)]
+
+
+# Criteria headers on the posting page -> JobDetails fields.
+CRITERIA_FIELDS = {
+    "Seniority level": "seniority_level",
+    "Employment type": "employment_type",
+    "Job function": "job_function",
+    "Industries": "industries",
+}
+
+
+def parse_job_details(job_id: str, html: str) -> JobDetails:
+    soup = BeautifulSoup(html, "html.parser")
+    fields = {field: "N/A" for field in CRITERIA_FIELDS.values()}
+    for item in soup.find_all("li", class_="description__job-criteria-item"):
+        name = item.find("h3", class_="description__job-criteria-subheader")
+        value = item.find("span", class_="description__job-criteria-text")
+        if name and value and name.text.strip() in CRITERIA_FIELDS:
+            fields[CRITERIA_FIELDS[name.text.strip()]] = value.text.strip()
+    description = soup.find("div", class_="show-more-less-html__markup")
+    applicants = soup.find(class_="num-applicants__caption")
+    return JobDetails(
+        job_id=job_id,
+        description=description.get_text("\n", strip=True) if description else "N/A",
+        applicants=applicants.text.strip() if applicants else "N/A",
+        **fields,
+    )
+
+
+class JobDetailsEnricher:
+    """
+    Fetch the public posting page of every scraped job on worker threads.
+
+    Jobs are handed over through a bounded queue while scraping is still
+    running; when the workers fall behind, submit() blocks and holds the
+    scraper back. Detail requests draw on the scraper's rate limiter, so
+    search pages and posting pages share one politeness budget.
+
+    Every finished job is passed to on_result(job, details) in completion
+    order, one call at a time, and then dropped, so memory is bounded by
+    the queue. details is None when the posting could not be fetched or
+    parsed. An exception raised by on_result is re-raised by close().
+    """
+
+    def __init__(
+        self,
+        scraper: LinkedInJobsScraper,
+        on_result: Callable[[JobData, Optional[JobDetails]], None],
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
+        self.scraper = scraper
+        self.on_result = on_result
+        self.workers = workers or ScraperConfig.DETAIL_WORKERS
+        self.queue = queue.Queue(maxsize=queue_size or ScraperConfig.DETAIL_QUEUE_SIZE)
+        self.session = scraper.new_session(pool_size=self.workers)
+        self.count = 0
+        self._error: Optional[BaseException] = None
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "JobDetailsEnricher":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def start(self) -> None:
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._work, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, job: JobData) -> None:
+        """
+        Queue a job for enrichment; blocks while the queue is full.
+        """
+        self.queue.put(job)
+
+    def submit_many(self, jobs: Iterable[JobData]) -> None:
+        for job in jobs:
+            self.submit(job)
+
+    def close(self) -> int:
+        """
+        Wait for the queue to drain; return how many jobs were handed to on_result.
+        """
+        for _ in self._threads:
+            self.queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        return self.count
+
+    def _work(self) -> None:
+        while True:
+            job = self.queue.get()
+            try:
+                if job is None:
+                    return
+                try:
+                    details = self.fetch_details(job)
+                except Exception as e:
+                    # An unexpected page must not kill the worker: with every
+                    # worker gone, submit() would block on the full queue forever.
+                    print(f"Failed to enrich {job.job_link}: {str(e)}")
+                    details = None
+                self._deliver(job, details)
+            finally:
+                self.queue.task_done()
+
+    def _deliver(self, job: JobData, details: Optional[JobDetails]) -> None:
+        with self._lock:
+            if self._error is not None:
+                return
+            try:
+                self.on_result(job, details)
+            except Exception as e:
+                self._error = e
+                return
+            self.count += 1
+
+    def fetch_details(self, job: JobData) -> Optional[JobDetails]:
+        job_id = JobIndex.key(job.job_link)
+        if job_id is None:
+            return None
+        url = ScraperConfig.JOB_POSTING_URL.format(job_id=job_id)
+        error = ""
+        for _ in range(ScraperConfig.MAX_PAGE_ATTEMPTS):
+            self.scraper.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, headers=ScraperConfig.HEADERS)
+            except requests.RequestException as e:
+                error = f"Request failed: {str(e)}"
+                continue
+            if is_throttled(response.status_code, response.url):
+                self.scraper.rate_limiter.throttled()
+                error = f"Rate limited: Status code {response.status_code}"
+                continue
+            if response.status_code != 200:
+                error = f"Status code {response.status_code}"
+                break
+            self.scraper.rate_limiter.success()
+            return parse_job_details(job_id, response.text)
+        print(f"Failed to fetch details for job {job_id}: {error}")
+        return None
+
+
+def enriched_record(job: JobData, details: Optional[JobDetails]) -> Dict[str, Any]:
+    return {**vars(job), **(vars(details) if details else {})}
+
+
+def scrape_with_details(
+    scraper: LinkedInJobsScraper,
+    keywords: str,
+    location: str,
+    on_result: Callable[[JobData, Optional[JobDetails]], None],
+    max_jobs: int = 100,
+    workers: Optional[int] = None,
+) -> int:
+    """
+    Scrape a search and enrich its jobs while later pages are still loading.
+
+    Each (job, details) pair goes to on_result as soon as it is fetched;
+    returns how many were delivered.
+    """
+    with JobDetailsEnricher(scraper, on_result, workers) as enricher:
+        enricher.submit_many(scraper.iter_jobs(keywords, location, max_jobs))
+    return enricher.count
+
+
+def save_with_details(
+    scraper: LinkedInJobsScraper,
+    keywords: str,
+    location: str,
+    filename: str = "linkedin_jobs_details.json",
+    max_jobs: int = 100,
+    workers: Optional[int] = None,
+    format: Optional[str] = None,
+) -> int:
+    """
+    Scrape a search and write every job with its details as it is fetched.
+
+    Records go through an output sink like save_results(): the format
+    follows the extension, rows are in completion order, and an
+    interrupted run keeps the jobs written so far.
+    """
+    kwargs = {"batch_size": ScraperConfig.JOBS_PER_PAGE}
+    if (format or detect_format(filename)) == FORMAT_CSV:
+        kwargs["fieldnames"] = DETAIL_FIELDS
+    sink = open_sink(filename, format, **kwargs)
+    try:
+        scrape_with_details(
+            scraper,
+            keywords,
+            location,
+            lambda job, details: sink.write(enriched_record(job, details)),
+            max_jobs,
+            workers,
+        )
+    except BaseException:
+        LinkedInJobsScraper._save_partial(sink)
+        raise
+    if not sink.count:
+        sink.abort()
+        return 0
+    sink.close()
+    print(f"Saved {sink.count} jobs to {filename}")
+    return sink.count
+
+
+def main():
+    params = {"keywords": "AI/ML Engineer", "location": "London", "max_jobs": 50}
+
+    save_with_details(LinkedInJobsScraper(), **params)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional, Union
+import heapq
+import sqlite3
+import threading
+import time
+
+import api_codes_path  # noqa: F401
+from linkedin_urls import job_id
+
+
+class JobIndex:
+    """
+    Compact set of job ids, to skip jobs that were already returned.
+
+    Jobs are keyed by the numeric id in their /jobs/view/ link, so the same
+    posting found by different searches (or with different tracking
+    parameters) counts once. Ids are held as 64-bit integers in a sorted
+    array (8 bytes each) plus a small set of recent ids that is merged into
+    it every `merge_every` additions. Safe to share between threads.
+
+    add() only claims an id in memory. With a `path` the index is also kept
+    in SQLite and reloaded on the next run, but only ids passed to commit()
+    are stored there; the scrapers commit once the jobs are saved, so an
+    interrupted save never hides its jobs from later runs.
+    """
+
+    def __init__(self, path: Optional[str] = None, merge_every: int = 4096):
+        self.path = path
+        self.merge_every = merge_every
+        self.duplicates = 0
+        self._sorted = array("q")
+        self._recent = set()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path is not None:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_jobs (job_id TEXT PRIMARY KEY, first_seen REAL NOT NULL)"
+            )
+            self._conn.commit()
+            self._sorted = array(
+                "q", sorted(int(row[0]) for row in self._conn.execute("SELECT job_id FROM seen_jobs"))
+            )
+
+    def __enter__(self) -> "JobIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._recent)
+
+    def __contains__(self, key: Union[str, int]) -> bool:
+        return self._has(int(key))
+
+    @staticmethod
+    def key(job_link: Optional[str]) -> Optional[str]:
+        """
+        Numeric job id of a job link, or None if it has none.
+        """
+        return job_id(job_link) if job_link else None
+
+    def seen(self, key: Optional[str]) -> bool:
+        return key is not None and self._has(int(key))
+
+    def add(self, key: Optional[str]) -> bool:
+        """
+        Claim a job id in memory; False if it already was seen.
+
+        Jobs without an id cannot be deduplicated and always count as new.
+        """
+        if key is None:
+            return True
+        value = int(key)
+        with self._lock:
+            if self._has(value):
+                self.duplicates += 1
+                return False
+            self._insert(value)
+        return True
+
+    def commit(self, keys: Iterable[Union[str, int, None]]) -> None:
+        """
+        Mark job ids as saved: they are added to the index and, with a
+        path, stored so later runs skip them too.
+        """
+        values = [int(key) for key in keys if key is not None]
+        with self._lock:
+            for value in values:
+                if not self._has(value):
+                    self._insert(value)
+            if self._conn is not None and values:
+                now = time.time()
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO seen_jobs (job_id, first_seen) VALUES (?, ?)",
+                        ((str(value), now) for value in values),
+                    )
+
+    def _has(self, value: int) -> bool:
+        if value in self._recent:
+            return True
+        ids = self._sorted
+        position = bisect_left(ids, value)
+        return position < len(ids) and ids[position] == value
+
+    def _insert(self, value: int) -> None:
+        self._recent.add(value)
+        if len(self._recent) >= self.merge_every:
+            # Swap in the merged array before clearing, so readers never miss an id.
+            self._sorted = array("q", heapq.merge(self._sorted, sorted(self._recent)))
+            self._recent.clear()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,220 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import time
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+class JobCardParser:
+    """
+    Backend that turns a guest search page into job cards and card fields.
+
+    parse() builds a document, cards() lists its job cards and fields()
+    extracts the raw card values, raising if a required one is missing.
+    """
+
+    name = ""
+
+    def parse(self, html: str) -> Any:
+        raise NotImplementedError
+
+    def cards(self, document: Any) -> List[Any]:
+        raise NotImplementedError
+
+    def fields(self, card: Any) -> Dict[str, Optional[str]]:
+        raise NotImplementedError
+
+    def href(self, card: Any) -> Optional[str]:
+        """
+        Just the job link, cheaper than fields(); None if the card has none.
+        """
+        raise NotImplementedError
+
+    def parse_cards(self, html: str) -> List[Any]:
+        return self.cards(self.parse(html))
+
+
+class BeautifulSoupParser(JobCardParser):
+    name = "bs4"
+
+    def parse(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, "html.parser")
+
+    def cards(self, document: BeautifulSoup) -> List[Any]:
+        return document.find_all("div", class_="base-card")
+
+    def href(self, card: Any) -> Optional[str]:
+        link = card.find("a", class_="base-card__full-link")
+        return link.get("href") if link else None
+
+    def fields(self, card: Any) -> Dict[str, Optional[str]]:
+        posted_date = card.find("time", class_="job-search-card__listdate")
+        return {
+            "title": card.find("h3", class_="base-search-card__title").text.strip(),
+            "company": card.find("h4", class_="base-search-card__subtitle").text.strip(),
+            "location": card.find("span", class_="job-search-card__location").text.strip(),
+            "href": card.find("a", class_="base-card__full-link")["href"],
+            "posted_date": posted_date.text.strip() if posted_date else None,
+        }
+
+
+class SelectolaxParser(JobCardParser):
+    name = "selectolax"
+
+    CARD = "div.base-card"
+    TITLE = "h3.base-search-card__title"
+    COMPANY = "h4.base-search-card__subtitle"
+    LOCATION = "span.job-search-card__location"
+    LINK = "a.base-card__full-link"
+    POSTED = "time.job-search-card__listdate"
+
+    def parse(self, html: str) -> Any:
+        return LexborHTMLParser(html)
+
+    def cards(self, document: Any) -> List[Any]:
+        return document.css(self.CARD)
+
+    def _text(self, card: Any, selector: str) -> str:
+        return card.css_first(selector).text(deep=True).strip()
+
+    def href(self, card: Any) -> Optional[str]:
+        link = card.css_first(self.LINK)
+        return link.attributes.get("href") if link else None
+
+    def fields(self, card: Any) -> Dict[str, Optional[str]]:
+        posted_date = card.css_first(self.POSTED)
+        href = card.css_first(self.LINK).attributes["href"]
+        if href is None:
+            raise KeyError("href")
+        return {
+            "title": self._text(card, self.TITLE),
+            "company": self._text(card, self.COMPANY),
+            "location": self._text(card, self.LOCATION),
+            "href": href,
+            "posted_date": posted_date.text(deep=True).strip() if posted_date else None,
+        }
+
+
+def _has_class(tag: str, css_class: str) -> str:
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+
+
+class LxmlParser(JobCardParser):
+    """
+    lxml with every selector compiled to an XPath object once, at import.
+    """
+
+    name = "lxml"
+
+    if etree is not None:
+        CARD = etree.XPath("//" + _has_class("div", "base-card"))
+        TITLE = etree.XPath(".//" + _has_class("h3", "base-search-card__title"))
+        COMPANY = etree.XPath(".//" + _has_class("h4", "base-search-card__subtitle"))
+        LOCATION = etree.XPath(".//" + _has_class("span", "job-search-card__location"))
+        LINK = etree.XPath(".//" + _has_class("a", "base-card__full-link"))
+        POSTED = etree.XPath(".//" + _has_class("time", "job-search-card__listdate"))
+
+    def parse(self, html: str) -> Any:
+        return etree.HTML(html) if html.strip() else None
+
+    def cards(self, document: Any) -> List[Any]:
+        return self.CARD(document) if document is not None else []
+
+    def _text(self, card: Any, selector: Any) -> str:
+        return "".join(selector(card)[0].itertext()).strip()
+
+    def href(self, card: Any) -> Optional[str]:
+        link = self.LINK(card)
+        return link[0].get("href") if link else None
+
+    def fields(self, card: Any) -> Dict[str, Optional[str]]:
+        posted_date = self.POSTED(card)
+        href = self.LINK(card)[0].get("href")
+        if href is None:
+            raise KeyError("href")
+        return {
+            "title": self._text(card, self.TITLE),
+            "company": self._text(card, self.COMPANY),
+            "location": self._text(card, self.LOCATION),
+            "href": href,
+            "posted_date": "".join(posted_date[0].itertext()).strip() if posted_date else None,
+        }
+
+
+PARSERS = {
+    "selectolax": (SelectolaxParser, lambda: LexborHTMLParser is not None),
+    "lxml": (LxmlParser, lambda: etree is not None),
+    "bs4": (BeautifulSoupParser, lambda: True),
+}
+
+
+def available_parsers() -> List[str]:
+    return [name for name, (_, available) in PARSERS.items() if available()]
+
+
+def get_parser(name: str = "auto") -> JobCardParser:
+    """
+    Parser backend by name; "auto" picks the fastest one installed.
+    """
+    if name == "auto":
+        name = available_parsers()[0]
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser {name}, expected one of {', '.join(PARSERS)}")
+    parser_class, available = PARSERS[name]
+    if not available():
+        raise ImportError(f"Parser {name} is not installed")
+    return parser_class()
+
+
+def extract_all(parser: JobCardParser, html: str) -> List[Optional[Dict[str, Optional[str]]]]:
+    """
+    Fields of every card on a page, None for cards that fail to parse.
+    """
+    results = []
+    for card in parser.parse_cards(html):
+        try:
+            results.append(parser.fields(card))
+        except Exception:
+            results.append(None)
+    return results
+
+
+def _time_parser(parser: JobCardParser, pages: List[str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for html in pages:
+            extract_all(parser, html)
+    return (time.perf_counter() - started) / rounds
+
+
+def main():
+    """
+    Check every installed backend against bs4 on the fixture corpus and time them.
+    """
+    corpus = {path.name: path.read_text(encoding="utf-8") for path in sorted(FIXTURES_DIR.glob("*.html"))}
+    reference = get_parser("bs4")
+    expected = {name: extract_all(reference, html) for name, html in corpus.items()}
+    baseline = _time_parser(reference, list(corpus.values()), rounds=20)
+
+    for name in available_parsers():
+        parser = get_parser(name)
+        mismatches = [f for f, html in corpus.items() if extract_all(parser, html) != expected[f]]
+        elapsed = _time_parser(parser, list(corpus.values()), rounds=20)
+        status = "identical" if not mismatches else f"MISMATCH in {', '.join(mismatches)}"
+        print(f"{name:<12} {elapsed * 1000:8.2f} ms/corpus  {baseline / elapsed:5.1f}x  {status}")
+
+
+if __name__ == "__main__":
+    main()
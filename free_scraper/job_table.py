@@ -0,0 +1,210 @@
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import gc
+import gzip
+import json
+import re
+import tracemalloc
+
+import api_codes_path  # noqa: F401
+from jobs_scraper import JOB_FIELDS, JobData, canonicalize_url, job_from_card
+from job_parsers import get_parser
+from output_sinks import FORMAT_NDJSON, open_sink
+
+# Repeating columns, stored as codes into a list of distinct values.
+ENCODED_FIELDS = ("title", "company", "location", "posted_date")
+# Canonical job links are this prefix, an optional slug and the job id.
+JOB_LINK_PREFIX = "https://www.linkedin.com/jobs/view/"
+JOB_LINK_TAIL = re.compile(r"(?:(.+)-)?([1-9][0-9]{0,17})")
+
+
+class JobTable:
+    """
+    Column store for large job sets.
+
+    title, company, location and posted_date are dictionary-encoded as
+    arrays of uint32 codes into their distinct values. job_link is split
+    into its numeric job id (an int64 array) and its slug (encoded like the
+    other columns, as it repeats with the title); links of any other shape
+    are kept verbatim. Rows come back as JobData on access, so a table can
+    stand in for a list of jobs (including in save_results()).
+    """
+
+    def __init__(self, jobs: Iterable[JobData] = ()):
+        columns = ENCODED_FIELDS + ("job_slug",)
+        self._codes: Dict[str, array] = {name: array("I") for name in columns}
+        self._values: Dict[str, List[str]] = {name: [] for name in columns}
+        self._lookup: Dict[str, Dict[str, int]] = {name: {} for name in columns}
+        self._job_ids = array("q")
+        # Row -> job_link for links that do not split into slug and id.
+        self._other_links: Dict[int, str] = {}
+        self.extend(jobs)
+
+    def __len__(self) -> int:
+        return len(self._job_ids)
+
+    def __getitem__(self, index: int) -> JobData:
+        return JobData(**{name: self._get(name, index) for name in JOB_FIELDS})
+
+    def __iter__(self) -> Iterator[JobData]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def _get(self, name: str, index: int) -> str:
+        if name == "job_link":
+            return self._job_link(index)
+        return self._values[name][self._codes[name][index]]
+
+    def _job_link(self, index: int) -> Optional[str]:
+        if index < 0:
+            index += len(self)
+        if index in self._other_links:
+            return self._other_links[index]
+        slug = self._values["job_slug"][self._codes["job_slug"][index]]
+        return f"{JOB_LINK_PREFIX}{slug + '-' if slug else ''}{self._job_ids[index]}"
+
+    def _encode(self, name: str, value: str) -> int:
+        lookup = self._lookup[name]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(self._values[name])
+            self._values[name].append(value)
+        return code
+
+    def append(self, job: JobData) -> None:
+        for name in ENCODED_FIELDS:
+            self._codes[name].append(self._encode(name, getattr(job, name)))
+        link = job.job_link
+        match = None
+        if isinstance(link, str) and link.startswith(JOB_LINK_PREFIX):
+            match = JOB_LINK_TAIL.fullmatch(link, len(JOB_LINK_PREFIX))
+        if match is None:
+            self._other_links[len(self)] = link
+            slug, job_id = "", 0
+        else:
+            slug, job_id = match.group(1) or "", int(match.group(2))
+        self._codes["job_slug"].append(self._encode("job_slug", slug))
+        self._job_ids.append(job_id)
+
+    def extend(self, jobs: Iterable[JobData]) -> None:
+        for job in jobs:
+            self.append(job)
+
+    def column(self, name: str) -> List[str]:
+        if name == "job_link":
+            return [self._job_link(index) for index in range(len(self))]
+        values = self._values[name]
+        return [values[code] for code in self._codes[name]]
+
+    def to_columns(self) -> Dict[str, List[str]]:
+        return {name: self.column(name) for name in JOB_FIELDS}
+
+    def save_columnar(self, filename: str = "linkedin_jobs_columns.ndjson") -> None:
+        """
+        Write the table column by column, keeping its encoding.
+
+        The file is NDJSON (gzipped for .gz): a header line with the row
+        count, dictionaries and verbatim links, then one line per column.
+        Like every sink it is written to `<filename>.part` first.
+        """
+        with open_sink(filename, FORMAT_NDJSON) as sink:
+            sink.write(
+                {
+                    "rows": len(self),
+                    "dictionaries": self._values,
+                    "other_links": {str(row): link for row, link in self._other_links.items()},
+                }
+            )
+            sink.write({"column": "job_id", "values": self._job_ids.tolist()})
+            for name, codes in self._codes.items():
+                sink.write({"column": name, "values": codes.tolist()})
+        print(f"Saved {len(self)} jobs to {filename}")
+
+    @classmethod
+    def load_columnar(cls, filename: str) -> "JobTable":
+        opener = gzip.open if filename.endswith(".gz") else open
+        with opener(filename, "rt", encoding="utf-8") as f:
+            header, *columns = (json.loads(line) for line in f)
+        table = cls()
+        for name, values in header["dictionaries"].items():
+            table._values[name] = values
+            table._lookup[name] = {value: code for code, value in enumerate(values)}
+        table._other_links = {int(row): link for row, link in header["other_links"].items()}
+        for column in columns:
+            if column["column"] == "job_id":
+                table._job_ids = array("q", column["values"])
+            else:
+                table._codes[column["column"]] = array("I", column["values"])
+        return table
+
+
+@dataclass
+class _DictJobData:
+    """
+    The previous JobData layout (per-instance __dict__, no interning), for comparison.
+    """
+
+    title: str
+    company: str
+    location: str
+    job_link: str
+    posted_date: str
+
+
+def _parse_jobs(job_class: Any, pages: List[str]) -> Iterator[Any]:
+    parser = get_parser()
+    for html in pages:
+        for card in parser.parse_cards(html):
+            if job_class is JobData:
+                job = job_from_card(parser, card)
+                if job is not None:
+                    yield job
+                continue
+            fields = parser.fields(card)
+            yield job_class(
+                title=fields["title"],
+                company=fields["company"],
+                location=fields["location"],
+                job_link=canonicalize_url(fields["href"]),
+                posted_date=fields["posted_date"] or "N/A",
+            )
+
+
+def _retained_bytes(build) -> int:
+    # The URL cache would otherwise share job_link strings between layouts.
+    canonicalize_url.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    canonicalize_url.cache_clear()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def measure_memory(count: int = 20000) -> Dict[str, float]:
+    """
+    Bytes retained per job for each layout, parsing `count` generated job cards.
+    """
+    from standin_server import StandInAPI
+
+    api = StandInAPI(jobs_total=count)
+    pages = [api.job_cards(start) for start in range(0, count, 25)]
+    layouts = {
+        "dict dataclass (before)": lambda: list(_parse_jobs(_DictJobData, pages)),
+        "slots + interning": lambda: list(_parse_jobs(JobData, pages)),
+        "JobTable": lambda: JobTable(_parse_jobs(JobData, pages)),
+    }
+    return {name: _retained_bytes(build) / count for name, build in layouts.items()}
+
+
+def main():
+    for name, per_job in measure_memory().items():
+        print(f"{name:<26} {per_job:8.1f} bytes/job")
+
+
+if __name__ == "__main__":
+    main()
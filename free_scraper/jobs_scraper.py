@@ -1,149 +1,444 @@
-from dataclasses import dataclass
-from typing import List, Optional
-import requests
-from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+import sys
+import threading
 import time
-import random
-import json
+import requests
 from urllib.parse import quote
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
+# URL helpers and output sinks are shared with the API collectors.
+import api_codes_path  # noqa: F401
+from linkedin_urls import canonicalize_url
+from output_sinks import FORMAT_CSV, OutputSink, detect_format, open_sink
+from job_parsers import JobCardParser, get_parser
+from job_index import JobIndex
+from token_bucket import TokenBucket
+import token_bucket
+
 
 @dataclass
 class JobData:
+    # Slots instead of a per-instance __dict__: large scrapes hold many jobs.
+    __slots__ = ("title", "company", "location", "job_link", "posted_date")
+
     title: str
     company: str
     location: str
     job_link: str
     posted_date: str
 
+    def __post_init__(self):
+        # Companies, locations and dates repeat across jobs; keep one copy of each.
+        for name in ("company", "location", "posted_date"):
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
+    @property
+    def __dict__(self) -> dict:
+        """
+        Field values by name, so vars(job) keeps working. A copy, not a live view.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+JOB_FIELDS = [field.name for field in fields(JobData)]
+
 
 class ScraperConfig:
     BASE_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    JOB_POSTING_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
     JOBS_PER_PAGE = 25
-    MIN_DELAY = 2
-    MAX_DELAY = 5
-    RATE_LIMIT_DELAY = 30
-    RATE_LIMIT_THRESHOLD = 10
-
-    HEADERS = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "DNT": "1",
-        "Cache-Control": "no-cache",
+    # Shared politeness budget across all page workers (0 = unlimited).
+    REQUESTS_PER_SECOND = 0.3
+    BURST = token_bucket.BURST
+    MAX_WORKERS = 4
+    # HTML parser backend: "auto" (fastest installed), "selectolax", "lxml" or "bs4".
+    PARSER = "auto"
+    # AIMD bounds, see token_bucket.py.
+    MIN_REQUESTS_PER_SECOND = token_bucket.MIN_REQUESTS_PER_SECOND
+    MAX_REQUESTS_PER_SECOND = token_bucket.MAX_REQUESTS_PER_SECOND
+    RATE_INCREASE = token_bucket.RATE_INCREASE
+    RATE_DECREASE = token_bucket.RATE_DECREASE
+    RATE_LIMIT_DELAY = token_bucket.RATE_LIMIT_DELAY
+    RATE_LIMIT_THRESHOLD = token_bucket.RATE_LIMIT_THRESHOLD
+    # 999 is LinkedIn's own "request denied" status.
+    THROTTLE_STATUSES = {429, 999}
+    # Page retries for throttling, 5xx and network errors; the backoff
+    # (seconds, doubled per attempt) applies to the latter two only.
+    MAX_PAGE_ATTEMPTS = 5
+    PAGE_BACKOFF = 0.5
+    # Job detail enrichment: fetch threads and how many job ids may wait.
+    DETAIL_WORKERS = 4
+    DETAIL_QUEUE_SIZE = 100
+
+    HEADERS = token_bucket.HEADERS
+
+    @classmethod
+    def rate_limits(cls) -> dict:
+        """
+        TokenBucket keyword arguments for the AIMD bounds above.
+        """
+        return {
+            "min_rate": cls.MIN_REQUESTS_PER_SECOND,
+            "max_rate": cls.MAX_REQUESTS_PER_SECOND,
+            "increase": cls.RATE_INCREASE,
+            "decrease": cls.RATE_DECREASE,
+            "threshold": cls.RATE_LIMIT_THRESHOLD,
+            "cooldown": cls.RATE_LIMIT_DELAY,
+        }
+
+
+def build_search_url(keywords: str, location: str, start: int = 0) -> str:
+    params = {
+        "keywords": keywords,
+        "location": location,
+        "start": start,
     }
+    return f"{ScraperConfig.BASE_URL}?{'&'.join(f'{k}={quote(str(v))}' for k, v in params.items())}"
+
+
+def is_throttled(status: int, url: str) -> bool:
+    """
+    Whether a response means LinkedIn is pushing back: 429, 999 or a
+    redirect to the auth wall.
+    """
+    return status in ScraperConfig.THROTTLE_STATUSES or "/authwall" in url
+
+
+class RateLimited(RuntimeError):
+    pass
+
+
+class PageFailed(RuntimeError):
+    """
+    A page answered with a status retrying will not fix (4xx other than
+    the throttle statuses).
+    """
+
+
+def check_page_status(rate_limiter: TokenBucket, status: int, url: str) -> None:
+    """
+    Report a results page response to the rate limiter; raise unless it is a 200.
+
+    Throttled responses raise RateLimited and 5xx RuntimeError, both worth
+    retrying; any other status raises PageFailed.
+    """
+    if is_throttled(status, url):
+        rate_limiter.throttled()
+        raise RateLimited(
+            f"Rate limited: Status code {status}, "
+            f"slowing down to {rate_limiter.rate:.2f} req/s"
+        )
+    if status != 200:
+        error = RuntimeError if status >= 500 else PageFailed
+        raise error(f"Failed to fetch data: Status code {status}")
+    rate_limiter.success()
+
+
+def page_retry_delay(attempt: int, error: RuntimeError, start: int) -> float:
+    """
+    Seconds to wait before retrying a failed page fetch, for both scrapers.
+
+    Re-raises `error` when it cannot be retried or this was attempt
+    MAX_PAGE_ATTEMPTS. Throttled pages are retried at once, since the rate
+    limiter already slowed down; other errors back off exponentially.
+    """
+    if isinstance(error, PageFailed) or attempt >= ScraperConfig.MAX_PAGE_ATTEMPTS:
+        raise error
+    print(f"Retrying page start={start} ({attempt}): {str(error)}")
+    if isinstance(error, RateLimited):
+        return 0.0
+    return ScraperConfig.PAGE_BACKOFF * 2 ** (attempt - 1)
+
+
+def job_from_card(parser: JobCardParser, job_card: Any) -> Optional[JobData]:
+    try:
+        fields = parser.fields(job_card)
+        return JobData(
+            title=fields["title"],
+            company=fields["company"],
+            location=fields["location"],
+            job_link=canonicalize_url(fields["href"]),
+            posted_date=fields["posted_date"] or "N/A",
+        )
+    except Exception as e:
+        print(f"Failed to extract job data: {str(e)}")
+        return None
+
+
+def unseen_cards(parser: JobCardParser, index: JobIndex, job_cards: List[Any]) -> List[Any]:
+    """
+    Cards whose job id is not in the index yet.
+
+    Only the link is read here, so known jobs never get fully parsed. Jobs
+    are claimed in the index once they are actually returned.
+    """
+    return [card for card in job_cards if not index.seen(index.key(parser.href(card)))]
 
 
 class LinkedInJobsScraper:
-    def __init__(self):
-        self.session = self._setup_session()
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        parser: Optional[str] = None,
+        job_index: Optional[JobIndex] = None,
+    ):
+        self.parser: JobCardParser = get_parser(parser or ScraperConfig.PARSER)
+        # Opt-in: with an index, later searches skip jobs returned or saved
+        # before. Without one every call dedupes only its own results.
+        self.job_index = job_index
+        self.max_workers = max_workers or ScraperConfig.MAX_WORKERS
+        if requests_per_second is None:
+            requests_per_second = ScraperConfig.REQUESTS_PER_SECOND
+        self.rate_limiter = TokenBucket(
+            requests_per_second, ScraperConfig.BURST, **ScraperConfig.rate_limits()
+        )
+        # Result pages retry statuses through page_retry_delay() instead.
+        self.session = self.new_session(retry_statuses=False)
 
-    def _setup_session(self) -> requests.Session:
+    def new_session(
+        self, pool_size: Optional[int] = None, retry_statuses: bool = True
+    ) -> requests.Session:
+        """
+        A requests session with a pool of pool_size connections (max_workers
+        by default), e.g. for extra worker threads. Connection errors are
+        retried, and 5xx too unless retry_statuses is False.
+        """
         session = requests.Session()
+        # 429 is left to the rate limiter so it can slow down.
         retries = Retry(
-            total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504] if retry_statuses else [],
         )
-        session.mount("https://", HTTPAdapter(max_retries=retries))
+        adapter = HTTPAdapter(
+            max_retries=retries, pool_maxsize=pool_size or self.max_workers
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         return session
 
     def _build_search_url(self, keywords: str, location: str, start: int = 0) -> str:
-        params = {
-            "keywords": keywords,
-            "location": location,
-            "start": start,
-        }
-        return f"{ScraperConfig.BASE_URL}?{'&'.join(f'{k}={quote(str(v))}' for k, v in params.items())}"
+        return build_search_url(keywords, location, start)
 
     def _clean_job_url(self, url: str) -> str:
-        return url.split("?")[0] if "?" in url else url
+        return canonicalize_url(url)
 
-    def _extract_job_data(self, job_card: BeautifulSoup) -> Optional[JobData]:
-        try:
-            title = job_card.find("h3", class_="base-search-card__title").text.strip()
-            company = job_card.find(
-                "h4", class_="base-search-card__subtitle"
-            ).text.strip()
-            location = job_card.find(
-                "span", class_="job-search-card__location"
-            ).text.strip()
-            job_link = self._clean_job_url(
-                job_card.find("a", class_="base-card__full-link")["href"]
-            )
-            posted_date = job_card.find("time", class_="job-search-card__listdate")
-            posted_date = posted_date.text.strip() if posted_date else "N/A"
-
-            return JobData(
-                title=title,
-                company=company,
-                location=location,
-                job_link=job_link,
-                posted_date=posted_date,
-            )
-        except Exception as e:
-            print(f"Failed to extract job data: {str(e)}")
-            return None
+    def _extract_job_data(self, job_card: Any) -> Optional[JobData]:
+        return job_from_card(self.parser, job_card)
 
-    def _fetch_job_page(self, url: str) -> BeautifulSoup:
+    @property
+    def current_rate(self) -> float:
+        """
+        Live request rate (req/s) chosen by the rate limiter; 0 = unlimited.
+        """
+        return self.rate_limiter.rate
+
+    def _fetch_job_page(self, url: str) -> Any:
         try:
             response = self.session.get(url, headers=ScraperConfig.HEADERS)
-            if response.status_code != 200:
-                raise RuntimeError(
-                    f"Failed to fetch data: Status code {response.status_code}"
-                )
-            return BeautifulSoup(response.text, "html.parser")
         except requests.RequestException as e:
             raise RuntimeError(f"Request failed: {str(e)}")
+        check_page_status(self.rate_limiter, response.status_code, response.url)
+        return self.parser.parse(response.text)
 
-    def scrape_jobs(
-        self, keywords: str, location: str, max_jobs: int = 100
-    ) -> List[JobData]:
-        all_jobs = []
+    def _scrape_page(
+        self,
+        keywords: str,
+        location: str,
+        start: int,
+        stop: threading.Event,
+        index: JobIndex,
+    ) -> Optional[List[JobData]]:
+        """
+        Fetch and parse one results page.
+
+        Returns None when the page has no job cards, or when every card is
+        a job seen before (the rest of the results are likely known too).
+        """
+        url = self._build_search_url(keywords, location, start)
+        for attempt in range(1, ScraperConfig.MAX_PAGE_ATTEMPTS + 1):
+            self.rate_limiter.acquire()
+            if stop.is_set():
+                return None
+            try:
+                document = self._fetch_job_page(url)
+                break
+            except RuntimeError as e:
+                time.sleep(page_retry_delay(attempt, e, start))
+        job_cards = self.parser.cards(document)
+        if not job_cards:
+            return None
+        new_cards = unseen_cards(self.parser, index, job_cards)
+        if not new_cards:
+            return None
+        return [job for job in map(self._extract_job_data, new_cards) if job]
+
+    def _iter_pages(
+        self, keywords: str, location: str, max_jobs: int
+    ) -> Iterator[List[JobData]]:
+        """
+        Fetch result pages concurrently and yield each page's new jobs in page order.
+
+        Up to max_workers pages are in flight, all drawing on one adaptive
+        token bucket. A throttled, 5xx or failed request is retried up to
+        MAX_PAGE_ATTEMPTS times; other statuses fail the page at once.
+        Pages are consumed in `start=` order; the first empty, failed or
+        already seen page stops the scrape and later pages are discarded.
+        Jobs already in the job index (or returned earlier in this call) are
+        skipped. Closing the generator early stops the workers.
+        """
+        index = self.job_index if self.job_index is not None else JobIndex()
+        collected = 0
+        stop = threading.Event()
+        in_flight = deque()
         start = 0
 
-        while len(all_jobs) < max_jobs:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             try:
-                url = self._build_search_url(keywords, location, start)
-                soup = self._fetch_job_page(url)
-                job_cards = soup.find_all("div", class_="base-card")
-
-                if not job_cards:
-                    break
-                for card in job_cards:
-                    job_data = self._extract_job_data(card)
-                    if job_data:
-                        all_jobs.append(job_data)
-                        if len(all_jobs) >= max_jobs:
+                while True:
+                    # Only request pages that could still be needed.
+                    while (
+                        len(in_flight) < self.max_workers
+                        and collected + len(in_flight) * ScraperConfig.JOBS_PER_PAGE
+                        < max_jobs
+                    ):
+                        in_flight.append(
+                            executor.submit(
+                                self._scrape_page, keywords, location, start, stop, index
+                            )
+                        )
+                        start += ScraperConfig.JOBS_PER_PAGE
+                    if not in_flight:
+                        break
+                    try:
+                        jobs = in_flight.popleft().result()
+                    except Exception as e:
+                        print(f"Scraping error: {str(e)}")
+                        jobs = None
+                    if jobs is None:
+                        break
+                    page_jobs = []
+                    for job in jobs:
+                        if collected + len(page_jobs) >= max_jobs:
                             break
-                print(f"Scraped {len(all_jobs)} jobs...")
-                start += ScraperConfig.JOBS_PER_PAGE
-                time.sleep(
-                    random.uniform(ScraperConfig.MIN_DELAY, ScraperConfig.MAX_DELAY)
-                )
-            except Exception as e:
-                print(f"Scraping error: {str(e)}")
-                break
-        return all_jobs[:max_jobs]
+                        # Pages run concurrently, so a job may still repeat here.
+                        if index.add(JobIndex.key(job.job_link)):
+                            page_jobs.append(job)
+                    collected += len(page_jobs)
+                    print(f"Scraped {collected} jobs... ({self.current_rate:.2f} req/s)")
+                    if page_jobs:
+                        yield page_jobs
+                    if collected >= max_jobs:
+                        break
+            finally:
+                stop.set()
+                for future in in_flight:
+                    future.cancel()
+
+    def iter_jobs(
+        self, keywords: str, location: str, max_jobs: int = 100
+    ) -> Iterator[JobData]:
+        """
+        Yield jobs one by one as their page is parsed, in page order.
+        """
+        for page_jobs in self._iter_pages(keywords, location, max_jobs):
+            yield from page_jobs
+
+    def scrape_jobs(
+        self,
+        keywords: str,
+        location: str,
+        max_jobs: int = 100,
+        on_jobs: Optional[Callable[[List[JobData]], None]] = None,
+    ) -> List[JobData]:
+        """
+        Collect iter_jobs() into a list. `on_jobs` is called with the new
+        jobs of every page as soon as it is consumed.
+        """
+        all_jobs: List[JobData] = []
+        for page_jobs in self._iter_pages(keywords, location, max_jobs):
+            all_jobs.extend(page_jobs)
+            if on_jobs is not None:
+                on_jobs(page_jobs)
+        return all_jobs
 
     def save_results(
-        self, jobs: List[JobData], filename: str = "linkedin_jobs.json"
-    ) -> None:
-        if not jobs:
+        self,
+        jobs: Iterable[JobData],
+        filename: str = "linkedin_jobs.json",
+        format: Optional[str] = None,
+    ) -> int:
+        """
+        Write jobs as they arrive; works with a list or with iter_jobs().
+
+        The format follows the extension (.json, .ndjson/.jsonl, .csv,
+        optionally .gz) unless given. Every page worth of jobs is flushed to
+        `<filename>.part`, which replaces `filename` once all jobs are
+        written. If the scrape is interrupted (Ctrl-C or an error), the jobs
+        written so far are still saved before the exception propagates.
+        Nothing is written when there are no jobs. With a job index, the
+        saved jobs are committed to it once the file is in place.
+        """
+        kwargs = {"batch_size": ScraperConfig.JOBS_PER_PAGE}
+        if (format or detect_format(filename)) == FORMAT_CSV:
+            kwargs["fieldnames"] = JOB_FIELDS
+        sink = open_sink(filename, format, **kwargs)
+        saved = []
+        if self.job_index is not None:
+            sink.on_close(lambda: self.job_index.commit(saved))
+        try:
+            for job in jobs:
+                sink.write(vars(job))
+                saved.append(JobIndex.key(job.job_link))
+        except BaseException:
+            self._save_partial(sink)
+            raise
+        if not sink.count:
+            sink.abort()
+            return 0
+        sink.close()
+        print(f"Saved {sink.count} jobs to {filename}")
+        return sink.count
+
+    def mark_saved(self, jobs: Iterable[JobData]) -> None:
+        """
+        Commit jobs saved by the caller to the job index, so later searches
+        (and later runs, for a persistent index) skip them.
+        """
+        if self.job_index is not None:
+            self.job_index.commit(JobIndex.key(job.job_link) for job in jobs)
+
+    @staticmethod
+    def _save_partial(sink: OutputSink) -> None:
+        """
+        Finalize an interrupted sink so the jobs already written are kept.
+
+        Every format is valid after close() (the JSON array gets its closing
+        bracket). If closing fails too, `<filename>.part` is left in place.
+        """
+        if not sink.count:
+            sink.abort()
+            return
+        try:
+            sink.close()
+        except OSError as e:
+            print(f"Interrupted; could not finalize {sink.filename} ({str(e)}), jobs so far are in {sink.tmp_filename}")
             return
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump([vars(job) for job in jobs], f, indent=2, ensure_ascii=False)
-        print(f"Saved {len(jobs)} jobs to {filename}")
+        print(f"Interrupted; saved the {sink.count} jobs scraped so far to {sink.filename}")
 
 
 def main():
     params = {"keywords": "AI/ML Engineer", "location": "London", "max_jobs": 100}
 
     scraper = LinkedInJobsScraper()
-    jobs = scraper.scrape_jobs(**params)
-    scraper.save_results(jobs)
+    scraper.save_results(scraper.iter_jobs(**params))
 
 
 if __name__ == "__main__":
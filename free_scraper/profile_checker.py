@@ -1,120 +1,364 @@
-# import requests
-# from datetime import datetime
-# from tenacity import retry, stop_after_attempt, wait_random, before_sleep_log
-# from typing import Optional, NamedTuple
-# import logging
-# import random
-# import time
-
-# class URLCheckResult(NamedTuple):
-#     status_code: int
-#     error: Optional[str]
-#     is_auth_wall: bool
-#     timestamp: str
-
-# class LinkedInUrlChecker:
-#     AUTH_WALL_PATTERNS = {
-#         "authwall?trk=",
-#         'window.location.href = "https://" + domain + "/authwall?"',
-#         "sessionRedirect",
-#     }
-
-#     RETRY_STATUS_CODES = {999, 429, 403}
-
-#     def __init__(self, max_retries: int = 3, timeout: int = 10):
-#         """
-#         Initialize the LinkedInUrlChecker with optional max_retries and timeout.
-#         """
-#         self.timeout = timeout
-#         self.logger = logging.getLogger(__name__)
-#         self.logger.setLevel(logging.WARNING)
-#         if not self.logger.handlers:
-#             handler = logging.StreamHandler()
-#             handler.setFormatter(logging.Formatter("%(message)s"))
-#             self.logger.addHandler(handler)
-        
-#         self.session = requests.Session()
-
-#     def __enter__(self):
-#         return self
-
-#     def __exit__(self, exc_type, exc_val, exc_tb):
-#         self.session.close()
-
-#     def _is_auth_wall(self, html: str) -> bool:
-#         """
-#         Check if the HTML content contains any authentication wall patterns.
-#         """
-#         return any(pattern in html for pattern in self.AUTH_WALL_PATTERNS)
-
-#     @retry(
-#         stop=stop_after_attempt(3),
-#         wait=wait_random(min=3, max=7),
-#         before_sleep=before_sleep_log(logging.getLogger(), logging.WARNING),
-#     )
-#     def _make_request(self, linkedin_url: str) -> URLCheckResult:
-#         """
-#         Make a request to the LinkedIn URL and return the result.
-#         """
-#         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-#         try:
-#             response = self.session.get(
-#                 linkedin_url, timeout=self.timeout, allow_redirects=True
-#             )
-#             is_auth_wall = self._is_auth_wall(response.text)
-#             if is_auth_wall or response.status_code in self.RETRY_STATUS_CODES:
-#                 error_msg = "Auth wall detected" if is_auth_wall else f"Rate limited (Status: {response.status_code})"
-#                 raise Exception(error_msg)
-#             return URLCheckResult(
-#                 status_code=response.status_code,
-#                 error=None,
-#                 is_auth_wall=is_auth_wall,
-#                 timestamp=timestamp,
-#             )
-#         except Exception as e:
-#             error_msg = str(e) if not isinstance(e, requests.RequestException) else "Request failed"
-#             raise Exception(error_msg)
-
-#     def check_url(self, linkedin_url: str) -> URLCheckResult:
-#         """
-#         Check the LinkedIn URL and return the result.
-#         """
-#         try:
-#             return self._make_request(linkedin_url)
-#         except Exception as e:
-#             error_msg = str(getattr(e, "last_attempt", e).exception()) if hasattr(e, "last_attempt") else str(e)
-#             error_msg = error_msg.replace("Exception: ", "")
-#             return URLCheckResult(
-#                 status_code=0,
-#                 error=error_msg,
-#                 is_auth_wall=False,
-#                 timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"),
-#             )
-
-# def main():
-#     """
-#     Main function to check a list of LinkedIn URLs.
-#     """
-#     test_urls = [
-#         "https://www.linkedin.com/company/bright-data/",
-#         "https://www.linkedin.com/company/aabbccdd/",
-#         "https://www.linkedin.com/in/williamhgates",
-#         "https://www.linkedin.com/in/99887766",
-#         "https://www.linkedin.com/in/rbranson/",
-#     ]
-
-#     print("\nChecking LinkedIn URLs...")
-#     print("-" * 50)
-
-#     with LinkedInUrlChecker() as checker:
-#         for url in test_urls:
-#             result = checker.check_url(url)
-#             status = "\u2713" if result.status_code == 200 else "\u2717"
-#             print(f"{status} {url} - {'Error: ' + result.error if result.error else 'Status: ' + str(result.status_code)}")
-#             time.sleep(random.uniform(3, 7))
-#     print("-" * 50)
-
-# if __name__ == "__main__":
-#     main()
-
-print("\u2713")
\ No newline at end of file
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+import asyncio
+import html
+import json
+import re
+import sys
+
+import aiohttp
+
+import api_codes_path  # noqa: F401
+from linkedin_urls import canonicalize_url
+from output_sinks import open_sink
+from token_bucket import BURST, HEADERS, AsyncTokenBucket
+
+
+class URLCheckResult(NamedTuple):
+    url: str
+    status_code: int
+    error: Optional[str]
+    is_auth_wall: bool
+    timestamp: str
+    title: Optional[str] = None
+    bytes_read: int = 0
+
+    @property
+    def is_live(self) -> bool:
+        """
+        The page loaded and is a real profile or company page.
+        """
+        return self.status_code == 200 and not self.error and not self.is_auth_wall
+
+    @property
+    def is_dead(self) -> bool:
+        """
+        LinkedIn says the page does not exist; not worth sending to a paid dataset.
+        """
+        return self.status_code in LinkedInUrlChecker.DEAD_STATUS_CODES
+
+
+class PageScanner:
+    """
+    Incremental scan of a response body for auth-wall markers and the <title>.
+
+    Every pattern is folded into one compiled alternation, so each chunk is
+    scanned once however many markers there are. The last `overlap` bytes of
+    a chunk are carried over and scanned again with the next one, which
+    finds markers split across a chunk boundary; matches lying entirely in
+    that carried tail were reported already and are skipped.
+
+    feed() returns a verdict as soon as one is certain: "auth_wall" once a
+    marker shows up, "page" once the title names a real profile or company.
+    """
+
+    MAX_TITLE = 300
+
+    def __init__(self, patterns: Iterable[str], generic_titles: Iterable[str]):
+        patterns = [pattern.encode() for pattern in patterns]
+        self._regex = re.compile(
+            rb"(?i:<title[^>]{0,64}>(?P<title>[^<]{0,%d})</title>)|(?P<wall>%s)"
+            % (self.MAX_TITLE, b"|".join(re.escape(pattern) for pattern in patterns))
+        )
+        self.overlap = max(max(map(len, patterns)), self.MAX_TITLE + 80) - 1
+        self.generic_titles = {title.lower() for title in generic_titles}
+        self.auth_wall = False
+        self.title: Optional[str] = None
+        self.bytes_read = 0
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> Optional[str]:
+        self.bytes_read += len(chunk)
+        buffer = self._tail + chunk
+        carried = len(self._tail)
+        for match in self._regex.finditer(buffer):
+            if match.end() <= carried:
+                continue
+            if match.group("wall") is not None:
+                self.auth_wall = True
+            elif self.title is None:
+                self.title = html.unescape(match.group("title").decode("utf-8", "replace")).strip()
+        self._tail = buffer[-self.overlap:]
+        return self.verdict
+
+    @property
+    def verdict(self) -> Optional[str]:
+        if self.auth_wall:
+            return "auth_wall"
+        if self.title and self.title.lower() not in self.generic_titles and self.title.endswith("| LinkedIn"):
+            return "page"
+        return None
+
+
+class LinkedInUrlChecker:
+    """
+    Check large lists of LinkedIn URLs before paying to collect them.
+
+    All checks share one aiohttp connection pool. At most `max_concurrency`
+    are in flight, and each host gets its own adaptive token bucket, so a
+    429 from one host slows only that host down. Bodies are streamed
+    through a PageScanner and the connection is dropped as soon as the page
+    is known to be real or an auth wall, usually within the first chunk.
+    """
+
+    AUTH_WALL_PATTERNS = (
+        "authwall?trk=",
+        'window.location.href = "https://" + domain + "/authwall?"',
+        "sessionRedirect",
+    )
+
+    # Titles of LinkedIn's own login and error pages; they prove nothing.
+    GENERIC_TITLES = (
+        "LinkedIn",
+        "Sign Up | LinkedIn",
+        "LinkedIn Login, Sign in | LinkedIn",
+        "Page Not Found | LinkedIn",
+    )
+
+    RETRY_STATUS_CODES = {999, 429, 403}
+    DEAD_STATUS_CODES = {400, 404, 410}
+
+    MAX_CONCURRENCY = 20
+    REQUESTS_PER_SECOND_PER_HOST = 1.0
+    CHUNK_SIZE = 16 * 1024
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        timeout: int = 10,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+    ):
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        self.requests_per_second = (
+            self.REQUESTS_PER_SECOND_PER_HOST if requests_per_second is None else requests_per_second
+        )
+        self.buckets: Dict[str, AsyncTokenBucket] = {}
+        self.bytes_read = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "LinkedInUrlChecker":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=HEADERS,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _bucket(self, url: str) -> AsyncTokenBucket:
+        host = urlsplit(url).netloc.lower()
+        if host not in self.buckets:
+            self.buckets[host] = AsyncTokenBucket(self.requests_per_second, BURST)
+        return self.buckets[host]
+
+    def _result(
+        self,
+        url: str,
+        status_code: int,
+        error: Optional[str] = None,
+        is_auth_wall: bool = False,
+        title: Optional[str] = None,
+        bytes_read: int = 0,
+    ) -> URLCheckResult:
+        return URLCheckResult(
+            url=url,
+            status_code=status_code,
+            error=error,
+            is_auth_wall=is_auth_wall,
+            timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"),
+            title=title,
+            bytes_read=bytes_read,
+        )
+
+    async def _make_request(self, linkedin_url: str) -> URLCheckResult:
+        """
+        Request the URL once, reading only as much of the body as needed.
+        """
+        async with self.session.get(linkedin_url, allow_redirects=True) as response:
+            status = response.status
+            if "/authwall" in str(response.url):
+                response.close()
+                return self._result(linkedin_url, status, "Auth wall detected", is_auth_wall=True)
+            if status != 200:
+                # Small error bodies are drained so the connection goes back to the pool.
+                if response.content_length is not None and response.content_length <= self.CHUNK_SIZE:
+                    await response.read()
+                else:
+                    response.close()
+                return self._result(linkedin_url, status, f"Status code {status}")
+
+            scanner = PageScanner(self.AUTH_WALL_PATTERNS, self.GENERIC_TITLES)
+            verdict = None
+            async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                verdict = scanner.feed(chunk)
+                if verdict is not None:
+                    response.close()
+                    break
+            self.bytes_read += scanner.bytes_read
+            if verdict == "auth_wall":
+                return self._result(
+                    linkedin_url, status, "Auth wall detected",
+                    is_auth_wall=True, bytes_read=scanner.bytes_read,
+                )
+            return self._result(linkedin_url, status, title=scanner.title, bytes_read=scanner.bytes_read)
+
+    async def check_url(self, linkedin_url: str) -> URLCheckResult:
+        """
+        Check the LinkedIn URL and return the result.
+
+        Rate limits and auth walls are retried through the host's token
+        bucket, which slows down on each one; the last attempt's result is
+        returned if they persist.
+        """
+        bucket = self._bucket(linkedin_url)
+        result = None
+        for _ in range(self.max_retries):
+            await bucket.acquire()
+            try:
+                result = await self._make_request(linkedin_url)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                result = self._result(linkedin_url, 0, f"Request failed: {str(e) or type(e).__name__}")
+                continue
+            if result.is_auth_wall or result.status_code in self.RETRY_STATUS_CODES:
+                bucket.throttled()
+                continue
+            if result.status_code == 200:
+                bucket.success()
+            return result
+        return result
+
+    async def check_urls(self, urls: Iterable[str]) -> AsyncIterator[URLCheckResult]:
+        """
+        Yield a result per URL as checks complete (not in input order).
+
+        `urls` is consumed lazily, so it can be a generator over a file of
+        any size; only `max_concurrency` checks exist at a time.
+        """
+        urls = iter(urls)
+        pending = set()
+        try:
+            while True:
+                for url in urls:
+                    pending.add(asyncio.ensure_future(self.check_url(url)))
+                    if len(pending) >= self.max_concurrency:
+                        break
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def read_urls(filename: str) -> Iterator[str]:
+    """
+    URLs from a text file, one per line, each once (compared in canonical form).
+
+    Blank lines and lines starting with # are skipped.
+    """
+    seen = set()
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            url = line.strip()
+            if not url or url.startswith("#"):
+                continue
+            key = canonicalize_url(url)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield url
+
+
+async def check_urls_to_file(
+    urls: Iterable[str],
+    filename: str = "url_check_results.ndjson",
+    checker: Optional[LinkedInUrlChecker] = None,
+) -> Dict[str, int]:
+    """
+    Stream one URLCheckResult per URL to NDJSON and return live/dead/unknown counts.
+    """
+    counts = {"live": 0, "dead": 0, "unknown": 0}
+    checker = checker or LinkedInUrlChecker()
+    sink = open_sink(filename, batch_size=100)
+    try:
+        async with checker:
+            async for result in checker.check_urls(urls):
+                sink.write(result._asdict())
+                kind = "live" if result.is_live else "dead" if result.is_dead else "unknown"
+                counts[kind] += 1
+                if sink.count % 100 == 0:
+                    print(f"Checked {sink.count} URLs... ({counts['dead']} dead)")
+    except BaseException:
+        sink.abort()
+        raise
+    sink.close()
+    print(f"Saved {sink.count} results to {filename}")
+    return counts
+
+
+def usable_urls(results_filename: str) -> List[str]:
+    """
+    URLs from a results file that are not known to be dead.
+
+    Auth-walled, rate-limited and failed checks are kept: the page may well
+    exist, the checker just could not see it.
+    """
+    urls = []
+    with open(results_filename, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                result = URLCheckResult(**json.loads(line))
+                if not result.is_dead:
+                    urls.append(result.url)
+    return urls
+
+
+def main():
+    """
+    Check a file of LinkedIn URLs (one per line), or a few examples.
+    """
+    test_urls = [
+        "https://www.linkedin.com/company/bright-data/",
+        "https://www.linkedin.com/company/aabbccdd/",
+        "https://www.linkedin.com/in/williamhgates",
+        "https://www.linkedin.com/in/99887766",
+        "https://www.linkedin.com/in/rbranson/",
+    ]
+    if len(sys.argv) > 1:
+        counts = asyncio.run(check_urls_to_file(read_urls(sys.argv[1])))
+        print(f"{counts['live']} live, {counts['dead']} dead, {counts['unknown']} unknown")
+        return
+
+    async def check_examples() -> None:
+        async with LinkedInUrlChecker() as checker:
+            async for result in checker.check_urls(test_urls):
+                status = "\u2713" if result.is_live else "\u2717"
+                print(f"{status} {result.url} - {'Error: ' + result.error if result.error else 'Status: ' + str(result.status_code)}")
+
+    print("\nChecking LinkedIn URLs...")
+    print("-" * 50)
+    asyncio.run(check_examples())
+    print("-" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+from typing import Optional
+import asyncio
+import logging
+import threading
+import time
+
+# Request pacing shared by the jobs scrapers and the URL checker. Standard
+# library only, so the checker can use it without loading requests or bs4.
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "DNT": "1",
+    "Cache-Control": "no-cache",
+}
+BURST = 1
+# AIMD bounds: +RATE_INCREASE req/s per good response, x RATE_DECREASE
+# when throttled; RATE_LIMIT_THRESHOLD throttles in a row pause every
+# caller for RATE_LIMIT_DELAY seconds.
+MIN_REQUESTS_PER_SECOND = 0.05
+MAX_REQUESTS_PER_SECOND = 2.0
+RATE_INCREASE = 0.01
+RATE_DECREASE = 0.5
+RATE_LIMIT_DELAY = 30
+RATE_LIMIT_THRESHOLD = 10
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose rate adapts to how LinkedIn responds.
+
+    success() raises the rate additively up to max_rate and throttled()
+    cuts it multiplicatively down to min_rate (AIMD). After `threshold`
+    throttles in a row every caller waits `cooldown` seconds. A rate of
+    0 means unlimited and is never adjusted, but still honours cooldowns.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+        decrease: Optional[float] = None,
+        threshold: Optional[int] = None,
+        cooldown: Optional[float] = None,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = MIN_REQUESTS_PER_SECOND if min_rate is None else min_rate
+        self.max_rate = max(rate, MAX_REQUESTS_PER_SECOND if max_rate is None else max_rate)
+        self.increase = RATE_INCREASE if increase is None else increase
+        self.decrease = RATE_DECREASE if decrease is None else decrease
+        self.threshold = threshold or RATE_LIMIT_THRESHOLD
+        self.cooldown = RATE_LIMIT_DELAY if cooldown is None else cooldown
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.consecutive_throttles = 0
+        self.throttles = 0
+        self.cooldowns = 0
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take a token if one is available; otherwise return how long to wait.
+        """
+        with self.lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return self.paused_until - now
+            if not self.rate:
+                return 0.0
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self) -> None:
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def success(self) -> None:
+        with self.lock:
+            self.consecutive_throttles = 0
+            if self.rate:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def throttled(self) -> None:
+        with self.lock:
+            self.throttles += 1
+            self.consecutive_throttles += 1
+            if self.rate:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+            if self.consecutive_throttles >= self.threshold:
+                self.consecutive_throttles = 0
+                self.cooldowns += 1
+                self.paused_until = time.monotonic() + self.cooldown
+                logging.warning(f"Rate limited {self.threshold} times in a row, pausing {self.cooldown}s")
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "throttles": self.throttles,
+            "cooldowns": self.cooldowns,
+            "paused_for": max(0.0, self.paused_until - time.monotonic()),
+        }
+
+
+class AsyncTokenBucket(TokenBucket):
+    """
+    The adaptive TokenBucket for coroutines: waiting sleeps the task, not the thread.
+    """
+
+    async def acquire(self) -> None:
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
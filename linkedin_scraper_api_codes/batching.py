@@ -0,0 +1,186 @@
+import json
+import logging
+import math
+import os
+import random
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from polling import linear_fit
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZES = (50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def split_batches(items: List[T], batch_size: int) -> List[List[T]]:
+    """
+    Consecutive slices of at most `batch_size` items; concatenated they are `items`.
+    """
+    batch_size = max(1, batch_size)
+    return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+
+class FixedBatching:
+    """
+    Trigger in batches of `batch_size` inputs (None: one trigger for all of
+    them, the historical behaviour), at most `max_in_flight` at a time.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, max_in_flight: int = 4):
+        self.fixed_size = batch_size
+        self.max_in_flight = max_in_flight
+
+    def batch_size(self, dataset_id: str, input_count: int) -> int:
+        return min(self.fixed_size or input_count, input_count)
+
+    def record(self, dataset_id: str, batch_size: int, records: int, duration: float) -> None:
+        pass
+
+
+class AdaptiveBatching:
+    """
+    Batch sizes chosen per dataset to maximize records per minute.
+
+    Lists of at most `initial_batch_size` inputs are never split.
+
+    Every finished batch records (inputs, records, seconds). For a new run
+    of N inputs each candidate size b is scored by the wall-clock
+    throughput it should reach: N * records_per_input(b) records in
+    ceil(ceil(N / b) / max_in_flight) waves of duration(b) seconds each.
+    duration(b) is the mean of the batches of that size when there are
+    some, otherwise a linear fit (overhead + seconds_per_input * b) over all
+    of the dataset's batches. Until two sizes have been measured, and with
+    probability `explore` afterwards, a neighbour of the best size is tried
+    instead so the estimates keep improving. History can be persisted to a
+    JSON file and stats() reports records/minute per size.
+    """
+
+    def __init__(
+        self,
+        initial_batch_size: int = 500,
+        max_in_flight: int = 4,
+        batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+        explore: float = 0.1,
+        history_size: int = 100,
+        history_path: Optional[str] = None,
+    ):
+        self.initial_batch_size = initial_batch_size
+        self.max_in_flight = max_in_flight
+        self.batch_sizes = sorted(batch_sizes)
+        self.explore = explore
+        self.history_size = history_size
+        self.history_path = history_path
+        self._history: Dict[str, Deque[Tuple[int, int, float]]] = {}
+        self._lock = threading.Lock()
+        if history_path and os.path.exists(history_path):
+            self._load()
+
+    def _samples(self, dataset_id: str) -> List[Tuple[int, int, float]]:
+        with self._lock:
+            return list(self._history.get(dataset_id, ()))
+
+    def _candidates(self, input_count: int) -> List[int]:
+        return [size for size in self.batch_sizes if size < input_count] + [input_count]
+
+    def estimate(self, dataset_id: str, batch_size: int, input_count: int) -> Optional[float]:
+        """
+        Expected records per minute for `input_count` inputs in batches of `batch_size`.
+        """
+        samples = self._samples(dataset_id)
+        if not samples:
+            return None
+        same = [s for s in samples if s[0] == batch_size]
+        if same:
+            duration = sum(d for _, _, d in same) / len(same)
+            per_input = sum(r for _, r, _ in same) / sum(i for i, _, _ in same)
+        else:
+            overhead, per_second = linear_fit((i, d) for i, _, d in samples)
+            duration = overhead + per_second * batch_size
+            per_input = sum(r for _, r, _ in samples) / sum(i for i, _, _ in samples)
+        waves = math.ceil(math.ceil(input_count / batch_size) / self.max_in_flight)
+        return 60 * input_count * per_input / max(waves * duration, 1e-6)
+
+    def batch_size(self, dataset_id: str, input_count: int) -> int:
+        # Short lists always go out in one trigger; splitting them only adds triggers.
+        if input_count <= self.initial_batch_size:
+            return input_count
+        candidates = self._candidates(input_count)
+        samples = self._samples(dataset_id)
+        if not samples:
+            return self.initial_batch_size
+        scores = {size: self.estimate(dataset_id, size, input_count) for size in candidates}
+        best = max(candidates, key=lambda size: scores[size])
+        measured = {size for size, _, _ in samples} & set(candidates)
+        if len(measured) < 2 or random.random() < self.explore:
+            return self._neighbour(candidates, best, measured)
+        return best
+
+    def _neighbour(self, candidates: List[int], best: int, measured: set) -> int:
+        """
+        The closest candidate to `best` that has not been measured, else a
+        random adjacent one.
+        """
+        index = candidates.index(best)
+        unmeasured = [i for i, size in enumerate(candidates) if size not in measured]
+        if unmeasured:
+            return candidates[min(unmeasured, key=lambda i: (abs(i - index), i))]
+        adjacent = [i for i in (index - 1, index + 1) if 0 <= i < len(candidates)]
+        return candidates[random.choice(adjacent)] if adjacent else best
+
+    def record(self, dataset_id: str, batch_size: int, records: int, duration: float) -> None:
+        with self._lock:
+            samples = self._history.setdefault(dataset_id, deque(maxlen=self.history_size))
+            samples.append((batch_size, records, duration))
+        if self.history_path:
+            self._save()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per dataset and batch size: batches run, mean seconds and records per minute.
+        """
+        result = {}
+        with self._lock:
+            history = {k: list(v) for k, v in self._history.items()}
+        for dataset_id, samples in history.items():
+            sizes: Dict[int, List[Tuple[int, float]]] = {}
+            for size, records, duration in samples:
+                sizes.setdefault(size, []).append((records, duration))
+            result[dataset_id] = {
+                size: {
+                    "batches": len(runs),
+                    "mean_seconds": round(sum(d for _, d in runs) / len(runs), 3),
+                    "records_per_minute": round(
+                        60 * sum(r for r, _ in runs) / max(sum(d for _, d in runs), 1e-6), 1
+                    ),
+                }
+                for size, runs in sorted(sizes.items())
+            }
+        return result
+
+    def _load(self) -> None:
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (IOError, ValueError) as e:
+            logging.warning(f"Ignoring batching history {self.history_path}: {str(e)}")
+            return
+        for dataset_id, samples in stored.get("history", {}).items():
+            self._history[dataset_id] = deque(
+                (tuple(s) for s in samples), maxlen=self.history_size
+            )
+
+    def _save(self) -> None:
+        with self._lock:
+            stored = {"history": {k: list(v) for k, v in self._history.items()}}
+        tmp_path = f"{self.history_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stored, f)
+            os.replace(tmp_path, self.history_path)
+        except IOError as e:
+            logging.warning(f"Could not save batching history: {str(e)}")
+
+
+DEFAULT_BATCHING = AdaptiveBatching()
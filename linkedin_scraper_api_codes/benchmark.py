@@ -0,0 +1,465 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from queue import Empty
+from typing import Any, Callable, Dict, List, Optional
+
+from standin_server import JOBS_GUEST_PATH, StandInAPI, StandInServer
+
+DEFAULT_RESULTS_DIR = "benchmark_results"
+
+# name -> (module, class, input factory)
+COLLECTORS: Dict[str, tuple] = {
+    "company_info": (
+        "linkedin_company_info_by_url",
+        "LinkedInCompanyInfo",
+        lambda i: {"url": f"https://www.linkedin.com/company/bench-company-{i}"},
+    ),
+    "profile_by_url": (
+        "linkedin_profile_by_url",
+        "LinkedInProfileInfo",
+        lambda i: {"url": f"https://www.linkedin.com/in/bench-profile-{i}"},
+    ),
+    "profile_by_name": (
+        "linkedin_profile_by_name",
+        "LinkedInProfileDiscovery",
+        lambda i: {"first_name": "James", "last_name": f"Smith{i}"},
+    ),
+    "posts_by_url": (
+        "linkedin_posts_by_url",
+        "LinkedInPostCollector",
+        lambda i: {"url": f"https://www.linkedin.com/posts/bench_post-activity-{7180537307521769472 + i}-x"},
+    ),
+    "posts_discover_by_url": (
+        "linkedin_posts_discover_by_url",
+        "LinkedInArticleDiscovery",
+        lambda i: {"url": f"https://www.linkedin.com/today/author/bench-author-{i}"},
+    ),
+    "posts_by_profile_url": (
+        "linkedin_posts_by_profile_url",
+        "LinkedInPostDiscovery",
+        lambda i: {"url": f"https://www.linkedin.com/in/bench-profile-{i}"},
+    ),
+    "posts_by_company_url": (
+        "linkedin_posts_by_company_url",
+        "LinkedInPostsCollector",
+        lambda i: {"url": f"https://www.linkedin.com/company/bench-company-{i}"},
+    ),
+    "jobs_by_url": (
+        "linkedin_jobs_by_url",
+        "LinkedInJobsCollector",
+        lambda i: {"url": f"https://www.linkedin.com/jobs/view/{4073552631 + i}"},
+    ),
+    "jobs_by_keyword": (
+        "linkedin_jobs_by_keyword",
+        "LinkedInJobsDiscovery",
+        lambda i: {"location": "New York", "keyword": f"data analyst {i}", "country": "US"},
+    ),
+    "jobs_by_search_url": (
+        "linkedin_jobs_by_search_url",
+        "LinkedInJobsURLDiscovery",
+        lambda i: {"url": f"https://www.linkedin.com/jobs/search?keywords=bench{i}&location=London"},
+    ),
+}
+
+FREE_SCRAPER = "free_jobs_scraper"
+
+# Metrics compared against a baseline, and whether higher is better.
+COMPARED_METRICS = {
+    "latency_p50": False,
+    "latency_p90": False,
+    "time_to_first_record_p50": False,
+    "records_per_sec": True,
+    "peak_rss_kb": False,
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile, q in [0, 100].
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _summarize(runs: List[Dict[str, float]]) -> Dict[str, Any]:
+    latencies = [r["latency"] for r in runs]
+    first = [r["time_to_first_record"] for r in runs]
+    records = runs[0]["records"] if runs else 0
+    total_time = sum(latencies)
+    return {
+        "runs": len(runs),
+        "records": records,
+        "latency_p50": percentile(latencies, 50),
+        "latency_p90": percentile(latencies, 90),
+        "latency_p99": percentile(latencies, 99),
+        "time_to_first_record_p50": percentile(first, 50),
+        "records_per_sec": records * len(runs) / total_time if total_time else 0.0,
+        "bytes_written": runs[0]["bytes_written"] if runs else 0,
+        "cpu": {
+            phase: sum(r["cpu"][phase] for r in runs) / len(runs)
+            for phase in ("network", "parse", "serialize")
+        } if runs else {},
+    }
+
+
+def _timed_collector(collector_class: type, timings: Dict[str, Any]) -> type:
+    """
+    The collector class, recording when its records are in hand and the
+    id of every snapshot it downloads.
+    """
+
+    class TimedCollector(collector_class):
+        async def _gather(self, *args, **kwargs):
+            data = await super()._gather(*args, **kwargs)
+            if timings["first"] is None:
+                timings["first"] = time.perf_counter() - timings["start"]
+            return data
+
+        async def _start_snapshot(self, *args, **kwargs):
+            snapshot_id = await super()._start_snapshot(*args, **kwargs)
+            if snapshot_id is not None:
+                timings["snapshots"].append(snapshot_id)
+            return snapshot_id
+
+    return TimedCollector
+
+
+async def _collector_run(
+    collector, inputs: List[Dict[str, Any]], filename: str, timings: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    One end-to-end collector.run(): batching, trigger, polling, download,
+    cache and journal if configured, and the saved file.
+
+    run() hands over no records before the download is complete, so the
+    time to first record is when they are all in hand. Every snapshot of
+    the run is then downloaded again with the phases separated, so process
+    CPU time can be attributed to network, JSON parsing and serialization.
+    """
+    from brightdata_client import BrightDataClient
+    from output_sinks import open_sink
+
+    async with BrightDataClient("bench-token") as client:
+        timings["first"] = None
+        timings["snapshots"] = []
+        timings["start"] = time.perf_counter()
+        data = await collector.run(inputs, filename=filename, client=client)
+        latency = time.perf_counter() - timings["start"]
+        if data is None:
+            raise RuntimeError("collection failed")
+
+        cpu = {"network": 0.0, "parse": 0.0, "serialize": 0.0}
+        for snapshot_id in timings["snapshots"]:
+            started = time.process_time()
+            async with client.session.get(
+                f"{client.base_url}/snapshot/{snapshot_id}", params={"format": "ndjson"}
+            ) as response:
+                buffer = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    buffer.extend(chunk)
+            lines = bytes(buffer).splitlines()
+            cpu["network"] += time.process_time() - started
+
+            started = time.process_time()
+            records = [json.loads(line) for line in lines if line.strip()]
+            cpu["parse"] += time.process_time() - started
+
+            started = time.process_time()
+            with open_sink(filename + ".phase") as phase_sink:
+                phase_sink.write_many(records)
+            cpu["serialize"] += time.process_time() - started
+            os.remove(filename + ".phase")
+
+    return {
+        "latency": latency,
+        "time_to_first_record": timings["first"] or latency,
+        "records": len(data),
+        "bytes_written": os.path.getsize(filename) if data else 0,
+        "cpu": cpu,
+    }
+
+
+def _run_collector_case(name: str, size: int, repeat: int, base_url: str, workdir: str) -> Dict[str, Any]:
+    import importlib
+
+    logging.getLogger().setLevel(logging.WARNING)
+    os.environ["BRIGHTDATA_API_URL"] = base_url
+    module, class_name, make_input = COLLECTORS[name]
+    timings: Dict[str, Any] = {}
+    collector_class = _timed_collector(getattr(importlib.import_module(module), class_name), timings)
+    collector = collector_class("bench-token")
+    inputs = [make_input(i) for i in range(size)]
+    filename = os.path.join(workdir, f"{name}-{size}.json")
+    return _summarize(
+        [asyncio.run(_collector_run(collector, inputs, filename, timings)) for _ in range(repeat)]
+    )
+
+
+def _run_free_scraper_case(size: int, repeat: int, base_url: str, workdir: str, parser: str = "auto") -> Dict[str, Any]:
+    import free_scraper_path  # noqa: F401
+    from jobs_scraper import LinkedInJobsScraper, ScraperConfig, check_page_status
+
+    ScraperConfig.BASE_URL = base_url + JOBS_GUEST_PATH
+    ScraperConfig.REQUESTS_PER_SECOND = 0
+    cpu = {"network": 0.0, "parse": 0.0, "serialize": 0.0}
+    timings: Dict[str, Optional[float]] = {"start": 0.0, "first": None}
+
+    class TimedScraper(LinkedInJobsScraper):
+        def _fetch_job_page(self, url: str) -> Any:
+            started = time.process_time()
+            response = self.session.get(url, headers=ScraperConfig.HEADERS)
+            cpu["network"] += time.process_time() - started
+            check_page_status(self.rate_limiter, response.status_code, response.url)
+            started = time.process_time()
+            document = self.parser.parse(response.text)
+            cpu["parse"] += time.process_time() - started
+            return document
+
+        def _extract_job_data(self, job_card):
+            started = time.process_time()
+            job = super()._extract_job_data(job_card)
+            cpu["parse"] += time.process_time() - started
+            if timings["first"] is None:
+                timings["first"] = time.perf_counter() - timings["start"]
+            return job
+
+    filename = os.path.join(workdir, f"{FREE_SCRAPER}-{size}.json")
+    runs = []
+    for _ in range(repeat):
+        for phase in cpu:
+            cpu[phase] = 0.0
+        scraper = TimedScraper(parser=parser)
+        timings["start"], timings["first"] = time.perf_counter(), None
+        with contextlib.redirect_stdout(io.StringIO()):
+            jobs = scraper.scrape_jobs("bench", "London", max_jobs=size)
+            started = time.process_time()
+            scraper.save_results(jobs, filename)
+            cpu["serialize"] += time.process_time() - started
+        latency = time.perf_counter() - timings["start"]
+        runs.append(
+            {
+                "latency": latency,
+                "time_to_first_record": timings["first"] or latency,
+                "records": len(jobs),
+                "bytes_written": os.path.getsize(filename) if jobs else 0,
+                "cpu": dict(cpu),
+            }
+        )
+    return {"parser": scraper.parser.name, **_summarize(runs)}
+
+
+def _case_worker(target: Callable, args: tuple, queue) -> None:
+    try:
+        result = target(*args)
+        result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        queue.put(result)
+    except Exception as e:
+        queue.put({"error": str(e)})
+
+
+def run_case(target: Callable, args: tuple) -> Dict[str, Any]:
+    """
+    Run one case in a fresh process so peak RSS belongs to that case alone.
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_case_worker, args=(target, args, queue))
+    process.start()
+    try:
+        while True:
+            try:
+                return queue.get(timeout=1)
+            except Empty:
+                # A child killed before queue.put() (OOM, segfault) never
+                # answers; stop waiting once it has exited.
+                if process.exitcode is not None:
+                    try:
+                        return queue.get_nowait()
+                    except Empty:
+                        return {"error": f"case process exited with code {process.exitcode}"}
+    finally:
+        process.join()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    collectors: List[str],
+    input_sizes: List[int],
+    payload_multipliers: List[int],
+    job_sizes: List[int],
+    repeat: int = 3,
+    run_delay: float = 0.2,
+    job_parsers: List[str] = ("auto",),
+) -> Dict[str, Any]:
+    """
+    Benchmark every collector and the free scraper against the stand-in API.
+    """
+    cases = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for multiplier in payload_multipliers:
+            server = StandInServer(StandInAPI(run_delay=run_delay, payload_multiplier=multiplier))
+            base_url = server.start_in_thread()
+            try:
+                for name in collectors:
+                    if name == FREE_SCRAPER:
+                        continue
+                    for size in input_sizes:
+                        print(f"{name}: {size} inputs, payload x{multiplier}")
+                        result = run_case(_run_collector_case, (name, size, repeat, base_url, workdir))
+                        cases.append({"name": name, "inputs": size, "payload_multiplier": multiplier, **result})
+            finally:
+                server.stop_thread()
+
+        if FREE_SCRAPER in collectors:
+            server = StandInServer(StandInAPI(jobs_total=max(job_sizes)))
+            base_url = server.start_in_thread()
+            try:
+                for job_parser in job_parsers:
+                    for size in job_sizes:
+                        print(f"{FREE_SCRAPER}: {size} jobs, {job_parser} parser")
+                        result = run_case(_run_free_scraper_case, (size, repeat, base_url, workdir, job_parser))
+                        cases.append({"name": FREE_SCRAPER, "inputs": size, "payload_multiplier": 1, **result})
+            finally:
+                server.stop_thread()
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "cases": cases,
+    }
+
+
+def _case_key(case: Dict[str, Any]) -> tuple:
+    return case["name"], case["inputs"], case["payload_multiplier"], case.get("parser")
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.15) -> List[str]:
+    """
+    List every metric that got worse than the baseline by more than `tolerance`.
+    """
+    previous = {_case_key(case): case for case in baseline.get("cases", [])}
+    regressions = []
+    for case in results["cases"]:
+        old = previous.get(_case_key(case))
+        if old is None or "error" in case or "error" in old:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            before, after = old.get(metric), case.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if (change < -tolerance) if higher_is_better else (change > tolerance):
+                regressions.append(
+                    f"{case['name']} inputs={case['inputs']} x{case['payload_multiplier']}: "
+                    f"{metric} {before:.4g} -> {after:.4g} ({change:+.0%})"
+                )
+    return regressions
+
+
+def print_report(results: Dict[str, Any]) -> None:
+    print(
+        f"{'case':<40} {'records':>8} {'p50 s':>8} {'p90 s':>8} {'p99 s':>8} "
+        f"{'first s':>8} {'rec/s':>10} {'RSS MB':>8} {'bytes':>10} {'cpu net/parse/ser s':>22}"
+    )
+    for case in results["cases"]:
+        label = f"{case['name']} n={case['inputs']} x{case['payload_multiplier']}"
+        if case.get("parser"):
+            label += f" [{case['parser']}]"
+        if "error" in case:
+            print(f"{label:<40} ERROR {case['error']}")
+            continue
+        cpu = case["cpu"]
+        print(
+            f"{label:<40} {case['records']:>8} {case['latency_p50']:>8.3f} {case['latency_p90']:>8.3f} "
+            f"{case['latency_p99']:>8.3f} {case['time_to_first_record_p50']:>8.3f} "
+            f"{case['records_per_sec']:>10.1f} {case['peak_rss_kb'] / 1024:>8.1f} {case['bytes_written']:>10} "
+            f"{cpu['network']:>7.3f}/{cpu['parse']:.3f}/{cpu['serialize']:.3f}"
+        )
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Throughput benchmarks against the local stand-in API")
+    parser.add_argument("--collectors", default=",".join([*COLLECTORS, FREE_SCRAPER]),
+                        help="comma separated subset of: " + ", ".join([*COLLECTORS, FREE_SCRAPER]))
+    parser.add_argument("--input-sizes", type=_int_list, default=[1, 10, 100])
+    parser.add_argument("--payload-multipliers", type=_int_list, default=[1, 10])
+    parser.add_argument("--job-sizes", type=_int_list, default=[100, 500])
+    parser.add_argument("--job-parsers", default="auto",
+                        help="comma separated HTML parsers for the free scraper (auto, selectolax, lxml, bs4)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--run-delay", type=float, default=0.2, help="stand-in snapshot build time")
+    parser.add_argument("--output", help="results file (default benchmark_results/<timestamp>.json)")
+    parser.add_argument("--compare", help="baseline results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    collectors = [c for c in args.collectors.split(",") if c]
+    unknown = set(collectors) - set(COLLECTORS) - {FREE_SCRAPER}
+    if unknown:
+        parser.error(f"unknown collectors: {', '.join(sorted(unknown))}")
+
+    results = run_benchmarks(
+        collectors,
+        args.input_sizes,
+        args.payload_multipliers,
+        args.job_sizes,
+        repeat=args.repeat,
+        run_delay=args.run_delay,
+        job_parsers=[p for p in args.job_parsers.split(",") if p],
+    )
+    print_report(results)
+
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
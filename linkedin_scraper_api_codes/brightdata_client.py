@@ -0,0 +1,185 @@
+import asyncio
+import json
+import os
+from typing import AsyncIterator, List, Dict, Any, Optional
+
+import aiohttp
+
+API_BASE_URL = "https://api.brightdata.com/datasets/v3"
+# Overrides the base URL, e.g. to point at standin_server.py.
+API_URL_ENV = "BRIGHTDATA_API_URL"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class SnapshotNotReady(Exception):
+    """
+    /snapshot answered 202 (or a status document instead of records): the
+    snapshot is still being built, ask again later.
+    """
+
+    def __init__(self, snapshot_id: str, status: Optional[str] = None):
+        super().__init__(f"Snapshot {snapshot_id} is not ready yet ({status or 'unknown'})")
+        self.snapshot_id = snapshot_id
+        self.status = status
+
+
+async def _not_ready(snapshot_id: str, response: aiohttp.ClientResponse) -> SnapshotNotReady:
+    try:
+        body = await response.json(content_type=None)
+    except ValueError:
+        body = None
+    status = body.get("status") if isinstance(body, dict) else None
+    return SnapshotNotReady(snapshot_id, status)
+
+
+class BrightDataClient:
+    """
+    Async client for the Bright Data Dataset API.
+
+    All requests go through one pooled keep-alive session, so a single process
+    can drive many snapshots concurrently without reconnecting on every poll.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        max_connections: int = 100,
+    ):
+        self.api_token = api_token
+        base_url = base_url or os.environ.get(API_URL_ENV) or API_BASE_URL
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.headers = {
+            "Authorization": f"Bearer {api_token}",
+            "Content-Type": "application/json",
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "BrightDataClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The shared session, created lazily inside the running event loop.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections, keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                raise_for_status=True,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            # Give the connector a tick to release its transports.
+            await asyncio.sleep(0)
+        self._session = None
+
+    async def trigger(
+        self, dataset_id: str, inputs: List[Dict[str, Any]], **params: str
+    ) -> Dict[str, Any]:
+        """
+        Start a collection and return the API response (holds the snapshot_id).
+        """
+        async with self.session.post(
+            f"{self.base_url}/trigger",
+            params={"dataset_id": dataset_id, **params},
+            json=inputs,
+        ) as response:
+            return await response.json()
+
+    async def progress(self, snapshot_id: str) -> Dict[str, Any]:
+        """
+        Return the progress document of a snapshot, e.g. {"status": "running"}.
+        """
+        async with self.session.get(
+            f"{self.base_url}/progress/{snapshot_id}"
+        ) as response:
+            return await response.json()
+
+    async def snapshots(
+        self, dataset_id: str, status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List the snapshots of a dataset with their current status.
+        """
+        params = {"dataset_id": dataset_id}
+        if status:
+            params["status"] = status
+        async with self.session.get(
+            f"{self.base_url}/snapshots", params=params
+        ) as response:
+            return await response.json()
+
+    async def snapshot(
+        self, snapshot_id: str, format: str = "json"
+    ) -> List[Dict[str, Any]]:
+        """
+        Download the records of a ready snapshot.
+
+        Raises SnapshotNotReady while the API still answers 202 or returns a
+        status document instead of the record list.
+        """
+        async with self.session.get(
+            f"{self.base_url}/snapshot/{snapshot_id}",
+            params={"format": format},
+            # Snapshots can be far larger than a progress document.
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=self.timeout),
+        ) as response:
+            if response.status == 202:
+                raise await _not_ready(snapshot_id, response)
+            data = await response.json(content_type=None)
+        if not isinstance(data, list):
+            status = data.get("status") if isinstance(data, dict) else None
+            raise SnapshotNotReady(snapshot_id, status)
+        return data
+
+    async def stream_snapshot(
+        self,
+        snapshot_id: str,
+        format: str = "ndjson",
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Download a ready snapshot as NDJSON/JSONL and yield one record at a time.
+
+        The body is read in chunks and split on newlines, so memory stays
+        bounded by the largest single record instead of the whole snapshot.
+        A 202 answer raises SnapshotNotReady before anything is yielded.
+        """
+        async with self.session.get(
+            f"{self.base_url}/snapshot/{snapshot_id}",
+            params={"format": format},
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=self.timeout),
+        ) as response:
+            if response.status == 202:
+                raise await _not_ready(snapshot_id, response)
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(chunk_size):
+                scan_from = len(buffer)
+                buffer.extend(chunk)
+                newline = buffer.find(b"\n", scan_from)
+                begin = 0
+                while newline >= 0:
+                    line = buffer[begin:newline]
+                    if line.strip():
+                        yield json.loads(line)
+                    begin = newline + 1
+                    newline = buffer.find(b"\n", begin)
+                if begin:
+                    del buffer[:begin]
+            if buffer.strip():
+                yield json.loads(buffer)
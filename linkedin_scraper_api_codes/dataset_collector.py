@@ -0,0 +1,682 @@
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Tuple
+
+import aiohttp
+
+from batching import DEFAULT_BATCHING, split_batches
+from brightdata_client import BrightDataClient, SnapshotNotReady
+from job_journal import (
+    JobJournal,
+    JournalEntry,
+    STATUS_DOWNLOADING as JOURNAL_DOWNLOADING,
+    STATUS_READY as JOURNAL_READY,
+    STATUS_TRIGGERED as JOURNAL_TRIGGERED,
+)
+from linkedin_urls import dedupe_inputs
+from output_sinks import OutputSink, open_sink
+from post_watermarks import PostWatermarks, WatermarkUpdate
+from record_store import RecordStore
+from result_cache import ResultCache, input_key
+from polling import DEFAULT_POLLING, AdaptivePolling, FixedPolling, PollSchedule
+from snapshot_poller import SnapshotPoller
+
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+STATUS_ERROR = "error"
+
+
+class DatasetCollector:
+    """
+    Shared trigger -> progress -> snapshot flow for every LinkedIn dataset.
+
+    Subclasses only describe their dataset (id, trigger parameters, output
+    file); the flow itself runs on a BrightDataClient, so many collectors can
+    share one connection pool inside a single event loop.
+    """
+
+    DATASET_ID: str = ""
+    TRIGGER_PARAMS: Dict[str, str] = {}
+    DEFAULT_FILENAME: str = "linkedin_data.json"
+    RECORD_NAME: str = "records"
+
+    def __init__(
+        self,
+        api_token: str,
+        dataset_id: Optional[str] = None,
+        sleep_interval: Optional[float] = None,
+        timeout: int = 30,
+        client: Optional[BrightDataClient] = None,
+        poller: Optional[SnapshotPoller] = None,
+        polling=None,
+        output_format: Optional[str] = None,
+        cache: Optional[ResultCache] = None,
+        canonicalize: bool = True,
+        watermarks: Optional[PostWatermarks] = None,
+        journal: Optional[JobJournal] = None,
+        api_base_url: Optional[str] = None,
+        store: Optional[RecordStore] = None,
+        batching=None,
+    ):
+        self.api_token = api_token
+        self.dataset_id = dataset_id or self.DATASET_ID
+        self.sleep_interval = sleep_interval
+        self.timeout = timeout
+        self.client = client
+        self.poller = poller
+        if polling is None:
+            # An explicit sleep_interval keeps the old fixed-interval polling.
+            polling = FixedPolling(sleep_interval) if sleep_interval else DEFAULT_POLLING
+        self.polling = polling
+        self.output_format = output_format
+        self.cache = cache
+        self.canonicalize = canonicalize
+        self.watermarks = watermarks
+        self.journal = journal
+        self.api_base_url = api_base_url
+        self.store = store
+        self.batching = DEFAULT_BATCHING if batching is None else batching
+
+    def collect(
+        self, inputs: List[Dict[str, Any]], filename: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Blocking entry point: run the whole flow in a fresh event loop.
+        """
+        return asyncio.run(self._collect_with_own_client(inputs, filename))
+
+    def _new_client(self) -> BrightDataClient:
+        return BrightDataClient(
+            self.api_token, base_url=self.api_base_url, timeout=self.timeout
+        )
+
+    async def _collect_with_own_client(
+        self, inputs: List[Dict[str, Any]], filename: Optional[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        async with self._new_client() as client:
+            return await self.run(inputs, filename=filename, client=client)
+
+    async def run(
+        self,
+        inputs: List[Dict[str, Any]],
+        filename: Optional[str] = None,
+        client: Optional[BrightDataClient] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Trigger a snapshot, wait for it, download and save the records.
+
+        Returns the records, or None if any stage failed. When the inputs
+        were split into batches, the records of the batches that succeeded
+        are saved and returned even if others failed.
+        """
+        client = client or self.client
+        if client is None:
+            return await self._collect_with_own_client(inputs, filename)
+
+        filename = filename or self.DEFAULT_FILENAME
+        inputs = self._prepare_inputs(inputs)
+        if self.watermarks is not None:
+            inputs = self.watermarks.narrow(inputs)
+        job_id = self._journal_begin(inputs, filename)
+        data = await self._gather(client, inputs, job_id)
+        if data is None:
+            self._journal_failed(job_id)
+            return None
+        data, update = self._select_new(data)
+        if not data:
+            logging.info(f"No new or changed {self.RECORD_NAME}")
+            self._commit_watermarks(update)
+            self._journal_finish(job_id, 0)
+            return data
+        if not self._save_data(data, filename):
+            self._journal_failed(job_id)
+            return None
+        self._store_records(data)
+        self._commit_watermarks(update)
+        self._journal_finish(job_id, len(data))
+        return data
+
+    async def collect_into(
+        self,
+        inputs: List[Dict[str, Any]],
+        sink: OutputSink,
+        client: Optional[BrightDataClient] = None,
+    ) -> Optional[int]:
+        """
+        Like run(), but append the records to an open sink instead of
+        writing a file, so several chunks of inputs can share one output.
+
+        Returns the number of records written (0 when the snapshot had none),
+        or None if collection failed.
+        """
+        client = client or self.client
+        if client is None:
+            async with self._new_client() as client:
+                return await self.collect_into(inputs, sink, client)
+
+        inputs = self._prepare_inputs(inputs)
+        if self.watermarks is not None:
+            inputs = self.watermarks.narrow(inputs)
+        data = await self._gather(client, inputs)
+        if data is None:
+            return None
+        data, update = self._select_new(data)
+        sink.write_many(data)
+        self._store_records(data)
+        if update is not None:
+            # Posts only count as seen once the output file is in place.
+            sink.on_close(lambda: self._commit_watermarks(update))
+        return len(data)
+
+    async def _gather(
+        self,
+        client: BrightDataClient,
+        inputs: List[Dict[str, Any]],
+        job_id: Optional[int] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Cached or freshly collected records of prepared inputs; None if
+        collection failed. An empty list is a snapshot with no records (a
+        discovery input with nothing new, a search without matches).
+        """
+        if self.cache is not None:
+            return await self._collect_cached(client, inputs, job_id)
+        return await self._collect_fresh(client, inputs, job_id)
+
+    def _select_new(
+        self, data: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[WatermarkUpdate]]:
+        """
+        The new or changed records per the watermarks, and the update that
+        marks them seen, to be committed once they are saved.
+        """
+        if self.watermarks is None:
+            return data, None
+        return self.watermarks.select(data)
+
+    def _commit_watermarks(self, update: Optional[WatermarkUpdate]) -> None:
+        if update is not None:
+            self.watermarks.commit(update)
+
+    def resume(self) -> List[Optional[int]]:
+        """
+        Blocking entry point for resume_jobs().
+        """
+        return asyncio.run(self._resume_with_own_client())
+
+    async def _resume_with_own_client(self) -> List[Optional[int]]:
+        async with self._new_client() as client:
+            return await self.resume_jobs(client)
+
+    async def resume_jobs(
+        self, client: Optional[BrightDataClient] = None
+    ) -> List[Optional[int]]:
+        """
+        Finish every unfinished journaled job of this dataset.
+
+        Jobs with a snapshot_id are waited on and downloaded without a new
+        trigger; jobs that crashed before the trigger was confirmed are
+        triggered again with their recorded inputs. Resumed snapshots are
+        saved as downloaded into the recorded file. Returns the record count
+        of each job (None for failures).
+        """
+        if self.journal is None:
+            raise ValueError("resume requires a journal")
+        client = client or self.client
+        entries = self.journal.unfinished(self.namespace)
+        logging.info(f"Resuming {len(entries)} unfinished jobs ({self.namespace})")
+        return list(
+            await asyncio.gather(
+                *(
+                    self.save(
+                        entry.inputs,
+                        entry.filename,
+                        client,
+                        entry.output_format,
+                        job_id=entry.job_id,
+                        snapshot_id=entry.snapshot_id,
+                    )
+                    if entry.snapshot_id is not None
+                    else self._resume_batches(client, entry)
+                    for entry in entries
+                )
+            )
+        )
+
+    async def _resume_batches(self, client: BrightDataClient, entry: JournalEntry) -> Optional[int]:
+        """
+        Finish a job without a single snapshot: one that crashed before its
+        trigger, or a batched one. Recorded batches are downloaded again
+        from their snapshots; only batches without one are triggered.
+        """
+        data = await self._collect_fresh(client, entry.inputs, entry.job_id)
+        if data is None:
+            self._journal_failed(entry.job_id)
+            return None
+        if not self._save_data(data, entry.filename or self.DEFAULT_FILENAME, entry.output_format):
+            self._journal_failed(entry.job_id)
+            return None
+        self._store_records(data)
+        self._journal_finish(entry.job_id, len(data))
+        return len(data)
+
+    def _prepare_inputs(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Canonicalize input URLs and drop duplicates so no entity is paid twice.
+        """
+        if not self.canonicalize:
+            return inputs
+        unique = dedupe_inputs(inputs)
+        if len(unique) < len(inputs):
+            logging.info(f"Dropped {len(inputs) - len(unique)} duplicate inputs")
+        return unique
+
+    @property
+    def namespace(self) -> str:
+        """
+        Dataset id plus discovery mode, used to key the cache and the journal.
+        """
+        return f"{self.dataset_id}:{self.TRIGGER_PARAMS.get('discover_by', 'collect')}"
+
+    def _journal_begin(
+        self, inputs: List[Dict[str, Any]], filename: str, format: Optional[str] = None
+    ) -> Optional[int]:
+        if self.journal is None:
+            return None
+        return self.journal.begin(
+            self.namespace, self.dataset_id, inputs, filename, format or self.output_format
+        )
+
+    def _journal_finish(self, job_id: Optional[int], records: int) -> None:
+        if job_id is not None:
+            self.journal.finish(job_id, records)
+
+    def _journal_failed(self, job_id: Optional[int]) -> None:
+        if job_id is not None:
+            self.journal.set_status(job_id, STATUS_FAILED)
+
+    async def _collect_fresh(
+        self,
+        client: BrightDataClient,
+        inputs: List[Dict[str, Any]],
+        job_id: Optional[int] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Collect inputs in batches sized by self.batching, at most
+        max_in_flight snapshots at a time; records come back in input order.
+
+        With a journal every batch is a child job with its own snapshot_id,
+        and a resumed job reuses the batches it recorded. A failed batch
+        does not sink the others: their records are still returned (None
+        only if every batch failed) and the journal leaves the job partial.
+        """
+        batches = self._journaled_batches(job_id)
+        if batches is None:
+            batch_size = self.batching.batch_size(self.dataset_id, len(inputs))
+            if batch_size >= len(inputs):
+                return await self._collect_batch(client, inputs, job_id)
+            batches = [
+                (self._journal_batch(job_id, batch), batch, None)
+                for batch in split_batches(inputs, batch_size)
+            ]
+            if job_id is not None:
+                self.journal.set_status(job_id, JOURNAL_TRIGGERED, f"{len(batches)} batches")
+        batch_size = len(batches[0][1])
+        logging.info(
+            f"Collecting {len(inputs)} inputs in {len(batches)} batches of {batch_size} "
+            f"({self.batching.max_in_flight} in flight)"
+        )
+        semaphore = asyncio.Semaphore(self.batching.max_in_flight)
+
+        async def collect_batch(
+            batch_id: Optional[int], batch: List[Dict[str, Any]], snapshot_id: Optional[str]
+        ) -> Optional[List[Dict[str, Any]]]:
+            async with semaphore:
+                # A short tail batch says nothing about batch_size; leave it out of the history.
+                data = await self._collect_batch(
+                    client, batch, batch_id, snapshot_id, record=len(batch) == batch_size
+                )
+            if data is not None:
+                self._journal_finish(batch_id, len(data))
+            return data
+
+        tasks = [asyncio.ensure_future(collect_batch(*batch)) for batch in batches]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        merged: List[Dict[str, Any]] = []
+        failed = 0
+        for index, data in enumerate(results):
+            if data is None:
+                logging.error(f"Batch {index + 1}/{len(batches)} failed")
+                failed += 1
+            else:
+                merged.extend(data)
+        if failed == len(batches):
+            return None
+        if failed:
+            logging.warning(f"Keeping the records of {len(batches) - failed} of {len(batches)} batches")
+        return merged
+
+    def _journaled_batches(
+        self, job_id: Optional[int]
+    ) -> Optional[List[Tuple[int, List[Dict[str, Any]], Optional[str]]]]:
+        """
+        (batch job id, inputs, snapshot_id to reuse) of every batch a job
+        recorded, or None if it never was split. Failed batches get no
+        snapshot_id, so they are triggered again.
+        """
+        if job_id is None:
+            return None
+        batches = self.journal.batches(job_id)
+        if not batches:
+            return None
+        return [
+            (batch.job_id, batch.inputs, None if batch.status == STATUS_FAILED else batch.snapshot_id)
+            for batch in batches
+        ]
+
+    def _journal_batch(self, job_id: Optional[int], inputs: List[Dict[str, Any]]) -> Optional[int]:
+        if job_id is None:
+            return None
+        return self.journal.begin(self.namespace, self.dataset_id, inputs, parent_id=job_id)
+
+    async def _collect_batch(
+        self,
+        client: BrightDataClient,
+        inputs: List[Dict[str, Any]],
+        job_id: Optional[int] = None,
+        snapshot_id: Optional[str] = None,
+        record: bool = True,
+    ) -> Optional[List[Dict[str, Any]]]:
+        started = time.monotonic()
+        resumed = snapshot_id is not None
+        snapshot_id = await self._start_snapshot(client, inputs, job_id, snapshot_id)
+        if snapshot_id is None:
+            return None
+        data = await self._get_data(client, snapshot_id)
+        if data is None:
+            logging.error("Failed to retrieve data after collection completion")
+            return None
+        if record and not resumed and data:
+            self.batching.record(self.dataset_id, len(inputs), len(data), time.monotonic() - started)
+        return data
+
+    async def _collect_cached(
+        self,
+        client: BrightDataClient,
+        inputs: List[Dict[str, Any]],
+        job_id: Optional[int] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Trigger only inputs missing from the cache, then merge in input order.
+        """
+        cached, missing = self.cache.lookup(self.namespace, inputs)
+        logging.info(f"Cache: {len(inputs) - len(missing)} hits, {len(missing)} to collect")
+        fresh: Dict[str, List[Dict[str, Any]]] = {}
+        if missing:
+            data = await self._collect_fresh(client, missing, job_id)
+            if data is None:
+                return None
+            fresh = self.cache.store(self.namespace, missing, data)
+
+        merged: List[Dict[str, Any]] = []
+        for key in dict.fromkeys(input_key(item) for item in inputs):
+            merged.extend(cached.get(key) or fresh.get(key, []))
+        merged.extend(fresh.get("", []))
+        return merged
+
+    async def trigger(
+        self,
+        inputs: List[Dict[str, Any]],
+        client: Optional[BrightDataClient] = None,
+        job_id: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        Trigger a snapshot and wait until it is ready; return its id, or None.
+
+        Nothing is downloaded; pass the id to client.stream_snapshot() or
+        client.snapshot() to fetch the records.
+        """
+        client = client or self.client
+        if client is None:
+            async with self._new_client() as client:
+                return await self.trigger(inputs, client, job_id)
+        return await self._start_snapshot(client, self._prepare_inputs(inputs), job_id)
+
+    async def stream(
+        self,
+        inputs: List[Dict[str, Any]],
+        client: Optional[BrightDataClient] = None,
+        format: str = "ndjson",
+        job_id: Optional[int] = None,
+        snapshot_id: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Trigger a snapshot, wait for it and yield its records as they download.
+
+        Nothing is saved; memory stays bounded by the largest single record.
+        Passing an existing snapshot_id skips the trigger.
+        """
+        client = client or self.client
+        if client is None:
+            async with self._new_client() as client:
+                async for record in self.stream(inputs, client, format, job_id, snapshot_id):
+                    yield record
+            return
+
+        snapshot_id = await self._start_snapshot(
+            client, self._prepare_inputs(inputs), job_id, snapshot_id
+        )
+        if snapshot_id is None:
+            return
+        schedule = None
+        while True:
+            try:
+                async for record in client.stream_snapshot(snapshot_id, format=format):
+                    yield record
+                return
+            except SnapshotNotReady as e:
+                # Raised before the first record, so retrying repeats nothing.
+                schedule = schedule or self._build_schedule()
+                logging.info(f"{e}, retrying")
+                await asyncio.sleep(schedule.next_delay())
+
+    async def save(
+        self,
+        inputs: List[Dict[str, Any]],
+        filename: Optional[str] = None,
+        client: Optional[BrightDataClient] = None,
+        format: Optional[str] = None,
+        job_id: Optional[int] = None,
+        snapshot_id: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Stream a snapshot straight into an output sink.
+
+        Records are written as they download and the file only appears once
+        the whole snapshot is written. With a journal, the job is marked
+        downloading once the first record arrives; an interrupted download is
+        fetched again from the start on resume. Returns the record count, or None.
+        """
+        filename = filename or self.DEFAULT_FILENAME
+        format = format or self.output_format
+        if job_id is None:
+            job_id = self._journal_begin(inputs, filename, format)
+        pending: List[Dict[str, Any]] = []
+        try:
+            with open_sink(filename, format) as sink:
+                async for record in self.stream(inputs, client, job_id=job_id, snapshot_id=snapshot_id):
+                    sink.write(record)
+                    if self.store is not None:
+                        pending.append(record)
+                        if len(pending) >= self.store.batch_size:
+                            self._store_records(pending)
+                            pending = []
+                    if job_id is not None and sink.count == 1:
+                        self.journal.set_status(job_id, JOURNAL_DOWNLOADING)
+                if not sink.count:
+                    raise ValueError("snapshot returned no records")
+                self._store_records(pending)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, OSError) as e:
+            logging.error(f"Error saving data: {str(e)}")
+            self._journal_failed(job_id)
+            return None
+        self._journal_finish(job_id, sink.count)
+        logging.info(f"Data saved to {filename}")
+        logging.info(f"Collected {sink.count} {self.RECORD_NAME}")
+        return sink.count
+
+    def iter_records(
+        self, inputs: List[Dict[str, Any]], format: str = "ndjson"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Blocking generator over stream(), driven by a private event loop.
+        """
+        loop = asyncio.new_event_loop()
+        records = self.stream(inputs, format=format)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(records.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(records.aclose())
+            loop.close()
+
+    async def _start_snapshot(
+        self,
+        client: BrightDataClient,
+        inputs: List[Dict[str, Any]],
+        job_id: Optional[int] = None,
+        snapshot_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Trigger and wait for a snapshot; return its id once it is ready.
+
+        An existing snapshot_id (a resumed job) is only waited on.
+        """
+        start_time = time.time()
+        resumed = snapshot_id is not None
+        if not resumed:
+            logging.info(f"Starting collection for {len(inputs)} inputs ({self.dataset_id})")
+            trigger_response = await self._trigger_collection(client, inputs)
+            if not trigger_response or "snapshot_id" not in trigger_response:
+                logging.error("Failed to initiate data collection")
+                self._journal_failed(job_id)
+                return None
+            snapshot_id = trigger_response["snapshot_id"]
+            if job_id is not None:
+                self.journal.triggered(job_id, snapshot_id, inputs)
+            logging.info(f"Collection initiated: {snapshot_id}")
+        else:
+            logging.info(f"Resuming snapshot {snapshot_id}")
+
+        status = await self._wait_for_snapshot(
+            client, snapshot_id, start_time, len(inputs), resumed
+        )
+        if status != STATUS_READY:
+            logging.error(f"Collection failed with status: {status}")
+            self._journal_failed(job_id)
+            return None
+        if job_id is not None:
+            self.journal.set_status(job_id, JOURNAL_READY)
+        logging.info(f"Collection completed after {int(time.time() - start_time)} seconds")
+        return snapshot_id
+
+    async def _wait_for_snapshot(
+        self,
+        client: BrightDataClient,
+        snapshot_id: str,
+        start_time: float,
+        input_count: int,
+        resumed: bool = False,
+    ) -> str:
+        """
+        Block until the snapshot reaches a final status and return it.
+
+        With a shared poller the snapshot joins its single progress loop;
+        otherwise it is polled on its own following self.polling. A resumed
+        snapshot's duration is not recorded, since start_time is the resume
+        time rather than the trigger time.
+        """
+        if self.poller is not None:
+            return await self.poller.wait(
+                snapshot_id, self.dataset_id, input_count, resumed=resumed
+            )
+
+        schedule = self.polling.schedule(self.dataset_id, input_count, record=not resumed)
+        while True:
+            await asyncio.sleep(schedule.next_delay())
+            status = await self._check_status(client, snapshot_id)
+            if status in [STATUS_READY, STATUS_FAILED, STATUS_ERROR]:
+                schedule.finished(status)
+                return status
+            elapsed = int(time.time() - start_time)
+            logging.info(f"Status: {status} ({elapsed}s elapsed)")
+
+    async def _trigger_collection(
+        self, client: BrightDataClient, inputs: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            return await client.trigger(self.dataset_id, inputs, **self.TRIGGER_PARAMS)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"Failed to trigger collection: {str(e)}")
+            return None
+
+    async def _check_status(self, client: BrightDataClient, snapshot_id: str) -> str:
+        try:
+            progress = await client.progress(snapshot_id)
+            return progress.get("status", STATUS_ERROR)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"Error checking status: {str(e)}")
+            return STATUS_ERROR
+
+    async def _get_data(
+        self, client: BrightDataClient, snapshot_id: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        schedule = None
+        while True:
+            try:
+                return await client.snapshot(snapshot_id)
+            except SnapshotNotReady as e:
+                schedule = schedule or self._build_schedule()
+                logging.info(f"{e}, retrying")
+                await asyncio.sleep(schedule.next_delay())
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logging.error(f"Error retrieving data: {str(e)}")
+                return None
+
+    def _build_schedule(self) -> PollSchedule:
+        """
+        Retry schedule while a ready snapshot is still being built.
+
+        A fixed interval is kept as is; otherwise a fresh backoff is used, since
+        the learned ETA is for trigger-to-ready and has already passed.
+        """
+        if isinstance(self.polling, FixedPolling):
+            return self.polling.schedule(self.dataset_id, record=False)
+        return AdaptivePolling().schedule(self.dataset_id, record=False)
+
+    def _store_records(self, records: List[Dict[str, Any]]) -> None:
+        if self.store is not None and records:
+            stored = self.store.upsert(self.dataset_id, records)
+            logging.info(f"Stored {stored} {self.RECORD_NAME} in {self.store.path}")
+
+    def _save_data(
+        self, data: List[Dict[str, Any]], filename: str, format: Optional[str] = None
+    ) -> bool:
+        try:
+            with open_sink(filename, format or self.output_format) as sink:
+                sink.write_many(data)
+            logging.info(f"Data saved to {filename}")
+            logging.info(f"Collected {len(data)} {self.RECORD_NAME}")
+            return True
+        except Exception as e:
+            logging.error(f"Error saving data: {str(e)}")
+            return False
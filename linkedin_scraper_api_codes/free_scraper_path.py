@@ -0,0 +1,13 @@
+"""
+Puts free_scraper on sys.path.
+
+The counterpart of free_scraper/api_codes_path.py: the commands and the
+benchmark here drive the free scrapers, and importing this module first is
+the one place that makes them importable.
+"""
+from pathlib import Path
+import sys
+
+FREE_SCRAPER_DIR = str(Path(__file__).resolve().parent.parent / "free_scraper")
+if FREE_SCRAPER_DIR not in sys.path:
+    sys.path.append(FREE_SCRAPER_DIR)
@@ -0,0 +1,207 @@
+import json
+import sqlite3
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+DEFAULT_JOURNAL_PATH = "collector_journal.sqlite3"
+
+STATUS_PENDING = "pending"
+STATUS_TRIGGERED = "triggered"
+STATUS_READY = "ready"
+STATUS_DOWNLOADING = "downloading"
+STATUS_DONE = "done"
+STATUS_PARTIAL = "partial"
+STATUS_FAILED = "failed"
+
+UNFINISHED_STATUSES = (
+    STATUS_PENDING, STATUS_TRIGGERED, STATUS_READY, STATUS_DOWNLOADING, STATUS_PARTIAL
+)
+
+SELECT_JOBS = (
+    "SELECT job_id, namespace, dataset_id, inputs, snapshot_id, status, filename, "
+    "output_format, records, parent_id FROM jobs"
+)
+
+
+class JournalEntry(NamedTuple):
+    job_id: int
+    namespace: str
+    dataset_id: str
+    inputs: List[Dict[str, Any]]
+    snapshot_id: Optional[str]
+    status: str
+    filename: Optional[str]
+    output_format: Optional[str]
+    records: int
+    parent_id: Optional[int] = None
+
+
+class JobJournal:
+    """
+    Durable record of every trigger, so a restarted process resumes snapshots.
+
+    The jobs table holds the current state of each job (inputs, dataset,
+    snapshot_id, status, final record count); the events table is an
+    append-only log of every status transition. Each write is committed
+    immediately, so the snapshot_id survives a crash right after the trigger.
+
+    A run split into several triggers is one job with a child job per
+    batch, each with its own snapshot_id. Only top-level jobs are listed as
+    unfinished; a job finished while some of its batches are not is left
+    "partial", so resuming it only repeats the missing batches.
+    """
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                namespace TEXT NOT NULL,
+                dataset_id TEXT NOT NULL,
+                inputs TEXT NOT NULL,
+                snapshot_id TEXT,
+                status TEXT NOT NULL,
+                filename TEXT,
+                output_format TEXT,
+                records INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                parent_id INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS jobs_status ON jobs (namespace, status);
+            CREATE TABLE IF NOT EXISTS events (
+                job_id INTEGER NOT NULL,
+                at REAL NOT NULL,
+                status TEXT NOT NULL,
+                detail TEXT
+            );
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "parent_id" not in columns:
+            # Journals written before batched runs were journaled.
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN parent_id INTEGER")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_parent ON jobs (parent_id)")
+        self._conn.commit()
+
+    def __enter__(self) -> "JobJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def begin(
+        self,
+        namespace: str,
+        dataset_id: str,
+        inputs: List[Dict[str, Any]],
+        filename: Optional[str] = None,
+        output_format: Optional[str] = None,
+        parent_id: Optional[int] = None,
+    ) -> int:
+        now = time.time()
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (namespace, dataset_id, inputs, status, filename, "
+                "output_format, created_at, updated_at, parent_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    namespace,
+                    dataset_id,
+                    json.dumps(inputs, ensure_ascii=False),
+                    STATUS_PENDING,
+                    filename,
+                    output_format,
+                    now,
+                    now,
+                    parent_id,
+                ),
+            )
+            self._event(cursor.lastrowid, STATUS_PENDING, f"{len(inputs)} inputs")
+        return cursor.lastrowid
+
+    def triggered(self, job_id: int, snapshot_id: str, inputs: List[Dict[str, Any]]) -> None:
+        """
+        Record the snapshot_id together with the inputs actually sent.
+        """
+        with self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET snapshot_id = ?, inputs = ?, status = ?, updated_at = ? "
+                "WHERE job_id = ?",
+                (
+                    snapshot_id,
+                    json.dumps(inputs, ensure_ascii=False),
+                    STATUS_TRIGGERED,
+                    time.time(),
+                    job_id,
+                ),
+            )
+            self._event(job_id, STATUS_TRIGGERED, snapshot_id)
+
+    def set_status(self, job_id: int, status: str, detail: Optional[str] = None) -> None:
+        with self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                (status, time.time(), job_id),
+            )
+            self._event(job_id, status, detail)
+
+    def finish(self, job_id: int, records: int) -> None:
+        """
+        Mark a job done, or partial if any of its batches is not done.
+        """
+        missing = self._conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE parent_id = ? AND status != ?", (job_id, STATUS_DONE)
+        ).fetchone()[0]
+        status = STATUS_PARTIAL if missing else STATUS_DONE
+        detail = f"{records} records" + (f", {missing} batches missing" if missing else "")
+        with self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET records = ?, status = ?, updated_at = ? WHERE job_id = ?",
+                (records, status, time.time(), job_id),
+            )
+            self._event(job_id, status, detail)
+
+    def unfinished(self, namespace: Optional[str] = None) -> List[JournalEntry]:
+        """
+        Unfinished top-level jobs, oldest first.
+        """
+        query = (
+            f"{SELECT_JOBS} WHERE parent_id IS NULL "
+            f"AND status IN ({','.join('?' * len(UNFINISHED_STATUSES))})"
+        )
+        params: List[Any] = list(UNFINISHED_STATUSES)
+        if namespace is not None:
+            query += " AND namespace = ?"
+            params.append(namespace)
+        return self._entries(query + " ORDER BY job_id", params)
+
+    def batches(self, job_id: int) -> List[JournalEntry]:
+        """
+        The per-batch child jobs of a batched job, in input order.
+        """
+        return self._entries(f"{SELECT_JOBS} WHERE parent_id = ? ORDER BY job_id", [job_id])
+
+    def _entries(self, query: str, params: List[Any]) -> List[JournalEntry]:
+        rows = self._conn.execute(query, params).fetchall()
+        return [
+            JournalEntry(row[0], row[1], row[2], json.loads(row[3]), *row[4:])
+            for row in rows
+        ]
+
+    def history(self, job_id: int) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT at, status, detail FROM events WHERE job_id = ? ORDER BY rowid", (job_id,)
+        )
+        return [{"at": at, "status": status, "detail": detail} for at, status, detail in rows]
+
+    def _event(self, job_id: int, status: str, detail: Optional[str] = None) -> None:
+        self._conn.execute(
+            "INSERT INTO events (job_id, at, status, detail) VALUES (?, ?, ?, ?)",
+            (job_id, time.time(), status, detail),
+        )
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+linkedin-collect: one command line entry point for every collector.
+
+    linkedin-collect company_info --input companies.jsonl --out companies.ndjson
+    linkedin-collect jobs_by_keyword --input searches.csv --out jobs.csv.gz
+    linkedin-collect check_urls --input urls.txt --out checked.ndjson
+    linkedin-collect --list
+
+The API token is read from BRIGHTDATA_API_TOKEN (or API_TOKEN). Startup is
+kept short because orchestrators run this once per job: only the standard
+library is imported up front, and the collector module of the chosen
+subcommand (with aiohttp, or requests and bs4 for free_jobs) is
+imported after the arguments are parsed.
+"""
+import argparse
+import csv
+import importlib
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+TOKEN_ENV = "BRIGHTDATA_API_TOKEN"
+FALLBACK_TOKEN_ENV = "API_TOKEN"
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class Dataset(NamedTuple):
+    module: str
+    collector: str
+    description: str
+
+
+# Names only: a module is imported when its subcommand runs.
+DATASETS = {
+    "company_info": Dataset(
+        "linkedin_company_info_by_url", "LinkedInCompanyInfo", "company pages by URL"
+    ),
+    "profile_by_url": Dataset(
+        "linkedin_profile_by_url", "LinkedInProfileInfo", "profiles by URL"
+    ),
+    "profile_by_name": Dataset(
+        "linkedin_profile_by_name", "LinkedInProfileDiscovery", "profiles by first and last name"
+    ),
+    "posts_by_url": Dataset(
+        "linkedin_posts_by_url", "LinkedInPostCollector", "posts by URL"
+    ),
+    "posts_discover_by_url": Dataset(
+        "linkedin_posts_discover_by_url", "LinkedInArticleDiscovery", "articles of an author page"
+    ),
+    "posts_by_profile_url": Dataset(
+        "linkedin_posts_by_profile_url", "LinkedInPostDiscovery", "posts of a profile"
+    ),
+    "posts_by_company_url": Dataset(
+        "linkedin_posts_by_company_url", "LinkedInPostsCollector", "posts of a company"
+    ),
+    "jobs_by_url": Dataset(
+        "linkedin_jobs_by_url", "LinkedInJobsCollector", "job postings by URL"
+    ),
+    "jobs_by_keyword": Dataset(
+        "linkedin_jobs_by_keyword", "LinkedInJobsDiscovery", "job postings by keyword search"
+    ),
+    "jobs_by_search_url": Dataset(
+        "linkedin_jobs_by_search_url", "LinkedInJobsURLDiscovery", "job postings of a search URL"
+    ),
+}
+
+# Subcommands backed by the free scraper instead of the API.
+FREE_COMMANDS = {
+    "free_jobs": "public job search without an API token (keywords, location, max_jobs)",
+    "check_urls": "check that profile and company URLs exist before collecting them",
+}
+
+
+def read_inputs(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Input rows, one at a time, from a JSONL/NDJSON file, a CSV file with a
+    header row, or a text file of URLs (one per line, read as {"url": ...}).
+
+    "-" reads JSONL from stdin. Blank lines and empty CSV cells are skipped.
+    """
+    name = path.lower()
+    f = sys.stdin if path == "-" else open(path, "r", encoding="utf-8", newline="")
+    try:
+        if name.endswith(".csv"):
+            for row in csv.DictReader(f):
+                row = {key: value for key, value in row.items() if key and value not in ("", None)}
+                if row:
+                    yield row
+        elif path == "-" or name.endswith((".jsonl", ".ndjson")):
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"{path}, line {line_number}: {str(e)}")
+        else:
+            for line in f:
+                url = line.strip()
+                if url and not url.startswith("#"):
+                    yield {"url": url}
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def chunked(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def api_token() -> Optional[str]:
+    return os.environ.get(TOKEN_ENV) or os.environ.get(FALLBACK_TOKEN_ENV)
+
+
+async def collect_to_file(
+    collector: Any,
+    rows: Iterable[Dict[str, Any]],
+    filename: str,
+    format: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Optional[int]:
+    """
+    Collect the inputs chunk by chunk into one output file.
+
+    Only one chunk of inputs is held at a time; each is triggered (in
+    batches, per the collector's batching) and its records are appended to
+    the sink. A chunk without records is fine; the file only appears if no
+    chunk failed. Returns the record count, or None on failure.
+    """
+    from output_sinks import open_sink
+
+    sink = open_sink(filename, format)
+    try:
+        for chunk in chunked(rows, chunk_size):
+            if await collector.collect_into(chunk, sink) is None:
+                sink.abort()
+                return None
+    except BaseException:
+        sink.abort()
+        raise
+    if not sink.count:
+        sink.abort()
+        return 0
+    sink.close()
+    return sink.count
+
+
+def run_dataset(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    token = api_token()
+    if not token:
+        parser.error(f"set the {TOKEN_ENV} environment variable to your API token")
+
+    import asyncio
+
+    dataset = DATASETS[args.command]
+    collector_class = getattr(importlib.import_module(dataset.module), dataset.collector)
+    kwargs: Dict[str, Any] = {"output_format": args.format}
+    if args.store:
+        from record_store import RecordStore
+
+        kwargs["store"] = RecordStore(args.store)
+    if args.cache:
+        from result_cache import ResultCache
+
+        kwargs["cache"] = ResultCache(args.cache)
+    if args.batch_size or args.max_in_flight:
+        from batching import FixedBatching
+
+        kwargs["batching"] = FixedBatching(args.batch_size, args.max_in_flight or 4)
+    collector = collector_class(token, **kwargs)
+
+    filename = args.out or collector.DEFAULT_FILENAME
+    count = asyncio.run(
+        collect_to_file(collector, read_inputs(args.input), filename, args.format, args.chunk_size)
+    )
+    if count is None:
+        print(f"Collection failed; {filename} was not written", file=sys.stderr)
+        return 1
+    if not count:
+        print(f"No {collector.RECORD_NAME} collected", file=sys.stderr)
+        return 1
+    print(f"Saved {count} {collector.RECORD_NAME} to {filename}")
+    return 0
+
+
+def run_free_jobs(args: argparse.Namespace) -> int:
+    import free_scraper_path  # noqa: F401
+    from job_index import JobIndex
+    from jobs_scraper import LinkedInJobsScraper
+
+    # One index for all searches, so a job found by several is written once.
+    scraper = LinkedInJobsScraper(job_index=JobIndex())
+
+    def jobs() -> Iterator[Any]:
+        for search in read_inputs(args.input):
+            yield from scraper.iter_jobs(
+                search["keywords"], search.get("location", ""), int(search.get("max_jobs", 100))
+            )
+
+    count = scraper.save_results(jobs(), args.out or "linkedin_jobs.json", args.format)
+    return 0 if count else 1
+
+
+def run_check_urls(args: argparse.Namespace) -> int:
+    import free_scraper_path  # noqa: F401
+    import asyncio
+
+    from profile_checker import check_urls_to_file
+
+    urls = (row["url"] for row in read_inputs(args.input))
+    counts = asyncio.run(check_urls_to_file(urls, args.out or "url_check_results.ndjson"))
+    print(f"{counts['live']} live, {counts['dead']} dead, {counts['unknown']} unknown")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="linkedin-collect",
+        description="Collect a LinkedIn dataset for the inputs in a JSONL, CSV or URL list file.",
+    )
+    parser.add_argument("command", nargs="?", choices=[*DATASETS, *FREE_COMMANDS], metavar="dataset")
+    parser.add_argument("--list", action="store_true", help="list the datasets and exit")
+    parser.add_argument("--input", "-i", help='.jsonl/.ndjson, .csv or a URL list; "-" for JSONL on stdin')
+    parser.add_argument("--out", "-o", help="output file; .json, .ndjson/.jsonl or .csv, optionally .gz")
+    parser.add_argument("--format", choices=["json", "ndjson", "csv"], help="output format (default: from --out)")
+    parser.add_argument("--store", metavar="PATH", help="also upsert records into this SQLite store")
+    parser.add_argument("--cache", metavar="PATH", help="reuse records from this result cache")
+    parser.add_argument("--batch-size", type=int, help="inputs per trigger (default: adaptive)")
+    parser.add_argument("--max-in-flight", type=int, help="triggers running at once")
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f"inputs read from --input at a time (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.list:
+        for name, dataset in DATASETS.items():
+            print(f"{name:<24}{dataset.description}")
+        for name, description in FREE_COMMANDS.items():
+            print(f"{name:<24}{description}")
+        return 0
+    if not args.command:
+        parser.error("a dataset is required (see --list)")
+    if not args.input:
+        parser.error("--input is required")
+
+    try:
+        if args.command == "free_jobs":
+            return run_free_jobs(args)
+        if args.command == "check_urls":
+            return run_check_urls(args)
+        return run_dataset(args, parser)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
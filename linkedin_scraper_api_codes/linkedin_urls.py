@@ -0,0 +1,156 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+CANONICAL_HOST = "www.linkedin.com"
+
+# Query parameters that only track where a click came from.
+TRACKING_PARAMS = {
+    "trk",
+    "trkInfo",
+    "refId",
+    "trackingId",
+    "lipi",
+    "lici",
+    "original_referer",
+    "position",
+    "pageNum",
+    "currentJobId",
+    "lg",
+    "originalSubdomain",
+}
+
+_PROFILE_RE = re.compile(r"^/(?:in|pub)/([^/]+)")
+_COMPANY_RE = re.compile(r"^/(?:organization-guest/)?(company|school|showcase)/([^/]+)")
+_JOB_VIEW_RE = re.compile(r"^/jobs/view/(?:[^/]*?-)?(\d+)(?:/|$)")
+_ACTIVITY_RE = re.compile(r"activity[-:](\d{10,})")
+_ARTICLE_RE = re.compile(r"^/pulse/([^/]+)")
+_AUTHOR_RE = re.compile(r"^/today/author/([^/]+)")
+
+
+def _is_linkedin(host: str) -> bool:
+    return host == "linkedin.com" or host.endswith(".linkedin.com")
+
+
+@lru_cache(maxsize=65536)
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a LinkedIn URL so variants of one entity compare equal.
+
+    Country subdomains (it.linkedin.com) become www.linkedin.com, the scheme
+    becomes https, fragments, tracking parameters and trailing slashes are
+    dropped, and profile/company URLs lose their sub-pages (/about, /posts).
+    Other query parameters (search keywords, filters) are kept in sorted
+    order, except on job postings, which are identified by their id alone.
+    Slugs keep their case. Non-LinkedIn URLs are only stripped of
+    surrounding whitespace.
+    """
+    stripped = url.strip()
+    parts = urlsplit(stripped if "://" in stripped else f"https://{stripped}")
+    host = parts.netloc.lower().split("@")[-1].split(":")[0]
+    if not _is_linkedin(host):
+        return stripped
+
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/") or "/"
+    query = ""
+
+    profile = _PROFILE_RE.match(path)
+    company = _COMPANY_RE.match(path)
+    if profile:
+        path = f"/{path.split('/')[1]}/{profile.group(1)}"
+    elif company:
+        path = f"/{company.group(1)}/{company.group(2)}"
+    if not _JOB_VIEW_RE.match(path):
+        # Search and collection pages: the filters are the input.
+        params = [
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=False)
+            if k not in TRACKING_PARAMS and not k.startswith("trk")
+        ]
+        query = urlencode(sorted(params))
+
+    return urlunsplit(("https", CANONICAL_HOST, path, query, ""))
+
+
+def url_kind(url: str) -> str:
+    """
+    Classify a URL: profile, company, job, job_search, post, article, author or other.
+    """
+    path = urlsplit(canonicalize_url(url)).path
+    if _PROFILE_RE.match(path):
+        return "profile"
+    if _COMPANY_RE.match(path):
+        return "company"
+    if _JOB_VIEW_RE.match(path):
+        return "job"
+    if path.startswith("/jobs"):
+        return "job_search"
+    if _ACTIVITY_RE.search(path):
+        return "post"
+    if _ARTICLE_RE.match(path):
+        return "article"
+    if _AUTHOR_RE.match(path):
+        return "author"
+    return "other"
+
+
+def job_id(url: str) -> Optional[str]:
+    """
+    The numeric LinkedIn job id of a /jobs/view/ URL, if any.
+    """
+    match = _JOB_VIEW_RE.match(urlsplit(canonicalize_url(url)).path)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=65536)
+def entity_key(url: str) -> str:
+    """
+    Identity of the entity behind a URL, stable across URL variants.
+
+    Jobs are keyed by job id and posts by activity id, so slugged and bare
+    URLs of the same job or post collapse; anything else uses its canonical
+    URL.
+    """
+    canonical = canonicalize_url(url)
+    path = urlsplit(canonical).path
+    job = _JOB_VIEW_RE.match(path)
+    if job:
+        return f"job:{job.group(1)}"
+    activity = _ACTIVITY_RE.search(path)
+    if activity:
+        return f"post:{activity.group(1)}"
+    return canonical
+
+
+def canonicalize_input(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of a trigger input with its `url` canonicalized.
+    """
+    url = item.get("url")
+    if not isinstance(url, str):
+        return item
+    return {**item, "url": canonicalize_url(url)}
+
+
+def dedupe_inputs(items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Canonicalize input URLs and drop repeated inputs, keeping first occurrences.
+
+    Two inputs are duplicates when they point to the same entity and all
+    their other fields match.
+    """
+    seen = set()
+    unique = []
+    for item in items:
+        item = canonicalize_input(item)
+        url = item.get("url")
+        key = (
+            entity_key(url) if isinstance(url, str) else None,
+            tuple(sorted((k, repr(v)) for k, v in item.items() if k != "url")),
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(item)
+    return unique
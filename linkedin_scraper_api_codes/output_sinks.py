@@ -0,0 +1,203 @@
+import csv
+import gzip
+import io
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+FORMAT_JSON = "json"
+FORMAT_NDJSON = "ndjson"
+FORMAT_CSV = "csv"
+
+
+class OutputSink:
+    """
+    Append-only record writer with atomic finalize.
+
+    Records go to `<filename>.part` in batches; close() flushes the last
+    batch and renames the temp file over `filename`, abort() removes it. Used
+    as a context manager, an exception aborts so a crash never leaves a
+    truncated output file behind. Callbacks registered with on_close() run
+    only once the file is in place.
+    """
+
+    def __init__(self, filename: str, compress: Optional[bool] = None, batch_size: int = 1000):
+        self.filename = filename
+        self.tmp_filename = f"{filename}.part"
+        self.compress = filename.endswith(".gz") if compress is None else compress
+        self.batch_size = batch_size
+        self.count = 0
+        self._batch: List[str] = []
+        self._on_close: List[Callable[[], None]] = []
+        if self.compress:
+            self._file = gzip.open(self.tmp_filename, "wt", encoding="utf-8")
+        else:
+            self._file = open(self.tmp_filename, "w", encoding="utf-8")
+        self._write_header()
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._batch.append(self._encode(record))
+        self.count += 1
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.write(record)
+
+    def on_close(self, callback: Callable[[], None]) -> None:
+        """
+        Run `callback` after a successful close(); dropped on abort().
+        """
+        self._on_close.append(callback)
+
+    def flush(self) -> None:
+        if self._batch:
+            self._file.write("".join(self._batch))
+            self._batch.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._write_footer()
+        self._file.close()
+        os.replace(self.tmp_filename, self.filename)
+        callbacks, self._on_close = self._on_close, []
+        for callback in callbacks:
+            callback()
+
+    def abort(self) -> None:
+        self._on_close.clear()
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self.tmp_filename):
+            os.remove(self.tmp_filename)
+
+    def _write_header(self) -> None:
+        pass
+
+    def _write_footer(self) -> None:
+        pass
+
+    def _encode(self, record: Dict[str, Any]) -> str:
+        raise NotImplementedError
+
+
+class NDJSONSink(OutputSink):
+    """
+    Compact one-record-per-line output (.ndjson/.jsonl, optionally .gz).
+    """
+
+    def _encode(self, record: Dict[str, Any]) -> str:
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class JSONArraySink(OutputSink):
+    """
+    The historical pretty-printed JSON array, written incrementally.
+
+    The output is byte-identical to json.dump(records, f, indent=2,
+    ensure_ascii=False).
+    """
+
+    def __init__(self, filename: str, compress: Optional[bool] = None, batch_size: int = 1000, indent: int = 2):
+        self.indent = indent
+        super().__init__(filename, compress=compress, batch_size=batch_size)
+
+    def _encode(self, record: Dict[str, Any]) -> str:
+        body = json.dumps(record, indent=self.indent, ensure_ascii=False)
+        pad = " " * self.indent
+        separator = "\n" if self.count == 0 else ",\n"
+        return separator + pad + body.replace("\n", "\n" + pad)
+
+    def _write_header(self) -> None:
+        self._file.write("[")
+
+    def _write_footer(self) -> None:
+        self._file.write("\n]" if self.count else "]")
+
+
+class CSVSink(OutputSink):
+    """
+    One row per record under a header line (.csv, optionally .gz).
+
+    Columns come from `fieldnames`, or from the first record's keys. Keys
+    outside the columns are dropped, missing ones left empty, and nested
+    values (lists, dicts) are written as JSON.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        compress: Optional[bool] = None,
+        batch_size: int = 1000,
+        fieldnames: Optional[Iterable[str]] = None,
+    ):
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self._buffer = io.StringIO()
+        self._writer: Optional[csv.DictWriter] = None
+        super().__init__(filename, compress=compress, batch_size=batch_size)
+
+    def _row_writer(self) -> csv.DictWriter:
+        if self._writer is None:
+            self._writer = csv.DictWriter(
+                self._buffer, fieldnames=self.fieldnames, extrasaction="ignore", lineterminator="\n"
+            )
+            self._writer.writeheader()
+        return self._writer
+
+    def _take(self) -> str:
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+
+    def _write_header(self) -> None:
+        if self.fieldnames:
+            self._row_writer()
+            self._file.write(self._take())
+
+    def _encode(self, record: Dict[str, Any]) -> str:
+        if self.fieldnames is None:
+            self.fieldnames = list(record)
+        self._row_writer().writerow(
+            {
+                key: json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+                for key, value in record.items()
+            }
+        )
+        return self._take()
+
+
+def detect_format(filename: str) -> str:
+    name = filename[:-3] if filename.endswith(".gz") else filename
+    if name.endswith((".ndjson", ".jsonl")):
+        return FORMAT_NDJSON
+    if name.endswith(".csv"):
+        return FORMAT_CSV
+    return FORMAT_JSON
+
+
+def open_sink(filename: str, format: Optional[str] = None, **kwargs: Any) -> OutputSink:
+    """
+    Open the sink matching `format`, or the file extension when omitted.
+    """
+    format = format or detect_format(filename)
+    if format in (FORMAT_NDJSON, "jsonl"):
+        return NDJSONSink(filename, **kwargs)
+    if format == FORMAT_JSON:
+        return JSONArraySink(filename, **kwargs)
+    if format == FORMAT_CSV:
+        return CSVSink(filename, **kwargs)
+    raise ValueError(f"Unsupported output format: {format}")
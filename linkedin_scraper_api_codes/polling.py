@@ -0,0 +1,214 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Any, Iterable, Optional, Tuple
+
+
+def linear_fit(samples: Iterable[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    """
+    Least-squares (intercept, slope) of (inputs, seconds) samples, both kept
+    non-negative; None without samples.
+    """
+    samples = list(samples)
+    if not samples:
+        return None
+    n = len(samples)
+    mean_x = sum(x for x, _ in samples) / n
+    mean_y = sum(y for _, y in samples) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in samples)
+    if var_x == 0:
+        # Every run had the same size: use the mean duration as overhead.
+        return mean_y, 0.0
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in samples) / var_x
+    slope = max(slope, 0.0)
+    return max(mean_y - slope * mean_x, 0.0), slope
+
+
+class FixedPolling:
+    """
+    Poll every `interval` seconds, the historical behaviour of the collectors.
+    """
+
+    def __init__(self, interval: float = 5):
+        self.interval = interval
+
+    def schedule(self, dataset_id: str, input_count: int = 0, record: bool = True) -> "PollSchedule":
+        return PollSchedule(self, dataset_id, input_count, record)
+
+    def next_delay(self, schedule: "PollSchedule") -> float:
+        return self.interval
+
+    def record(self, dataset_id: str, input_count: int, duration: float, polls: int) -> None:
+        pass
+
+
+class AdaptivePolling:
+    """
+    Backoff polling that learns how long snapshots take.
+
+    Without history the first polls come quickly and back off exponentially
+    with jitter. Once a dataset has completed runs, the expected duration for
+    the given input count is estimated with a linear fit
+    (overhead + seconds_per_input * inputs) and the first poll is scheduled
+    just before that estimate. History can be persisted to a JSON file and
+    stats() exposes the fitted numbers and poll counts for tuning.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.5,
+        max_interval: float = 30,
+        backoff_factor: float = 1.6,
+        jitter: float = 0.2,
+        eta_lead: float = 0.9,
+        history_size: int = 50,
+        history_path: Optional[str] = None,
+    ):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.eta_lead = eta_lead
+        self.history_size = history_size
+        self.history_path = history_path
+        self._history: Dict[str, Deque[Tuple[int, float]]] = {}
+        self._polls: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        if history_path and os.path.exists(history_path):
+            self._load()
+
+    def schedule(self, dataset_id: str, input_count: int = 0, record: bool = True) -> "PollSchedule":
+        return PollSchedule(self, dataset_id, input_count, record)
+
+    def estimate(self, dataset_id: str, input_count: int) -> Optional[float]:
+        """
+        Expected seconds from trigger to ready, or None without history.
+        """
+        fit = self._fit(dataset_id)
+        if fit is None:
+            return None
+        overhead, per_input = fit
+        return max(0.0, overhead + per_input * input_count)
+
+    def next_delay(self, schedule: "PollSchedule") -> float:
+        elapsed = schedule.elapsed
+        eta = self.estimate(schedule.dataset_id, schedule.input_count)
+        if eta is not None and elapsed < eta * self.eta_lead:
+            delay = eta * self.eta_lead - elapsed
+        else:
+            # Past the expected finish (or no estimate): back off from a short
+            # interval so a late snapshot is still noticed quickly.
+            delay = min(
+                self.max_interval,
+                self.initial_interval * self.backoff_factor ** schedule.backoff_step,
+            )
+            schedule.backoff_step += 1
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def record(self, dataset_id: str, input_count: int, duration: float, polls: int) -> None:
+        with self._lock:
+            samples = self._history.setdefault(dataset_id, deque(maxlen=self.history_size))
+            samples.append((input_count, duration))
+            counters = self._polls.setdefault(dataset_id, {"runs": 0, "polls": 0})
+            counters["runs"] += 1
+            counters["polls"] += polls
+        if self.history_path:
+            self._save()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-dataset fitted overhead/seconds-per-input and polling counters.
+        """
+        result = {}
+        # One consistent copy of history and counters; record() may run meanwhile.
+        with self._lock:
+            history = {k: list(v) for k, v in self._history.items()}
+            polls = {k: dict(v) for k, v in self._polls.items()}
+        for dataset_id, samples in history.items():
+            fit = linear_fit(samples)
+            counters = polls.get(dataset_id, {"runs": 0, "polls": 0})
+            durations = [d for _, d in samples]
+            result[dataset_id] = {
+                "samples": len(durations),
+                "overhead_seconds": round(fit[0], 3) if fit else None,
+                "seconds_per_input": round(fit[1], 5) if fit else None,
+                "mean_duration": round(sum(durations) / len(durations), 3),
+                "runs": counters["runs"],
+                "polls_per_run": round(counters["polls"] / counters["runs"], 2)
+                if counters["runs"]
+                else None,
+            }
+        return result
+
+    def _fit(self, dataset_id: str) -> Optional[Tuple[float, float]]:
+        with self._lock:
+            samples = list(self._history.get(dataset_id, ()))
+        return linear_fit(samples)
+
+    def _load(self) -> None:
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (IOError, ValueError) as e:
+            logging.warning(f"Ignoring polling history {self.history_path}: {str(e)}")
+            return
+        for dataset_id, samples in stored.get("history", {}).items():
+            self._history[dataset_id] = deque(
+                (tuple(s) for s in samples), maxlen=self.history_size
+            )
+        self._polls.update(stored.get("polls", {}))
+
+    def _save(self) -> None:
+        with self._lock:
+            stored = {
+                "history": {k: list(v) for k, v in self._history.items()},
+                "polls": self._polls,
+            }
+        tmp_path = f"{self.history_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stored, f)
+            os.replace(tmp_path, self.history_path)
+        except IOError as e:
+            logging.warning(f"Could not save polling history: {str(e)}")
+
+
+class PollSchedule:
+    """
+    Polling state of a single snapshot, created when it is triggered.
+
+    With record=False (a snapshot resumed after a restart, whose trigger
+    time is unknown) its duration is not added to the strategy's history.
+    """
+
+    def __init__(self, strategy, dataset_id: str, input_count: int, record: bool = True):
+        self.strategy = strategy
+        self.dataset_id = dataset_id
+        self.input_count = input_count
+        self.record = record
+        self.started = time.monotonic()
+        self.polls = 0
+        self.backoff_step = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def next_delay(self) -> float:
+        """
+        Seconds to wait before the next progress request.
+        """
+        delay = self.strategy.next_delay(self)
+        self.polls += 1
+        return delay
+
+    def finished(self, status: str) -> None:
+        if status == "ready" and self.record:
+            self.strategy.record(self.dataset_id, self.input_count, self.elapsed, self.polls)
+
+
+DEFAULT_POLLING = AdaptivePolling()
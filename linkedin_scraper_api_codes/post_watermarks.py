@@ -0,0 +1,164 @@
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from linkedin_urls import entity_key
+from result_cache import record_input
+
+DEFAULT_WATERMARK_PATH = "post_watermarks.sqlite3"
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.000Z"
+
+# Fields whose change makes an already seen post worth emitting again.
+# Engagement counters are left out on purpose: they change on every run.
+CHANGE_FIELDS = ("title", "headline", "post_text", "hashtags", "images", "videos", "embedded_links")
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def post_digest(record: Dict[str, Any], fields: Tuple[str, ...] = CHANGE_FIELDS) -> str:
+    content = json.dumps([record.get(f) for f in fields], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class PostWatermarks:
+    """
+    Per-source watermark for incremental post discovery.
+
+    For every company or profile URL it keeps the latest `date_posted` seen
+    and a digest per post id. narrow() moves each input's start_date up to
+    the watermark (minus `overlap` to catch late edits), and select() keeps
+    only posts that are new or whose content changed; commit() then marks
+    them seen and advances the watermark.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_WATERMARK_PATH,
+        overlap: timedelta = timedelta(days=1),
+        change_fields: Tuple[str, ...] = CHANGE_FIELDS,
+    ):
+        self.path = path
+        self.overlap = overlap
+        self.change_fields = change_fields
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS watermarks (
+                source TEXT PRIMARY KEY,
+                latest_date TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS seen_posts (
+                source TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                PRIMARY KEY (source, post_id)
+            );
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "PostWatermarks":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def watermark(self, source_url: str) -> Optional[datetime]:
+        row = self._conn.execute(
+            "SELECT latest_date FROM watermarks WHERE source = ?", (entity_key(source_url),)
+        ).fetchone()
+        return _parse_date(row[0]) if row else None
+
+    def narrow(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Limit each input to the window since its source's watermark.
+        """
+        narrowed = []
+        for item in inputs:
+            url = item.get("url")
+            latest = self.watermark(url) if isinstance(url, str) else None
+            if latest is None:
+                narrowed.append(item)
+                continue
+            start = latest - self.overlap
+            requested = _parse_date(item.get("start_date", ""))
+            if requested is None or requested < start:
+                item = {**item, "start_date": start.strftime(DATE_FORMAT)}
+            narrowed.append(item)
+        return narrowed
+
+    def select(self, records: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], "WatermarkUpdate"]:
+        """
+        Split out the new or changed posts without recording anything.
+
+        Returns the posts and the update that marks them seen; pass it to
+        commit() once the posts are safely written, so a failed save leaves
+        them to be collected again.
+        """
+        fresh = []
+        seen: Dict[Tuple[str, str], str] = {}
+        latest: Dict[str, datetime] = {}
+        for record in records:
+            source_input = record_input(record) or {}
+            source_url = source_input.get("url")
+            post_id = record.get("id")
+            if not isinstance(source_url, str) or post_id is None:
+                fresh.append(record)
+                continue
+            source = entity_key(source_url)
+            digest = post_digest(record, self.change_fields)
+            key = (source, str(post_id))
+            if key not in seen:
+                row = self._conn.execute(
+                    "SELECT digest FROM seen_posts WHERE source = ? AND post_id = ?", key
+                ).fetchone()
+                if row is not None:
+                    seen[key] = row[0]
+            if seen.get(key) != digest:
+                fresh.append(record)
+                seen[key] = digest
+            posted = _parse_date(record.get("date_posted") or "")
+            if posted is not None and (source not in latest or posted > latest[source]):
+                latest[source] = posted
+        return fresh, WatermarkUpdate(seen, latest)
+
+    def commit(self, update: "WatermarkUpdate") -> None:
+        """
+        Record the posts of a select() as seen and advance the watermarks.
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen_posts (source, post_id, digest) VALUES (?, ?, ?)",
+                [(source, post_id, digest) for (source, post_id), digest in update.seen.items()],
+            )
+            self._conn.executemany(
+                "INSERT INTO watermarks (source, latest_date) VALUES (?, ?) "
+                "ON CONFLICT(source) DO UPDATE SET latest_date = MAX(latest_date, excluded.latest_date)",
+                [(source, posted.strftime(DATE_FORMAT)) for source, posted in update.latest.items()],
+            )
+
+    def filter(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return only new or changed posts and record them as seen right away.
+        """
+        fresh, update = self.select(records)
+        self.commit(update)
+        return fresh
+
+
+class WatermarkUpdate(NamedTuple):
+    # (source, post_id) -> content digest
+    seen: Dict[Tuple[str, str], str]
+    # source -> latest date_posted
+    latest: Dict[str, datetime]
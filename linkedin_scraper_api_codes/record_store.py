@@ -0,0 +1,317 @@
+import html
+import json
+import re
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from linkedin_urls import canonicalize_url
+
+DEFAULT_STORE_PATH = "linkedin_data.sqlite3"
+DEFAULT_BATCH_SIZE = 10000
+
+
+class TableSchema(NamedTuple):
+    table: str
+    # Natural id fields, first non-empty one wins.
+    keys: Tuple[str, ...]
+    # Scalar fields copied into their own columns, all indexed.
+    columns: Tuple[str, ...]
+    # Text fields indexed for full-text search (FTS5 table <table>_fts).
+    text_fields: Tuple[str, ...] = ()
+
+
+# dataset_id -> table. Every collector of a dataset (collect or any
+# discover_by mode) shares its table, so a profile found by name and later
+# collected by URL is one row.
+SCHEMAS = {
+    "gd_l1viktl72bvl7bjuj0": TableSchema(
+        "profiles",
+        ("linkedin_num_id", "id"),
+        ("id", "url", "name", "current_company_name", "country_code"),
+    ),
+    "gd_l1vikfnt1wgvvqz95w": TableSchema(
+        "companies",
+        ("company_id", "id"),
+        ("id", "url", "name", "industries", "country_code"),
+    ),
+    "gd_lyy3tktm25m4avu764": TableSchema(
+        "posts",
+        ("id",),
+        ("url", "user_id", "use_url", "date_posted", "post_type"),
+        ("post_text", "headline", "hashtags"),
+    ),
+    "gd_lpfll7v5hcqtkxl6l": TableSchema(
+        "jobs",
+        ("job_posting_id",),
+        ("url", "company_id", "company_name", "job_location", "job_posted_date", "country_code"),
+        ("job_summary", "job_description_formatted"),
+    ),
+}
+
+# Columns holding URLs; stored canonicalized so URL variants match.
+URL_COLUMNS = {"url", "use_url"}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def fts_text(value: Optional[str]) -> Optional[str]:
+    """
+    What gets indexed for a text field: markup stripped, entities decoded.
+
+    Registered as an SQL function, since the index triggers call it.
+    """
+    if value is None or "<" not in value:
+        return value
+    return html.unescape(_TAG_RE.sub(" ", value))
+
+
+def fts_quote(text: str) -> str:
+    """
+    FTS5 query matching every whitespace-separated term of `text` literally.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+class RecordStore:
+    """
+    SQLite tables of snapshot records, one per dataset, upserted by natural key.
+
+    Each row keeps the full record as JSON next to a few indexed lookup
+    columns. Records are written with executemany in transactions of
+    `batch_size` rows. A record replaces the stored one unless its
+    `timestamp` is older, so replaying an old snapshot never undoes a
+    newer one. Records without a natural key (error records) are skipped.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self.skipped = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.create_function("fts_text", 1, fts_text, deterministic=True)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for schema in SCHEMAS.values():
+                self._create_table(schema)
+
+    def __enter__(self) -> "RecordStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _create_table(self, schema: TableSchema) -> None:
+        columns = "".join(f", {column} TEXT" for column in schema.columns)
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {schema.table} (
+                record_key TEXT PRIMARY KEY{columns},
+                timestamp TEXT,
+                first_seen REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                record TEXT NOT NULL
+            )
+            """
+        )
+        for column in schema.columns:
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {schema.table}_{column} ON {schema.table} ({column})"
+            )
+        if schema.text_fields:
+            self._create_fts(schema)
+
+    def _create_fts(self, schema: TableSchema) -> None:
+        """
+        FTS5 table over the text fields, kept in step with the records table
+        by triggers: every upsert reindexes its row in the same transaction.
+        """
+        fts = f"{schema.table}_fts"
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+        ).fetchone()
+        if exists:
+            return
+        fields = ", ".join(schema.text_fields)
+        values = ", ".join(
+            f"fts_text(json_extract(new.record, '$.{field}'))" for field in schema.text_fields
+        )
+        self._conn.executescript(
+            f"""
+            CREATE VIRTUAL TABLE {fts} USING fts5({fields});
+            CREATE TRIGGER {fts}_insert AFTER INSERT ON {schema.table} BEGIN
+                INSERT INTO {fts} (rowid, {fields}) VALUES (new.rowid, {values});
+            END;
+            CREATE TRIGGER {fts}_update AFTER UPDATE OF record ON {schema.table} BEGIN
+                DELETE FROM {fts} WHERE rowid = old.rowid;
+                INSERT INTO {fts} (rowid, {fields}) VALUES (new.rowid, {values});
+            END;
+            CREATE TRIGGER {fts}_delete AFTER DELETE ON {schema.table} BEGIN
+                DELETE FROM {fts} WHERE rowid = old.rowid;
+            END;
+            """
+        )
+        # Index whatever a store created before full-text search existed.
+        self._conn.execute(
+            f"INSERT INTO {fts} (rowid, {fields}) SELECT rowid, "
+            + ", ".join(
+                f"fts_text(json_extract(record, '$.{field}'))" for field in schema.text_fields
+            )
+            + f" FROM {schema.table}"
+        )
+
+    @staticmethod
+    def schema(dataset_id: str) -> TableSchema:
+        if dataset_id not in SCHEMAS:
+            raise ValueError(f"No table for dataset {dataset_id}")
+        return SCHEMAS[dataset_id]
+
+    @staticmethod
+    def record_key(schema: TableSchema, record: Dict[str, Any]) -> Optional[str]:
+        for field in schema.keys:
+            value = record.get(field)
+            if value not in ("", None):
+                return str(value)
+        return None
+
+    @staticmethod
+    def _column_value(column: str, value: Any) -> Optional[str]:
+        if value in ("", None):
+            return None
+        if column in URL_COLUMNS:
+            return canonicalize_url(str(value))
+        return str(value)
+
+    def _row(self, schema: TableSchema, record: Dict[str, Any], now: float) -> Optional[tuple]:
+        key = self.record_key(schema, record)
+        if key is None:
+            return None
+        return (
+            key,
+            *(self._column_value(column, record.get(column)) for column in schema.columns),
+            record.get("timestamp"),
+            now,
+            now,
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")),
+        )
+
+    def _upsert_sql(self, schema: TableSchema) -> str:
+        names = ["record_key", *schema.columns, "timestamp", "first_seen", "updated_at", "record"]
+        updates = ", ".join(
+            f"{name} = excluded.{name}" for name in names if name not in ("record_key", "first_seen")
+        )
+        return (
+            f"INSERT INTO {schema.table} ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' * len(names))}) "
+            f"ON CONFLICT (record_key) DO UPDATE SET {updates} "
+            f"WHERE excluded.timestamp IS NULL OR {schema.table}.timestamp IS NULL "
+            f"OR excluded.timestamp >= {schema.table}.timestamp"
+        )
+
+    def upsert(self, dataset_id: str, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update records of a dataset; returns how many had a key.
+
+        `records` may be any iterable; it is consumed in batches, each
+        committed as one transaction.
+        """
+        schema = self.schema(dataset_id)
+        sql = self._upsert_sql(schema)
+        written = 0
+        batch: List[tuple] = []
+        for record in records:
+            row = self._row(schema, record, time.time())
+            if row is None:
+                self.skipped += 1
+                continue
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                written += self._write(sql, batch)
+                batch = []
+        if batch:
+            written += self._write(sql, batch)
+        return written
+
+    def _write(self, sql: str, rows: List[tuple]) -> int:
+        with self._conn:
+            self._conn.executemany(sql, rows)
+        return len(rows)
+
+    def get(self, dataset_id: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        The stored record with this natural key, or None.
+        """
+        schema = self.schema(dataset_id)
+        row = self._conn.execute(
+            f"SELECT record FROM {schema.table} WHERE record_key = ?", (str(key),)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find(self, dataset_id: str, limit: Optional[int] = None, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Records whose lookup columns equal the given values, e.g.
+        find(JOBS_ID, company_id="1441"). URLs may be given in any form.
+        """
+        schema = self.schema(dataset_id)
+        unknown = set(filters) - set(schema.columns)
+        if unknown:
+            raise ValueError(f"Not a lookup column of {schema.table}: {', '.join(sorted(unknown))}")
+        where = " AND ".join(f"{column} = ?" for column in filters) or "1"
+        params = [self._column_value(column, value) for column, value in filters.items()]
+        sql = f"SELECT record FROM {schema.table} WHERE {where} ORDER BY record_key"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [json.loads(row[0]) for row in self._conn.execute(sql, params)]
+
+    def iter_records(self, dataset_id: str) -> Iterator[Dict[str, Any]]:
+        schema = self.schema(dataset_id)
+        for (record,) in self._conn.execute(f"SELECT record FROM {schema.table} ORDER BY record_key"):
+            yield json.loads(record)
+
+    def search(self, dataset_id: str, query: str, limit: int = 20, raw: bool = False) -> List[str]:
+        """
+        Natural keys of the records matching a query, best match first.
+
+        By default every whitespace-separated term of `query` is matched as
+        literal text, so "AI/ML" or "c++" are safe to pass through from
+        users. With raw=True, `query` uses FTS5 syntax: "exact phrases",
+        prefix*, AND/OR/NOT and column filters such as headline:hiring.
+        Malformed queries raise ValueError.
+        """
+        schema = self.schema(dataset_id)
+        if not schema.text_fields:
+            raise ValueError(f"{schema.table} has no full-text index")
+        match = query if raw else fts_quote(query)
+        if not match:
+            return []
+        try:
+            rows = self._conn.execute(
+                f"SELECT t.record_key FROM {schema.table}_fts f "
+                f"JOIN {schema.table} t ON t.rowid = f.rowid "
+                f"WHERE {schema.table}_fts MATCH ? ORDER BY f.rank LIMIT ?",
+                (match, limit),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query {query!r}: {str(e)}") from e
+        return [key for (key,) in rows]
+
+    def search_records(
+        self, dataset_id: str, query: str, limit: int = 20, raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Like search(), but the records themselves.
+        """
+        records = []
+        for key in self.search(dataset_id, query, limit, raw):
+            record = self.get(dataset_id, key)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def count(self, dataset_id: str) -> int:
+        schema = self.schema(dataset_id)
+        return self._conn.execute(f"SELECT COUNT(*) FROM {schema.table}").fetchone()[0]
@@ -0,0 +1,156 @@
+import json
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from linkedin_urls import entity_key
+
+DEFAULT_CACHE_PATH = "linkedin_cache.sqlite3"
+DEFAULT_TTL = 24 * 60 * 60
+QUERY_CHUNK = 500
+
+
+def input_key(item: Dict[str, Any]) -> str:
+    """
+    Stable key for one trigger input: sorted keys, empty values dropped and
+    the URL reduced to its entity key, so URL variants share one entry.
+    """
+    normalized = {}
+    for key, value in item.items():
+        if value in ("", None):
+            continue
+        if key == "url" and isinstance(value, str):
+            value = entity_key(value)
+        normalized[key] = value
+    return json.dumps(normalized, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def record_input(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    The trigger input a snapshot record was produced for.
+
+    Discovery datasets echo it as `discovery_input`, collect datasets as
+    `input`. Collect records can also carry a `discovery_input` of empty
+    filter fields, so the first source with a non-empty value wins.
+    """
+    for field in ("discovery_input", "input"):
+        source = record.get(field)
+        if isinstance(source, dict) and any(value not in ("", None) for value in source.values()):
+            return source
+    return None
+
+
+class ResultCache:
+    """
+    SQLite store of snapshot records per (namespace, input) with a TTL.
+
+    The namespace is the dataset id plus its discovery mode, so the same
+    input sent to different endpoints never collides. TTLs can be set per
+    dataset id through `ttls`; everything else uses `ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: float = DEFAULT_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                namespace TEXT NOT NULL,
+                input_key TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                records TEXT NOT NULL,
+                PRIMARY KEY (namespace, input_key)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def ttl_for(self, namespace: str) -> float:
+        return self.ttls.get(namespace.split(":", 1)[0], self.ttl)
+
+    def lookup(
+        self, namespace: str, inputs: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Split inputs into fresh cached records (by input key) and missing inputs.
+        """
+        keys = [input_key(item) for item in inputs]
+        oldest = time.time() - self.ttl_for(namespace)
+        cached: Dict[str, List[Dict[str, Any]]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for i in range(0, len(unique_keys), QUERY_CHUNK):
+            chunk = unique_keys[i : i + QUERY_CHUNK]
+            rows = self._conn.execute(
+                f"SELECT input_key, records FROM results WHERE namespace = ? "
+                f"AND fetched_at >= ? AND input_key IN ({','.join('?' * len(chunk))})",
+                [namespace, oldest, *chunk],
+            )
+            for key, records in rows:
+                cached[key] = json.loads(records)
+        missing = [item for item, key in zip(inputs, keys) if key not in cached]
+        self.hits += len(inputs) - len(missing)
+        self.misses += len(missing)
+        return cached, missing
+
+    def store(
+        self,
+        namespace: str,
+        inputs: List[Dict[str, Any]],
+        records: List[Dict[str, Any]],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Cache fresh records under the input each one echoes back.
+
+        Error records are never cached. Returns the grouped records by input
+        key; records that match none of `inputs` are grouped under "".
+        """
+        wanted = {input_key(item) for item in inputs}
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            source = record_input(record)
+            key = input_key(source) if source is not None else ""
+            grouped.setdefault(key if key in wanted else "", []).append(record)
+
+        now = time.time()
+        rows = [
+            (namespace, key, now, json.dumps(group, ensure_ascii=False))
+            for key, group in grouped.items()
+            if key and not any(record.get("error") for record in group)
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (namespace, input_key, fetched_at, records) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return grouped
+
+    def purge(self) -> int:
+        """
+        Delete entries older than every configured TTL; returns rows removed.
+        """
+        longest = max([self.ttl, *self.ttls.values()])
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM results WHERE fetched_at < ?", (time.time() - longest,)
+            )
+        return cursor.rowcount
@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
+
+from brightdata_client import BrightDataClient
+from polling import DEFAULT_POLLING, FixedPolling, PollSchedule
+
+FINAL_STATUSES = {"ready", "failed"}
+
+
+class _Watch:
+    __slots__ = ("snapshot_id", "dataset_id", "future", "errors", "schedule", "due")
+
+    def __init__(
+        self,
+        snapshot_id: str,
+        dataset_id: Optional[str],
+        future: asyncio.Future,
+        schedule: PollSchedule,
+    ):
+        self.snapshot_id = snapshot_id
+        self.dataset_id = dataset_id
+        self.future = future
+        self.errors = 0
+        self.schedule = schedule
+        self.due = time.monotonic() + schedule.next_delay()
+
+
+class SnapshotPoller:
+    """
+    Watch any number of snapshots with one progress loop.
+
+    Each snapshot gets its own poll schedule (adaptive by default, or fixed
+    when `interval` is given), and every tick polls the snapshots that are
+    due. Snapshots of the same dataset are resolved with a single /snapshots
+    listing call when more than one is pending, falling back to
+    /progress/{id} for the rest. Each watch() returns a future that resolves
+    to the final status ("ready", "failed" or "error").
+    """
+
+    def __init__(
+        self,
+        client: BrightDataClient,
+        interval: Optional[float] = None,
+        max_concurrency: int = 20,
+        max_errors: int = 3,
+        polling=None,
+    ):
+        self.client = client
+        if polling is None:
+            polling = FixedPolling(interval) if interval else DEFAULT_POLLING
+        self.polling = polling
+        self.max_errors = max_errors
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._watches: Dict[str, _Watch] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    async def __aenter__(self) -> "SnapshotPoller":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @property
+    def pending(self) -> int:
+        return len(self._watches)
+
+    def watch(
+        self,
+        snapshot_id: str,
+        dataset_id: Optional[str] = None,
+        input_count: int = 0,
+        callback: Optional[Callable[[str, str], None]] = None,
+        resumed: bool = False,
+    ) -> asyncio.Future:
+        """
+        Start watching a snapshot; callback(snapshot_id, status) runs on completion.
+
+        A resumed snapshot was triggered before this process started, so
+        its duration is left out of the polling history.
+        """
+        existing = self._watches.get(snapshot_id)
+        if existing is not None:
+            future = existing.future
+        else:
+            future = asyncio.get_running_loop().create_future()
+            schedule = self.polling.schedule(dataset_id or "", input_count, record=not resumed)
+            self._watches[snapshot_id] = _Watch(snapshot_id, dataset_id, future, schedule)
+        if callback is not None:
+            future.add_done_callback(
+                lambda f: callback(snapshot_id, f.result()) if not f.cancelled() else None
+            )
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        else:
+            # Wake the loop in case the new snapshot is due before its sleep ends.
+            self._wakeup.set()
+        return future
+
+    async def wait(
+        self,
+        snapshot_id: str,
+        dataset_id: Optional[str] = None,
+        input_count: int = 0,
+        resumed: bool = False,
+    ) -> str:
+        return await self.watch(snapshot_id, dataset_id, input_count, resumed=resumed)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for watch in self._watches.values():
+            watch.future.cancel()
+        self._watches.clear()
+
+    async def _run(self) -> None:
+        while self._watches:
+            now = time.monotonic()
+            next_due = min(watch.due for watch in self._watches.values())
+            if next_due > now:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), next_due - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self.poll_once()
+
+    async def poll_once(self, due_only: bool = True) -> None:
+        """
+        Refresh the status of the due (or all) pending snapshots once.
+        """
+        now = time.monotonic()
+        by_dataset: Dict[Optional[str], List[_Watch]] = {}
+        for watch in list(self._watches.values()):
+            by_dataset.setdefault(watch.dataset_id, []).append(watch)
+
+        singles: List[_Watch] = []
+        listings = []
+        for dataset_id, watches in by_dataset.items():
+            due = [w for w in watches if not due_only or w.due <= now]
+            if not due:
+                continue
+            if dataset_id is None or len(watches) == 1:
+                singles.extend(due)
+            else:
+                # One listing call refreshes every snapshot of the dataset.
+                listings.append(self._poll_dataset(dataset_id, watches))
+        results = await asyncio.gather(*listings)
+        for leftovers in results:
+            singles.extend(leftovers)
+        await asyncio.gather(*(self._poll_single(watch) for watch in singles))
+
+    async def _poll_dataset(self, dataset_id: str, watches: List[_Watch]) -> List[_Watch]:
+        """
+        Resolve many snapshots with one listing call; return those not found.
+        """
+        try:
+            async with self._semaphore:
+                listing = await self.client.snapshots(dataset_id)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.warning(f"Snapshot listing failed for {dataset_id}: {str(e)}")
+            now = time.monotonic()
+            return [w for w in watches if w.due <= now]
+        statuses = {item.get("id"): item.get("status") for item in listing}
+        now = time.monotonic()
+        leftovers = []
+        for watch in watches:
+            status = statuses.get(watch.snapshot_id)
+            if status is None:
+                if watch.due <= now:
+                    leftovers.append(watch)
+            else:
+                self._update(watch, status)
+        return leftovers
+
+    async def _poll_single(self, watch: _Watch) -> None:
+        try:
+            async with self._semaphore:
+                progress = await self.client.progress(watch.snapshot_id)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            watch.errors += 1
+            logging.warning(f"Error checking status of {watch.snapshot_id}: {str(e)}")
+            if watch.errors >= self.max_errors:
+                self._finish(watch, "error")
+            else:
+                watch.due = time.monotonic() + watch.schedule.next_delay()
+            return
+        self._update(watch, progress.get("status", "error"))
+
+    def _update(self, watch: _Watch, status: str) -> None:
+        watch.errors = 0
+        if status in FINAL_STATUSES or status == "error":
+            self._finish(watch, status)
+        elif watch.due <= time.monotonic():
+            watch.due = time.monotonic() + watch.schedule.next_delay()
+
+    def _finish(self, watch: _Watch, status: str) -> None:
+        watch.schedule.finished(status)
+        self._watches.pop(watch.snapshot_id, None)
+        if not watch.future.done():
+            watch.future.set_result(status)
@@ -0,0 +1,255 @@
+import gzip
+import json
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from output_sinks import FORMAT_NDJSON, detect_format
+
+READ_CHUNK = 1024 * 1024
+RANGE_SIZE = 64 * 1024 * 1024
+
+
+def _array_layout(mm: mmap.mmap) -> Optional[Tuple[bytes, bytes]]:
+    """
+    Line ending and indentation of the top-level records of a pretty-printed
+    JSON array (b"\n" and b"  " for the json.dump(indent=2) files _save_data
+    writes, b"\r\n" and b"  " for the sample files), or None if the file
+    is not laid out one record per indented block.
+    """
+    head = mm[: min(len(mm), 4096)]
+    stripped = head.lstrip()
+    if not stripped.startswith(b"["):
+        raise ValueError("Not a JSON array")
+    rest = stripped[1:]
+    body = rest.lstrip(b" \t\r\n")
+    whitespace = rest[: len(rest) - len(body)]
+    if not body.startswith(b"{"):
+        return None
+    for newline in (b"\r\n", b"\n"):
+        if whitespace.startswith(newline):
+            indent = whitespace[len(newline) :]
+            if indent and not indent.strip(b" \t"):
+                return newline, indent
+            return None
+    return None
+
+
+class SnapshotFile:
+    """
+    Memory-mapped pretty-printed JSON array of records, read one record at a time.
+
+    In the indented layout every top-level record starts with
+    "<newline><indent>{" and ends with "<newline><indent>}", where newline is
+    "\\n" or "\\r\\n", and since JSON strings cannot contain raw line breaks
+    those markers never occur inside a record. Records are found with
+    mmap.find() and decoded one by one, so memory stays at one record
+    however large the file is, and any byte offset can be moved to the
+    next record boundary, which is what the parallel reader splits on.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        if self._mm is not None and hasattr(mmap, "MADV_SEQUENTIAL"):
+            # Read ahead, and let the kernel drop pages behind the reader.
+            self._mm.madvise(mmap.MADV_SEQUENTIAL)
+        layout = _array_layout(self._mm) if self._mm is not None else None
+        self.newline, self.indent = layout or (None, None)
+
+    def __enter__(self) -> "SnapshotFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    @property
+    def size(self) -> int:
+        return len(self._mm) if self._mm is not None else 0
+
+    @property
+    def indexable(self) -> bool:
+        """
+        Whether record boundaries can be found directly (indented layout).
+        """
+        return self.indent is not None
+
+    def next_boundary(self, offset: int) -> int:
+        """
+        Offset of the first record marker at or after `offset`, or the file size.
+        """
+        position = self._mm.find(self.newline + self.indent + b"{", offset)
+        return self.size if position == -1 else position
+
+    def split(self, parts: int) -> List[Tuple[int, int]]:
+        """
+        Byte ranges covering every record once, cut on record boundaries.
+        """
+        step = max(1, self.size // max(1, parts))
+        starts = [self.next_boundary(0)]
+        while True:
+            start = self.next_boundary(starts[-1] + step)
+            if start >= self.size:
+                break
+            starts.append(start)
+        return list(zip(starts, starts[1:] + [self.size]))
+
+    def iter_range(self, start: int, end: int) -> Iterator[Dict[str, Any]]:
+        """
+        Records whose marker lies in [start, end).
+        """
+        marker = self.newline + self.indent + b"{"
+        closer = self.newline + self.indent + b"}"
+        position = self._mm.find(marker, start)
+        while position != -1 and position < end:
+            opening = position + len(marker) - 1
+            if self._mm[opening + 1 : opening + 2] == b"}":
+                closing = opening + 2
+            else:
+                closing = self._mm.find(closer, opening)
+                if closing == -1:
+                    raise ValueError(f"Unterminated record at byte {opening} of {self.path}")
+                closing += len(closer)
+            yield json.loads(self._mm[opening:closing])
+            position = self._mm.find(marker, closing)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self._mm is None:
+            return iter(())
+        if not self.indexable:
+            return _iter_json_stream(_MmapReader(self._mm))
+        return self.iter_range(0, self.size)
+
+
+class _MmapReader:
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+        self._position = 0
+
+    def read(self, size: int) -> str:
+        # Cut on a UTF-8 character boundary (never before a continuation byte).
+        end = min(len(self._mm), self._position + size)
+        while end < len(self._mm) and self._mm[end] & 0xC0 == 0x80:
+            end += 1
+        chunk = self._mm[self._position : end]
+        self._position = end
+        return chunk.decode("utf-8")
+
+
+def _iter_json_stream(f: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Records of a JSON array in any layout, decoded incrementally from a text stream.
+
+    Used for compact or gzipped files, where record boundaries cannot be
+    found without parsing.
+    """
+    decoder = json.JSONDecoder()
+    buffer = f.read(READ_CHUNK).lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Not a JSON array")
+    position = 1
+    eof = False
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            if position >= len(buffer):
+                raise json.JSONDecodeError("Need more data", buffer, position)
+            record, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = f.read(max(READ_CHUNK, len(buffer) - position))
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield record
+
+
+def iter_snapshot(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a saved snapshot file one at a time.
+
+    Pretty-printed JSON arrays (what _save_data writes) are memory-mapped
+    and split on record markers; compact or .gz arrays are decoded
+    incrementally; .ndjson/.jsonl files are read line by line.
+    """
+    if detect_format(path) == FORMAT_NDJSON:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+    if path.endswith(".gz"):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            yield from _iter_json_stream(f)
+        return
+    with SnapshotFile(path) as snapshot:
+        yield from snapshot
+
+
+def _process_range(
+    path: str, start: int, end: int, func: Optional[Callable[[Dict[str, Any]], Any]]
+) -> List[Any]:
+    with SnapshotFile(path) as snapshot:
+        if func is None:
+            return list(snapshot.iter_range(start, end))
+        results = []
+        for record in snapshot.iter_range(start, end):
+            result = func(record)
+            if result is not None:
+                results.append(result)
+        return results
+
+
+def map_snapshot(
+    path: str,
+    func: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    workers: Optional[int] = None,
+    range_size: int = RANGE_SIZE,
+) -> Iterator[Any]:
+    """
+    Apply `func` to every record of a snapshot file on worker processes.
+
+    The memory map is cut into ranges of about `range_size` bytes on record
+    boundaries; each worker maps the file itself and parses its ranges, so
+    only results cross process boundaries. Results come back in file order
+    and None results are dropped, so `func` can also filter. At most two
+    ranges per worker are pending at a time. `func` must be picklable (a
+    module-level function); without one the records themselves are
+    returned. Files that cannot be split are processed in this process.
+    """
+    with SnapshotFile(path) as snapshot:
+        if not snapshot.indexable or snapshot.size <= range_size:
+            ranges = None
+        else:
+            ranges = snapshot.split(max(1, snapshot.size // range_size))
+    if ranges is None:
+        for record in iter_snapshot(path):
+            result = record if func is None else func(record)
+            if result is not None:
+                yield result
+        return
+
+    workers = workers or os.cpu_count() or 1
+    ranges = deque(ranges)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while ranges or pending:
+            while ranges and len(pending) < workers * 2:
+                start, end = ranges.popleft()
+                pending.append(executor.submit(_process_range, path, start, end, func))
+            yield from pending.popleft().result()
@@ -0,0 +1,561 @@
+import argparse
+import asyncio
+import copy
+import html
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "linkedin_scraper_api_data"
+
+# (dataset_id, discover_by or "collect") -> fixture file
+FIXTURES = {
+    ("gd_l1vikfnt1wgvvqz95w", "collect"): "linkedin_company_info.json",
+    ("gd_l1viktl72bvl7bjuj0", "collect"): "profiles_by_url.json",
+    ("gd_l1viktl72bvl7bjuj0", "name"): "profiles_by_name.json",
+    ("gd_lyy3tktm25m4avu764", "collect"): "linkedin_posts_url.json",
+    ("gd_lyy3tktm25m4avu764", "url"): "discovered_posts_by_url.json",
+    ("gd_lyy3tktm25m4avu764", "profile_url"): "posts_by_profile.json",
+    ("gd_lyy3tktm25m4avu764", "company_url"): "linkedin_posts_company_url.json",
+    ("gd_lpfll7v5hcqtkxl6l", "collect"): "linkedin_jobs_url.json",
+    ("gd_lpfll7v5hcqtkxl6l", "keyword"): "linkedin_jobs_keyword.json",
+    ("gd_lpfll7v5hcqtkxl6l", "url"): "linkedin_jobs_search_url.json",
+}
+
+# Fixture behind the guest job search pages served for the free scraper.
+JOBS_GUEST_FIXTURE = "linkedin_jobs_keyword.json"
+JOBS_GUEST_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+JOB_POSTING_PATH = "/jobs-guest/jobs/api/jobPosting"
+FIRST_JOB_ID = 4000000000
+
+JOB_CARD_TEMPLATE = """<li>
+  <div class="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}">
+    <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://uk.linkedin.com/jobs/view/{slug}-{job_id}?position={position}&amp;pageNum={page}&amp;refId=r{job_id}&amp;trackingId=t{job_id}&amp;trk=public_jobs_jserp-result_search-card">
+      <span class="sr-only">{title}</span>
+    </a>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">
+        {title}
+      </h3>
+      <h4 class="base-search-card__subtitle">
+        <a class="hidden-nested-link" href="https://www.linkedin.com/company/{company_slug}?trk=public_jobs_jserp-result_job-search-card-subtitle">{company}</a>
+      </h4>
+      <div class="base-search-card__metadata">
+        <span class="job-search-card__location">
+          {location}
+        </span>
+        <time class="job-search-card__listdate" datetime="{date}">
+          {posted}
+        </time>
+      </div>
+    </div>
+  </div>
+</li>
+"""
+
+
+JOB_POSTING_TEMPLATE = """<section class="top-card-layout container-lined overflow-hidden babybear:rounded-[0px]">
+  <div class="top-card-layout__entity-info-container flex flex-wrap papabear:flex-nowrap">
+    <h2 class="top-card-layout__title font-sans text-lg papabear:text-xl font-bold leading-open text-color-text mb-0 topcard__title">{title}</h2>
+    <h4 class="top-card-layout__second-subline font-sans text-sm leading-open text-color-text-low-emphasis mt-0.5">
+      <span class="topcard__flavor topcard__flavor--bullet">{location}</span>
+      <figcaption class="num-applicants__caption">
+        {applicants}
+      </figcaption>
+    </h4>
+  </div>
+</section>
+<section class="core-section-container my-3 description">
+  <div class="core-section-container__content break-words">
+    <div class="description__text description__text--rich">
+      {description}
+    </div>
+    <ul class="description__job-criteria-list">
+{criteria}
+    </ul>
+  </div>
+</section>
+"""
+
+JOB_CRITERIA_TEMPLATE = """      <li class="description__job-criteria-item">
+        <h3 class="description__job-criteria-subheader">
+          {name}
+        </h3>
+        <span class="description__job-criteria-text description__job-criteria-text--criteria">
+          {value}
+        </span>
+      </li>"""
+
+
+# Public profile and company pages for the free URL checker.
+PROFILE_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>{title} | LinkedIn</title>
+  <meta name="description" content="{title} on LinkedIn">
+</head>
+<body>
+<main class="main">
+{padding}
+</main>
+</body>
+</html>
+"""
+
+AUTH_WALL_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>LinkedIn</title>
+  <script type="text/javascript">
+    window.onload = function() {{
+      var domain = location.host;
+      window.location.href = "https://" + domain + "/authwall?trk=bf&trkInfo=bf&sessionRedirect=" + encodeURIComponent(window.location.href);
+    }}
+  </script>
+</head>
+<body>
+{padding}
+</body>
+</html>
+"""
+
+
+class _Snapshot:
+    def __init__(
+        self, dataset_id: str, records: List[Dict[str, Any]], ready_at: float, running_at: float, fails: bool, built_at: float
+    ):
+        self.id = f"s_{uuid.uuid4().hex[:16]}"
+        self.dataset_id = dataset_id
+        self.records = records
+        self.running_at = running_at
+        self.ready_at = ready_at
+        self.built_at = built_at
+        self.fails = fails
+
+    @property
+    def status(self) -> str:
+        now = time.monotonic()
+        if now < self.running_at:
+            return "starting"
+        if now < self.ready_at:
+            return "running"
+        return "failed" if self.fails else "ready"
+
+    @property
+    def download_status(self) -> str:
+        """
+        Status seen by /snapshot, which keeps building after progress is ready.
+        """
+        status = self.status
+        if status == "ready" and time.monotonic() < self.built_at:
+            return "building"
+        return status
+
+
+class StandInAPI:
+    """
+    Local replacement for the Bright Data Dataset API, fed from fixtures.
+
+    Implements /trigger, /progress/{id}, /snapshot/{id} (format=json or
+    ndjson/jsonl) and /snapshots. Snapshots stay "starting" for
+    `queue_delay` seconds and "running" for `run_delay` plus
+    `per_input_delay` per input. Each input yields `records_per_input`
+    fixture records (discovery) or one (collect), repeated
+    `payload_multiplier` times. `error_rate` makes that share of requests
+    answer 500, and `fail_rate` that share of snapshots end as "failed".
+    /snapshot keeps answering 202 "building" for `build_delay` seconds
+    after progress reports a snapshot ready.
+
+    It also serves the LinkedIn guest job search endpoint used by the free
+    scraper: `jobs_total` job cards, 25 per `start=` page, built from the
+    job fixtures, plus a public job posting page per job id.
+    `throttle_rate` makes that share of job pages answer 429.
+
+    Profile (/in/) and company (/company/) pages are served too, about
+    `page_size` bytes each, for the URL checker. Slugs made only of digits
+    or starting with "missing" answer 404, and `authwall_rate` of the
+    other pages are the auth-wall page LinkedIn shows to logged-out clients.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path = DATA_DIR,
+        queue_delay: float = 0.0,
+        run_delay: float = 0.5,
+        per_input_delay: float = 0.0,
+        records_per_input: int = 10,
+        payload_multiplier: int = 1,
+        error_rate: float = 0.0,
+        fail_rate: float = 0.0,
+        seed: Optional[int] = None,
+        build_delay: float = 0.0,
+        jobs_total: int = 1000,
+        throttle_rate: float = 0.0,
+        page_size: int = 200_000,
+        authwall_rate: float = 0.0,
+    ):
+        self.data_dir = Path(data_dir)
+        self.queue_delay = queue_delay
+        self.run_delay = run_delay
+        self.per_input_delay = per_input_delay
+        self.records_per_input = records_per_input
+        self.payload_multiplier = payload_multiplier
+        self.error_rate = error_rate
+        self.fail_rate = fail_rate
+        self.build_delay = build_delay
+        self.jobs_total = jobs_total
+        self.throttle_rate = throttle_rate
+        self.page_size = page_size
+        self.authwall_rate = authwall_rate
+        self.random = random.Random(seed)
+        self.requests = {"trigger": 0, "progress": 0, "snapshot": 0, "snapshots": 0, "jobs": 0, "pages": 0}
+        self._snapshots: Dict[str, _Snapshot] = {}
+        self._fixtures: Dict[str, List[Dict[str, Any]]] = {}
+
+    def app(self) -> web.Application:
+        app = web.Application(client_max_size=1024 ** 3)
+        app.add_routes(
+            [
+                web.post("/trigger", self.trigger),
+                web.get("/progress/{snapshot_id}", self.progress),
+                web.get("/snapshot/{snapshot_id}", self.snapshot),
+                web.get("/snapshots", self.snapshots),
+                web.get(JOBS_GUEST_PATH, self.jobs_search),
+                web.get(JOB_POSTING_PATH + "/{job_id}", self.job_posting),
+                web.get("/in/{slug}", self.profile_page),
+                web.get("/in/{slug}/", self.profile_page),
+                web.get("/company/{slug}", self.profile_page),
+                web.get("/company/{slug}/", self.profile_page),
+            ]
+        )
+        return app
+
+    def _fixture(self, dataset_id: str, mode: str) -> List[Dict[str, Any]]:
+        filename = FIXTURES.get((dataset_id, mode))
+        if filename is None:
+            raise web.HTTPBadRequest(text=f"Unknown dataset {dataset_id} ({mode})")
+        return self._load(filename)
+
+    def _load(self, filename: str) -> List[Dict[str, Any]]:
+        if filename not in self._fixtures:
+            with open(self.data_dir / filename, "r", encoding="utf-8") as f:
+                self._fixtures[filename] = json.load(f)
+        return self._fixtures[filename]
+
+    def _maybe_fail(self) -> None:
+        if self.error_rate and self.random.random() < self.error_rate:
+            raise web.HTTPInternalServerError(text="Injected error")
+
+    def _build_records(self, fixture: List[Dict[str, Any]], inputs: List[Dict[str, Any]], discover: bool) -> List[Dict[str, Any]]:
+        source = itertools.cycle(fixture)
+        records = []
+        for item in inputs:
+            for _ in range(self.records_per_input if discover else 1):
+                record = copy.copy(next(source))
+                if discover:
+                    record["discovery_input"] = item
+                else:
+                    record["input"] = item
+                records.append(record)
+        if self.payload_multiplier > 1:
+            base = records
+            records = []
+            for copy_index in range(self.payload_multiplier):
+                for record in base:
+                    duplicate = copy.copy(record)
+                    if "id" in duplicate:
+                        duplicate["id"] = f"{duplicate['id']}-{copy_index}"
+                    records.append(duplicate)
+        return records
+
+    async def trigger(self, request: web.Request) -> web.Response:
+        self.requests["trigger"] += 1
+        self._maybe_fail()
+        dataset_id = request.query.get("dataset_id", "")
+        discover = request.query.get("type") == "discover_new"
+        mode = request.query.get("discover_by", "collect") if discover else "collect"
+        inputs = await request.json()
+        records = self._build_records(self._fixture(dataset_id, mode), inputs, discover)
+        now = time.monotonic()
+        running_at = now + self.queue_delay
+        ready_at = running_at + self.run_delay + self.per_input_delay * len(inputs)
+        snapshot = _Snapshot(
+            dataset_id,
+            records,
+            ready_at=ready_at,
+            running_at=running_at,
+            fails=self.fail_rate > 0 and self.random.random() < self.fail_rate,
+            built_at=ready_at + self.build_delay,
+        )
+        self._snapshots[snapshot.id] = snapshot
+        return web.json_response({"snapshot_id": snapshot.id})
+
+    def _get(self, request: web.Request) -> _Snapshot:
+        snapshot = self._snapshots.get(request.match_info["snapshot_id"])
+        if snapshot is None:
+            raise web.HTTPNotFound(text="Snapshot not found")
+        return snapshot
+
+    async def progress(self, request: web.Request) -> web.Response:
+        self.requests["progress"] += 1
+        self._maybe_fail()
+        snapshot = self._get(request)
+        return web.json_response({"snapshot_id": snapshot.id, "dataset_id": snapshot.dataset_id, "status": snapshot.status})
+
+    async def snapshots(self, request: web.Request) -> web.Response:
+        self.requests["snapshots"] += 1
+        self._maybe_fail()
+        dataset_id = request.query.get("dataset_id")
+        status = request.query.get("status")
+        listing = [
+            {"id": s.id, "dataset_id": s.dataset_id, "status": s.status}
+            for s in self._snapshots.values()
+            if (dataset_id is None or s.dataset_id == dataset_id) and (status is None or s.status == status)
+        ]
+        return web.json_response(listing)
+
+    async def snapshot(self, request: web.Request) -> web.StreamResponse:
+        self.requests["snapshot"] += 1
+        self._maybe_fail()
+        snapshot = self._get(request)
+        status = snapshot.download_status
+        if status != "ready":
+            return web.json_response({"status": status, "message": "Snapshot is not ready yet"}, status=202)
+        format = request.query.get("format", "json")
+        if format not in ("json", "ndjson", "jsonl"):
+            raise web.HTTPBadRequest(text=f"Unsupported format {format}")
+
+        response = web.StreamResponse(
+            headers={"Content-Type": "application/json" if format == "json" else "application/x-ndjson"}
+        )
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        # Encode record by record but send ~64 KiB chunks.
+        pending: List[bytes] = [b"["] if format == "json" else []
+        pending_size = 0
+        for index, record in enumerate(snapshot.records):
+            line = json.dumps(record, ensure_ascii=False)
+            if format == "json":
+                line = ("," if index else "") + line
+            else:
+                line += "\n"
+            encoded = line.encode("utf-8")
+            pending.append(encoded)
+            pending_size += len(encoded)
+            if pending_size >= 64 * 1024:
+                await response.write(b"".join(pending))
+                pending, pending_size = [], 0
+        if format == "json":
+            pending.append(b"]")
+        if pending:
+            await response.write(b"".join(pending))
+        await response.write_eof()
+        return response
+
+
+    def job_cards(self, start: int, count: int = 25) -> str:
+        """
+        HTML of one guest search page: cards `start` to `start + count`.
+        """
+        fixture = self._load(JOBS_GUEST_FIXTURE)
+        cards = []
+        for index in range(start, min(start + count, self.jobs_total)):
+            job = fixture[index % len(fixture)]
+            job_id = FIRST_JOB_ID + index
+            title = job.get("job_title") or "Engineer"
+            company = job.get("company_name") or "Company"
+            cards.append(
+                JOB_CARD_TEMPLATE.format(
+                    job_id=job_id,
+                    slug=re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")[:60],
+                    position=index - start + 1,
+                    page=start // 25,
+                    title=html.escape(title),
+                    company_slug=re.sub(r"[^a-z0-9]+", "-", company.lower()).strip("-"),
+                    company=html.escape(company),
+                    location=html.escape(job.get("job_location") or ""),
+                    date=(job.get("job_posted_date") or "")[:10],
+                    posted=html.escape(job.get("job_posted_time") or ""),
+                )
+            )
+        return "".join(cards)
+
+    def job_posting_html(self, job_id: int) -> str:
+        """
+        HTML of the public posting page of a job served by job_cards().
+        """
+        fixture = self._load(JOBS_GUEST_FIXTURE)
+        job = fixture[(job_id - FIRST_JOB_ID) % len(fixture)]
+        applicants = job.get("job_num_applicants")
+        criteria = [
+            ("Seniority level", job.get("job_seniority_level")),
+            ("Employment type", job.get("job_employment_type")),
+            ("Job function", job.get("job_function")),
+            ("Industries", job.get("job_industries")),
+        ]
+        return JOB_POSTING_TEMPLATE.format(
+            title=html.escape(job.get("job_title") or ""),
+            location=html.escape(job.get("job_location") or ""),
+            applicants=f"{applicants} applicants" if applicants else "Be among the first 25 applicants",
+            description=job.get("job_description_formatted") or "",
+            criteria="\n".join(
+                JOB_CRITERIA_TEMPLATE.format(name=name, value=html.escape(value))
+                for name, value in criteria
+                if value
+            ),
+        )
+
+    async def job_posting(self, request: web.Request) -> web.Response:
+        self.requests["jobs"] += 1
+        self._maybe_fail()
+        if self.throttle_rate and self.random.random() < self.throttle_rate:
+            raise web.HTTPTooManyRequests(text="Too many requests")
+        try:
+            job_id = int(request.match_info["job_id"])
+        except ValueError:
+            raise web.HTTPNotFound(text="Job not found")
+        if not 0 <= job_id - FIRST_JOB_ID < self.jobs_total:
+            raise web.HTTPNotFound(text="Job not found")
+        return web.Response(text=self.job_posting_html(job_id), content_type="text/html")
+
+    async def jobs_search(self, request: web.Request) -> web.Response:
+        self.requests["jobs"] += 1
+        self._maybe_fail()
+        if self.throttle_rate and self.random.random() < self.throttle_rate:
+            raise web.HTTPTooManyRequests(text="Too many requests")
+        start = int(request.query.get("start", 0))
+        return web.Response(text=self.job_cards(start), content_type="text/html")
+
+    def profile_page_html(self, slug: str) -> str:
+        name = " ".join(part.capitalize() for part in re.split(r"[-_]+", slug) if part)
+        line = f'<p class="core-section-container__content">{html.escape(name)}</p>\n'
+        padding = line * max(1, self.page_size // len(line))
+        return PROFILE_PAGE_TEMPLATE.format(title=html.escape(name), padding=padding)
+
+    async def profile_page(self, request: web.Request) -> web.Response:
+        self.requests["pages"] += 1
+        self._maybe_fail()
+        if self.throttle_rate and self.random.random() < self.throttle_rate:
+            raise web.HTTPTooManyRequests(text="Too many requests")
+        slug = request.match_info["slug"]
+        if slug.isdigit() or slug.startswith("missing"):
+            raise web.HTTPNotFound(text="Page not found")
+        if self.authwall_rate and self.random.random() < self.authwall_rate:
+            padding = "<div></div>\n" * max(1, self.page_size // 12)
+            return web.Response(text=AUTH_WALL_PAGE.format(padding=padding), content_type="text/html")
+        return web.Response(text=self.profile_page_html(slug), content_type="text/html")
+
+
+class StandInServer:
+    """
+    Run a StandInAPI on localhost, inside the current loop or a thread.
+    """
+
+    def __init__(self, api: Optional[StandInAPI] = None, host: str = "127.0.0.1", port: int = 0):
+        self.api = api or StandInAPI()
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        self._runner = web.AppRunner(self.api.app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.port = self._runner.addresses[0][1]
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StandInServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def start_in_thread(self) -> str:
+        """
+        Serve from a daemon thread so blocking collectors can use it.
+        """
+        started = threading.Event()
+
+        def serve() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=serve, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self.url
+
+    def stop_thread(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the Bright Data Dataset API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--queue-delay", type=float, default=0.0)
+    parser.add_argument("--run-delay", type=float, default=0.5)
+    parser.add_argument("--per-input-delay", type=float, default=0.0)
+    parser.add_argument("--records-per-input", type=int, default=10)
+    parser.add_argument("--payload-multiplier", type=int, default=1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--build-delay", type=float, default=0.0)
+    parser.add_argument("--jobs-total", type=int, default=1000)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=200_000)
+    parser.add_argument("--authwall-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    api = StandInAPI(
+        queue_delay=args.queue_delay,
+        run_delay=args.run_delay,
+        per_input_delay=args.per_input_delay,
+        records_per_input=args.records_per_input,
+        payload_multiplier=args.payload_multiplier,
+        error_rate=args.error_rate,
+        fail_rate=args.fail_rate,
+        seed=args.seed,
+        build_delay=args.build_delay,
+        jobs_total=args.jobs_total,
+        throttle_rate=args.throttle_rate,
+        page_size=args.page_size,
+        authwall_rate=args.authwall_rate,
+    )
+    print(f"Serving stand-in Dataset API on http://{args.host}:{args.port}")
+    print(f"Point collectors at it with BRIGHTDATA_API_URL=http://{args.host}:{args.port}")
+    web.run_app(api.app(), host=args.host, port=args.port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import pytest
+
+from batching import FixedBatching
+from polling import FixedPolling
+from standin_server import JOB_POSTING_PATH, JOBS_GUEST_PATH, StandInAPI, StandInServer
+
+COMPANY_URLS = [
+    "https://www.linkedin.com/company/bright-data",
+    "https://www.linkedin.com/company/lanieri",
+    "https://www.linkedin.com/company/the-kraft-heinz-company",
+]
+
+
+@pytest.fixture
+def api():
+    return StandInAPI(run_delay=0.05, records_per_input=2, seed=1)
+
+
+@pytest.fixture
+def server(api):
+    server = StandInServer(api)
+    server.start_in_thread()
+    yield server
+    server.stop_thread()
+
+
+@pytest.fixture
+def make_collector(server):
+    """
+    Build a collector pointed at the stand-in, polling every 10 ms and
+    sending one trigger per run unless told otherwise.
+    """
+
+    def make(collector_class, **kwargs):
+        kwargs.setdefault("polling", FixedPolling(0.01))
+        kwargs.setdefault("batching", FixedBatching())
+        return collector_class("test-token", api_base_url=server.url, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def jobs_site(server, monkeypatch):
+    """
+    Point the free jobs scraper at the stand-in guest endpoints, unthrottled.
+    """
+    from jobs_scraper import ScraperConfig
+
+    monkeypatch.setattr(ScraperConfig, "BASE_URL", server.url + JOBS_GUEST_PATH)
+    monkeypatch.setattr(ScraperConfig, "JOB_POSTING_URL", server.url + JOB_POSTING_PATH + "/{job_id}")
+    monkeypatch.setattr(ScraperConfig, "REQUESTS_PER_SECOND", 0)
+    return server
@@ -0,0 +1,82 @@
+import asyncio
+import csv
+import json
+
+import pytest
+
+from async_jobs_scraper import GRID_FIELDS, AsyncLinkedInJobsScraper, scrape_grid_to_file
+from job_index import JobIndex
+
+
+def run_grid(scraper, keywords, locations, max_jobs):
+    async def run():
+        async with scraper:
+            return [item async for item in scraper.scrape_grid(keywords, locations, max_jobs)]
+
+    return asyncio.run(run())
+
+
+def job_number(job):
+    return int(JobIndex.key(job.job_link))
+
+
+def test_each_search_keeps_its_page_order(jobs_site):
+    scraper = AsyncLinkedInJobsScraper(max_concurrency=4, pages_per_query=3)
+
+    grid = run_grid(scraper, ["python"], ["London"], max_jobs=120)
+
+    numbers = [job_number(job) for _, _, job in grid]
+    assert len(numbers) == 120
+    assert numbers == sorted(numbers)
+
+
+def test_searches_of_a_grid_share_one_index(jobs_site):
+    # The stand-in ignores the search terms, so every search sees the same jobs.
+    scraper = AsyncLinkedInJobsScraper(max_concurrency=4)
+
+    grid = run_grid(scraper, ["python", "java"], ["London", "Berlin"], max_jobs=50)
+
+    links = [job.job_link for _, _, job in grid]
+    assert len(links) >= 50
+    assert len(set(links)) == len(links)
+    for search in {(keyword, location) for keyword, location, _ in grid}:
+        numbers = [job_number(job) for keyword, location, job in grid if (keyword, location) == search]
+        assert numbers == sorted(numbers)
+
+
+def test_grids_repeat_jobs_unless_given_an_index(jobs_site):
+    scraper = AsyncLinkedInJobsScraper()
+    assert len(run_grid(scraper, ["python"], ["London"], 25)) == 25
+    assert len(run_grid(scraper, ["python"], ["London"], 25)) == 25
+
+    scraper = AsyncLinkedInJobsScraper(job_index=JobIndex())
+    assert len(run_grid(scraper, ["python"], ["London"], 25)) == 25
+    assert run_grid(scraper, ["python"], ["London"], 25) == []
+
+
+def test_unexpected_errors_stop_the_grid(jobs_site, monkeypatch):
+    scraper = AsyncLinkedInJobsScraper()
+
+    async def broken_page(keywords, location, start, index):
+        raise ValueError("parser bug")
+
+    monkeypatch.setattr(scraper, "_scrape_page", broken_page)
+    with pytest.raises(ValueError, match="parser bug"):
+        run_grid(scraper, ["python"], ["London"], 25)
+
+
+@pytest.mark.parametrize("name", ["grid.ndjson", "grid.csv"])
+def test_scrape_grid_to_file(jobs_site, tmp_path, name):
+    filename = tmp_path / name
+
+    count = asyncio.run(scrape_grid_to_file(["python"], ["London", "Berlin"], 30, str(filename)))
+
+    with open(filename, encoding="utf-8") as f:
+        if name.endswith(".csv"):
+            rows = list(csv.DictReader(f))
+            assert list(rows[0]) == GRID_FIELDS
+        else:
+            rows = [json.loads(line) for line in f]
+    assert len(rows) == count >= 30
+    assert {row["search_location"] for row in rows} <= {"London", "Berlin"}
+    assert not (tmp_path / f"{name}.part").exists()
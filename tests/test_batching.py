@@ -0,0 +1,84 @@
+import pytest
+
+import batching
+from batching import AdaptiveBatching, FixedBatching, split_batches
+
+
+def measured(sizes, explore=0.0, **kwargs):
+    """
+    AdaptiveBatching with one batch per size; `sizes` maps size -> seconds,
+    every input giving one record.
+    """
+    policy = AdaptiveBatching(explore=explore, **kwargs)
+    for size, seconds in sizes.items():
+        policy.record("ds", size, size, seconds)
+    return policy
+
+
+def test_split_batches():
+    assert split_batches(list(range(7)), 3) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert split_batches([1, 2], 0) == [[1], [2]]
+
+
+def test_fixed_batching():
+    assert FixedBatching().batch_size("ds", 1234) == 1234
+    assert FixedBatching(100).batch_size("ds", 1234) == 100
+    assert FixedBatching(100).batch_size("ds", 30) == 30
+
+
+def test_short_lists_are_never_split():
+    policy = measured({50: 1.0, 100: 1.0})
+
+    assert policy.batch_size("ds", 500) == 500
+    assert policy.batch_size("ds", 3) == 3
+
+
+def test_first_run_uses_the_initial_batch_size():
+    assert AdaptiveBatching().batch_size("ds", 10000) == 500
+
+
+def test_explores_an_unmeasured_neighbour_until_two_sizes_are_known():
+    policy = measured({500: 10.0})
+
+    # One size gives no slope, so every size fitting in one wave of 4 ties;
+    # the smallest of them, 2500, is not measured yet and gets tried.
+    assert policy.batch_size("ds", 10000) == 2500
+    policy.record("ds", 2500, 2500, 10.0)
+    assert policy.batch_size("ds", 10000) == 2500
+
+
+def test_picks_the_size_with_the_best_throughput():
+    # 4 in flight: 1000 inputs take one wave of 250, or one batch of 1000 at 60 s.
+    policy = measured({250: 10.0, 1000: 60.0}, batch_sizes=(250, 1000))
+
+    assert policy.estimate("ds", 250, 1000) == pytest.approx(6000)
+    assert policy.estimate("ds", 1000, 1000) == pytest.approx(1000)
+    assert policy.batch_size("ds", 1000) == 250
+
+
+def test_unmeasured_sizes_are_estimated_with_a_linear_fit():
+    policy = measured({100: 11.0, 500: 15.0})
+
+    # overhead 10 s + 0.01 s per input
+    assert policy.estimate("ds", 250, 250) == pytest.approx(60 * 250 / 12.5)
+
+
+def test_random_exploration_tries_a_neighbour(monkeypatch):
+    policy = measured({250: 10.0, 1000: 60.0}, explore=0.5, batch_sizes=(100, 250, 1000))
+
+    monkeypatch.setattr(batching.random, "random", lambda: 0.9)
+    assert policy.batch_size("ds", 1000) == 250
+    monkeypatch.setattr(batching.random, "random", lambda: 0.1)
+    # 100 is the closest size not measured yet.
+    assert policy.batch_size("ds", 1000) == 100
+
+
+def test_stats_and_history_file(tmp_path):
+    path = str(tmp_path / "batching.json")
+    policy = AdaptiveBatching(history_path=path)
+    policy.record("ds", 100, 200, 10.0)
+    policy.record("ds", 100, 100, 20.0)
+
+    assert AdaptiveBatching(history_path=path).stats() == {
+        "ds": {100: {"batches": 2, "mean_seconds": 15.0, "records_per_minute": 600.0}}
+    }
@@ -0,0 +1,40 @@
+import logging
+import os
+
+from benchmark import _run_collector_case, run_case
+
+
+def _exit_without_result():
+    os._exit(3)
+
+
+def _answer():
+    return {"records": 1}
+
+
+def test_run_case_returns_the_child_result():
+    result = run_case(_answer, ())
+
+    assert result["records"] == 1
+    assert result["peak_rss_kb"] > 0
+
+
+def test_run_case_reports_a_child_that_dies_without_answering():
+    assert run_case(_exit_without_result, ()) == {"error": "case process exited with code 3"}
+
+
+def test_collector_case_times_collector_run(server, api, tmp_path, monkeypatch):
+    monkeypatch.setenv("BRIGHTDATA_API_URL", server.url)
+    level = logging.getLogger().level
+    try:
+        result = _run_collector_case("company_info", 3, 2, server.url, str(tmp_path))
+    finally:
+        logging.getLogger().setLevel(level)
+
+    assert result["runs"] == 2
+    assert result["records"] == 3
+    assert result["bytes_written"] == os.path.getsize(tmp_path / "company_info-3.json")
+    assert 0 < result["time_to_first_record_p50"] <= result["latency_p50"]
+    # One trigger per run; the CPU breakdown downloads the same snapshot again.
+    assert api.requests["trigger"] == 2
+    assert api.requests["snapshot"] >= 4
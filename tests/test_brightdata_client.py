@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from brightdata_client import BrightDataClient, SnapshotNotReady
+from conftest import COMPANY_URLS
+
+COMPANY_INFO = "gd_l1vikfnt1wgvvqz95w"
+
+
+async def _wait_ready(client, snapshot_id):
+    while (await client.progress(snapshot_id))["status"] != "ready":
+        await asyncio.sleep(0.01)
+
+
+def test_trigger_progress_snapshot_round_trip(server):
+    inputs = [{"url": url} for url in COMPANY_URLS]
+
+    async def run():
+        async with BrightDataClient("test-token", base_url=server.url) as client:
+            snapshot_id = (await client.trigger(COMPANY_INFO, inputs))["snapshot_id"]
+            await _wait_ready(client, snapshot_id)
+            listing = await client.snapshots(COMPANY_INFO)
+            records = await client.snapshot(snapshot_id)
+            streamed = [record async for record in client.stream_snapshot(snapshot_id, chunk_size=1024)]
+            return snapshot_id, listing, records, streamed
+
+    snapshot_id, listing, records, streamed = asyncio.run(run())
+    assert {"id": snapshot_id, "dataset_id": COMPANY_INFO, "status": "ready"} in listing
+    assert [record["input"] for record in records] == inputs
+    assert streamed == records
+
+
+def test_base_url_from_environment(monkeypatch):
+    monkeypatch.setenv("BRIGHTDATA_API_URL", "http://127.0.0.1:9/")
+    assert BrightDataClient("test-token").base_url == "http://127.0.0.1:9"
+
+
+def test_unfinished_snapshot_raises_not_ready(server):
+    async def run(download):
+        async with BrightDataClient("test-token", base_url=server.url) as client:
+            snapshot_id = (await client.trigger(COMPANY_INFO, [{"url": COMPANY_URLS[0]}]))["snapshot_id"]
+            await download(client, snapshot_id)
+
+    async def snapshot(client, snapshot_id):
+        await client.snapshot(snapshot_id)
+
+    async def stream(client, snapshot_id):
+        async for _ in client.stream_snapshot(snapshot_id):
+            pass
+
+    for download in (snapshot, stream):
+        with pytest.raises(SnapshotNotReady) as excinfo:
+            asyncio.run(run(download))
+        assert excinfo.value.status == "running"
@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+from batching import FixedBatching
+from conftest import COMPANY_URLS
+from linkedin_company_info_by_url import LinkedInCompanyInfo
+from linkedin_posts_by_company_url import LinkedInPostsCollector
+
+
+def test_collect_saves_records_in_input_order(make_collector, tmp_path):
+    collector = make_collector(LinkedInCompanyInfo)
+    inputs = [{"url": url} for url in COMPANY_URLS]
+    filename = str(tmp_path / "companies.json")
+
+    records = collector.collect(inputs, filename)
+
+    assert [record["input"] for record in records] == inputs
+    with open(filename, encoding="utf-8") as f:
+        assert json.load(f) == records
+
+
+def test_duplicate_inputs_are_triggered_once(make_collector, api, tmp_path):
+    collector = make_collector(LinkedInCompanyInfo)
+    inputs = [
+        {"url": "https://www.linkedin.com/company/lanieri"},
+        {"url": "https://it.linkedin.com/company/lanieri/?trk=public_profile"},
+    ]
+
+    records = collector.collect(inputs, str(tmp_path / "companies.json"))
+
+    assert len(records) == 1
+    assert api.requests["trigger"] == 1
+
+
+def test_batches_are_merged_in_input_order(make_collector, api, tmp_path):
+    collector = make_collector(LinkedInCompanyInfo, batching=FixedBatching(2, max_in_flight=2))
+    inputs = [{"url": f"https://www.linkedin.com/company/company-{i}"} for i in range(5)]
+
+    records = collector.collect(inputs, str(tmp_path / "companies.json"))
+
+    assert [record["input"] for record in records] == inputs
+    assert api.requests["trigger"] == 3
+
+
+def test_failed_snapshot_returns_none_and_writes_nothing(make_collector, api, tmp_path):
+    api.fail_rate = 1.0
+    collector = make_collector(LinkedInCompanyInfo)
+    filename = tmp_path / "companies.json"
+
+    assert collector.collect([{"url": COMPANY_URLS[0]}], str(filename)) is None
+    assert not filename.exists()
+
+
+def test_save_streams_ndjson(make_collector, tmp_path):
+    collector = make_collector(LinkedInPostsCollector)
+    filename = tmp_path / "posts.ndjson"
+
+    count = asyncio.run(collector.save([{"url": COMPANY_URLS[1]}], str(filename)))
+
+    lines = filename.read_text(encoding="utf-8").splitlines()
+    assert count == len(lines) == 2
+    assert json.loads(lines[0])["discovery_input"] == {"url": COMPANY_URLS[1]}
+
+
+def test_iter_records(make_collector):
+    collector = make_collector(LinkedInPostsCollector)
+
+    records = list(collector.iter_records([{"url": url} for url in COMPANY_URLS]))
+
+    assert len(records) == 2 * len(COMPANY_URLS)
+
+
+def test_trigger_returns_a_ready_snapshot_without_downloading(make_collector, api):
+    collector = make_collector(LinkedInCompanyInfo)
+
+    snapshot_id = asyncio.run(collector.trigger([{"url": COMPANY_URLS[0]}]))
+
+    assert snapshot_id is not None
+    assert api.requests["trigger"] == 1
+    assert api.requests["snapshot"] == 0
+
+
+def test_collectors_keep_polling_while_the_snapshot_is_built(make_collector, api, tmp_path):
+    api.build_delay = 0.1
+    collector = make_collector(LinkedInPostsCollector)
+    filename = tmp_path / "posts.ndjson"
+
+    data = collector.collect([{"url": COMPANY_URLS[0]}], str(tmp_path / "posts.json"))
+    count = asyncio.run(collector.save([{"url": COMPANY_URLS[1]}], str(filename)))
+
+    assert [record["discovery_input"] for record in data] == [{"url": COMPANY_URLS[0]}] * 2
+    assert count == len(filename.read_text(encoding="utf-8").splitlines()) == 2
+    assert api.requests["snapshot"] > 2
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from job_details import JobDetailsEnricher, save_with_details
+from jobs_scraper import JobData, LinkedInJobsScraper
+
+
+def jobs(count):
+    return [
+        JobData(f"Engineer {i}", "Acme", "London", f"https://www.linkedin.com/jobs/view/{4000000000 + i}", "2024-12-01")
+        for i in range(count)
+    ]
+
+
+def test_save_with_details_streams_enriched_jobs(jobs_site, tmp_path):
+    filename = tmp_path / "details.ndjson"
+
+    count = save_with_details(LinkedInJobsScraper(), "engineer", "London", str(filename), max_jobs=30, workers=3)
+
+    records = [json.loads(line) for line in filename.read_text(encoding="utf-8").splitlines()]
+    assert count == len(records) == 30
+    assert len({record["job_link"] for record in records}) == 30
+    assert all(record["job_id"] in record["job_link"] for record in records)
+
+
+def test_a_failing_job_does_not_kill_the_workers():
+    class BrokenEnricher(JobDetailsEnricher):
+        def fetch_details(self, job):
+            raise ValueError("unexpected page")
+
+    results = []
+    # One worker and a one-slot queue: a dead worker would block submit() for good.
+    with BrokenEnricher(LinkedInJobsScraper(), lambda job, details: results.append(details), 1, 1) as enricher:
+        enricher.submit_many(jobs(5))
+
+    assert enricher.count == 5
+    assert results == [None] * 5
+
+
+def test_close_reraises_a_failing_callback():
+    class OfflineEnricher(JobDetailsEnricher):
+        def fetch_details(self, job):
+            return None
+
+    def on_result(job, details):
+        raise OSError("disk full")
+
+    enricher = OfflineEnricher(LinkedInJobsScraper(), on_result, 2, 1)
+    enricher.start()
+    enricher.submit_many(jobs(4))
+
+    with pytest.raises(OSError):
+        enricher.close()
@@ -0,0 +1,92 @@
+import pytest
+
+from job_index import JobIndex
+from jobs_scraper import JobData, LinkedInJobsScraper
+
+
+def job(job_id):
+    return JobData("Engineer", "Acme", "London", f"https://www.linkedin.com/jobs/view/{job_id}", "2024-12-01")
+
+
+def jobs_then(error, count):
+    for i in range(count):
+        yield job(i + 1)
+    raise error
+
+
+def test_claims_are_kept_in_memory_only(tmp_path):
+    path = str(tmp_path / "seen.sqlite3")
+    with JobIndex(path) as index:
+        assert index.add("1")
+        assert not index.add("1")
+        assert index.duplicates == 1
+
+    with JobIndex(path) as index:
+        assert len(index) == 0
+
+
+def test_committed_ids_are_reloaded(tmp_path):
+    path = str(tmp_path / "seen.sqlite3")
+    with JobIndex(path) as index:
+        index.commit(["1", "2", None])
+
+    with JobIndex(path) as index:
+        assert len(index) == 2
+        assert index.seen("2") and not index.seen("3")
+        assert not index.add("1")
+
+
+def test_recent_ids_merge_into_the_sorted_array():
+    index = JobIndex(merge_every=3)
+    for key in ["30", "10", "20", "5", "25"]:
+        assert index.add(key)
+
+    assert list(index._sorted) == [10, 20, 30]
+    assert all(index.seen(key) for key in ["5", "10", "20", "25", "30"])
+    assert not index.seen("15")
+    assert len(index) == 5
+
+
+def test_scrape_jobs_without_an_index_repeats_across_calls(jobs_site):
+    scraper = LinkedInJobsScraper(max_workers=2)
+
+    first = scraper.scrape_jobs("python", "London", max_jobs=30)
+    second = scraper.scrape_jobs("python", "London", max_jobs=30)
+
+    assert len(first) == 30
+    assert [job.job_link for job in second] == [job.job_link for job in first]
+
+
+def test_scrape_jobs_with_an_index_skips_earlier_results(jobs_site):
+    scraper = LinkedInJobsScraper(max_workers=2, job_index=JobIndex())
+
+    first = scraper.scrape_jobs("python", "London", max_jobs=30)
+    second = scraper.scrape_jobs("python", "London", max_jobs=30)
+
+    # The first page is already known, so the second search stops there.
+    assert len(first) == 30
+    assert second == []
+
+
+def test_interrupted_save_commits_only_the_written_jobs(tmp_path):
+    path = str(tmp_path / "seen.sqlite3")
+    with JobIndex(path) as index:
+        scraper = LinkedInJobsScraper(job_index=index)
+        with pytest.raises(KeyboardInterrupt):
+            scraper.save_results(jobs_then(KeyboardInterrupt(), 10), str(tmp_path / "jobs.json"))
+
+    with JobIndex(path) as index:
+        assert len(index) == 10
+        assert index.seen("10") and not index.seen("11")
+
+
+def test_failed_save_commits_nothing(tmp_path):
+    path = str(tmp_path / "seen.sqlite3")
+    with JobIndex(path) as index:
+        scraper = LinkedInJobsScraper(job_index=index)
+        with pytest.raises(RuntimeError):
+            scraper.save_results(jobs_then(RuntimeError("page failed"), 0), str(tmp_path / "jobs.json"))
+        scraper.mark_saved([job(7)])
+
+    with JobIndex(path) as index:
+        assert list(index._sorted) == [7]
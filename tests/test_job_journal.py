@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+from batching import FixedBatching
+from brightdata_client import BrightDataClient
+from job_journal import STATUS_DONE, STATUS_FAILED, STATUS_PARTIAL, JobJournal
+from linkedin_company_info_by_url import LinkedInCompanyInfo
+from linkedin_posts_by_company_url import LinkedInPostsCollector
+from polling import AdaptivePolling
+
+COMPANY = {"url": "https://www.linkedin.com/company/lanieri"}
+
+
+def test_finished_run_leaves_nothing_to_resume(make_collector, tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    collector = make_collector(LinkedInPostsCollector, journal=journal)
+
+    collector.collect([COMPANY], str(tmp_path / "posts.json"))
+
+    assert journal.unfinished() == []
+    assert [event["status"] for event in journal.history(1)] == ["pending", "triggered", "ready", STATUS_DONE]
+
+
+def test_resume_downloads_a_journaled_snapshot_without_triggering(make_collector, server, api, tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    collector = make_collector(LinkedInPostsCollector, journal=journal)
+    filename = tmp_path / "posts.ndjson"
+
+    async def crash_after_trigger():
+        async with BrightDataClient("test-token", base_url=server.url) as client:
+            response = await client.trigger(collector.dataset_id, [COMPANY], **collector.TRIGGER_PARAMS)
+        job_id = journal.begin(collector.namespace, collector.dataset_id, [COMPANY], str(filename))
+        journal.triggered(job_id, response["snapshot_id"], [COMPANY])
+
+    asyncio.run(crash_after_trigger())
+
+    assert collector.resume() == [2]
+    assert api.requests["trigger"] == 1
+    assert len(filename.read_text(encoding="utf-8").splitlines()) == 2
+    assert journal.unfinished() == []
+    assert [event["status"] for event in journal.history(1)] == ["pending", "triggered", "ready", "downloading", STATUS_DONE]
+
+
+def test_resumed_snapshot_is_not_recorded_as_a_polling_sample(make_collector, server, tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    polling = AdaptivePolling(initial_interval=0.01)
+    collector = make_collector(LinkedInPostsCollector, journal=journal, polling=polling)
+    filename = tmp_path / "posts.ndjson"
+
+    async def crash_after_trigger():
+        async with BrightDataClient("test-token", base_url=server.url) as client:
+            response = await client.trigger(collector.dataset_id, [COMPANY], **collector.TRIGGER_PARAMS)
+        job_id = journal.begin(collector.namespace, collector.dataset_id, [COMPANY], str(filename))
+        journal.triggered(job_id, response["snapshot_id"], [COMPANY])
+
+    asyncio.run(crash_after_trigger())
+
+    assert collector.resume() == [2]
+    assert polling.stats() == {}
+
+
+def test_resume_triggers_jobs_that_never_got_a_snapshot(make_collector, api, tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    collector = make_collector(LinkedInPostsCollector, journal=journal)
+    filename = tmp_path / "posts.json"
+    journal.begin(collector.namespace, collector.dataset_id, [COMPANY], str(filename))
+
+    assert collector.resume() == [2]
+    assert api.requests["trigger"] == 1
+    with open(filename, encoding="utf-8") as f:
+        assert len(json.load(f)) == 2
+
+
+def test_failed_snapshot_is_journaled_as_failed(make_collector, api, tmp_path):
+    api.fail_rate = 1.0
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    collector = make_collector(LinkedInPostsCollector, journal=journal)
+
+    assert collector.collect([COMPANY], str(tmp_path / "posts.json")) is None
+    assert journal.unfinished() == []
+    assert journal.history(1)[-1]["status"] == STATUS_FAILED
+
+
+class Draws:
+    """
+    Stand-in for the server's random source: plays back fixed draws.
+    """
+
+    def __init__(self, *values):
+        self.values = list(values)
+
+    def random(self):
+        return self.values.pop(0) if self.values else 1.0
+
+
+def companies(count):
+    return [{"url": f"https://www.linkedin.com/company/company-{i}"} for i in range(count)]
+
+
+def test_batches_are_journaled_with_their_own_snapshots(make_collector, tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    collector = make_collector(LinkedInCompanyInfo, journal=journal, batching=FixedBatching(2))
+
+    collector.collect(companies(5), str(tmp_path / "companies.json"))
+
+    batches = journal.batches(1)
+    assert [len(batch.inputs) for batch in batches] == [2, 2, 1]
+    assert all(batch.status == STATUS_DONE and batch.snapshot_id for batch in batches)
+    assert len({batch.snapshot_id for batch in batches}) == 3
+    assert journal.unfinished() == []
+
+
+def test_failed_batch_keeps_the_others_and_resume_retriggers_only_it(make_collector, api, tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    collector = make_collector(
+        LinkedInCompanyInfo, journal=journal, batching=FixedBatching(2, max_in_flight=1)
+    )
+    inputs = companies(5)
+    filename = tmp_path / "companies.json"
+    api.fail_rate = 0.5
+    api.random = Draws(1.0, 0.0, 1.0)
+
+    records = collector.collect(inputs, str(filename))
+
+    assert [record["input"] for record in records] == inputs[:2] + inputs[4:]
+    assert [entry.status for entry in journal.unfinished()] == [STATUS_PARTIAL]
+    assert [batch.status for batch in journal.batches(1)] == [STATUS_DONE, STATUS_FAILED, STATUS_DONE]
+
+    assert collector.resume() == [5]
+    assert api.requests["trigger"] == 4
+    with open(filename, encoding="utf-8") as f:
+        assert [record["input"] for record in json.load(f)] == inputs
+    assert journal.unfinished() == []
+
+
+def test_resume_of_a_crashed_batched_run_reuses_recorded_snapshots(make_collector, server, api, tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.sqlite3"))
+    collector = make_collector(LinkedInCompanyInfo, journal=journal, batching=FixedBatching(2))
+    inputs = companies(5)
+    filename = tmp_path / "companies.json"
+
+    async def crash_after_two_triggers():
+        job_id = journal.begin(collector.namespace, collector.dataset_id, inputs, str(filename))
+        async with BrightDataClient("test-token", base_url=server.url) as client:
+            for batch in (inputs[:2], inputs[2:4]):
+                batch_id = journal.begin(collector.namespace, collector.dataset_id, batch, parent_id=job_id)
+                response = await client.trigger(collector.dataset_id, batch)
+                journal.triggered(batch_id, response["snapshot_id"], batch)
+        journal.begin(collector.namespace, collector.dataset_id, inputs[4:], parent_id=job_id)
+
+    asyncio.run(crash_after_two_triggers())
+
+    assert collector.resume() == [5]
+    assert api.requests["trigger"] == 3
+    with open(filename, encoding="utf-8") as f:
+        assert [record["input"] for record in json.load(f)] == inputs
@@ -0,0 +1,30 @@
+import pytest
+
+from job_parsers import FIXTURES_DIR, get_parser
+from jobs_scraper import job_from_card
+
+FIXTURES = sorted(FIXTURES_DIR.glob("*.html"))
+# The module each optional backend needs.
+BACKEND_MODULES = {"lxml": "lxml.etree", "selectolax": "selectolax.lexbor"}
+
+
+def jobs(backend, path):
+    parser = get_parser(backend)
+    return [job_from_card(parser, card) for card in parser.parse_cards(path.read_text(encoding="utf-8"))]
+
+
+def test_bs4_parses_the_fixtures():
+    counts = {path.name: len(jobs("bs4", path)) for path in FIXTURES}
+
+    assert counts == {"edge_cases.html": 5, "empty_page.html": 0, "search_page.html": 25}
+    edge = jobs("bs4", FIXTURES_DIR / "edge_cases.html")
+    assert edge[0].job_link == "https://www.linkedin.com/jobs/view/research-engineer-ai-machine-learning-at-google-4086259724"
+    assert edge[1].company == "Ben & Jerry's (Unilever)"
+
+
+@pytest.mark.parametrize("backend", sorted(BACKEND_MODULES))
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda path: path.name)
+def test_backends_match_bs4(backend, path):
+    pytest.importorskip(BACKEND_MODULES[backend])
+
+    assert jobs(backend, path) == jobs("bs4", path)
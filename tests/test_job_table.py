@@ -0,0 +1,46 @@
+import pytest
+
+from job_table import JobTable
+from jobs_scraper import JobData, LinkedInJobsScraper
+
+JOBS = [
+    JobData("Engineer", "Acme", "London", "https://www.linkedin.com/jobs/view/engineer-at-acme-4000000001", "2024-12-01"),
+    JobData("Engineer", "Acme", "Berlin", "https://www.linkedin.com/jobs/view/4000000002", "2024-12-01"),
+    JobData("Analyst", "Initech", "London", "https://www.linkedin.com/jobs/view/analyst-4000000003", "N/A"),
+    # Links that do not split into slug and id are kept as they are.
+    JobData("Analyst", "Initech", "Paris", "https://example.com/jobs/7", "N/A"),
+    JobData("Analyst", "Initech", "Paris", "https://www.linkedin.com/jobs/view/analyst-007", "N/A"),
+]
+
+
+def test_rows_come_back_unchanged():
+    table = JobTable(JOBS)
+
+    assert len(table) == 5
+    assert list(table) == JOBS
+    assert table[-1] == JOBS[-1]
+    assert table.column("title") == [job.title for job in JOBS]
+    assert table._values["job_slug"] == ["engineer-at-acme", "", "analyst"]
+    assert table._job_ids.tolist()[:3] == [4000000001, 4000000002, 4000000003]
+
+
+@pytest.mark.parametrize("name", ["jobs.ndjson", "jobs.ndjson.gz"])
+def test_save_and_load_columnar_round_trip(tmp_path, name):
+    filename = str(tmp_path / name)
+
+    JobTable(JOBS).save_columnar(filename)
+    table = JobTable.load_columnar(filename)
+
+    assert list(table) == JOBS
+    assert not (tmp_path / f"{name}.part").exists()
+    table.append(JOBS[0])
+    assert table._values["title"] == ["Engineer", "Analyst"]
+
+
+def test_table_scraped_through_the_stand_in(jobs_site, tmp_path):
+    scraper = LinkedInJobsScraper(max_workers=2)
+    jobs = scraper.scrape_jobs("python", "London", max_jobs=60)
+
+    JobTable(jobs).save_columnar(str(tmp_path / "jobs.ndjson"))
+
+    assert list(JobTable.load_columnar(str(tmp_path / "jobs.ndjson"))) == jobs
@@ -0,0 +1,154 @@
+import csv
+import json
+import threading
+import time
+
+import pytest
+
+from jobs_scraper import JobData, LinkedInJobsScraper, PageFailed, ScraperConfig
+
+
+def jobs_then(error, count=3):
+    for i in range(count):
+        yield JobData(f"Engineer {i}", "Acme", "London", f"https://www.linkedin.com/jobs/view/{i}", "2024-12-01")
+    raise error
+
+
+def job_link(job_id):
+    return f"https://www.linkedin.com/jobs/view/{job_id}"
+
+
+def serve_pages(monkeypatch, scraper, sizes, delay=lambda page: 0):
+    """
+    Replace _scrape_page: page i holds sizes[i] jobs, 0 meaning empty.
+    Records which pages were requested and how many ran at once.
+    """
+    state = {"active": 0, "peak": 0, "starts": []}
+    lock = threading.Lock()
+
+    def scrape_page(keywords, location, start, stop, index):
+        page = start // ScraperConfig.JOBS_PER_PAGE
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            state["starts"].append(start)
+        try:
+            time.sleep(delay(page))
+            if page >= len(sizes) or not sizes[page]:
+                return None
+            return [JobData("Engineer", "Acme", "London", job_link(page * 100 + i), "") for i in range(sizes[page])]
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    monkeypatch.setattr(scraper, "_scrape_page", scrape_page)
+    return state
+
+
+class FakeResponse:
+    def __init__(self, status_code, url):
+        self.status_code = status_code
+        self.url = url
+        self.text = ""
+
+
+class FakeSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def get(self, url, headers=None):
+        self.calls += 1
+        return FakeResponse(self.statuses.pop(0), url)
+
+
+def test_pages_are_yielded_in_order(monkeypatch):
+    scraper = LinkedInJobsScraper(max_workers=4, requests_per_second=0)
+    # Later pages finish first.
+    serve_pages(monkeypatch, scraper, [25] * 8, delay=lambda page: (8 - page) * 0.01)
+
+    jobs = scraper.scrape_jobs("python", "London", max_jobs=200)
+
+    assert [job.job_link for job in jobs] == [job_link(page * 100 + i) for page in range(8) for i in range(25)]
+
+
+def test_scrape_stops_at_the_first_empty_page(monkeypatch):
+    scraper = LinkedInJobsScraper(max_workers=4, requests_per_second=0)
+    serve_pages(monkeypatch, scraper, [25, 25, 0, 25, 25])
+
+    jobs = scraper.scrape_jobs("python", "London", max_jobs=1000)
+
+    assert len(jobs) == 50
+    assert {job.job_link for job in jobs} == {job_link(page * 100 + i) for page in range(2) for i in range(25)}
+
+
+def test_in_flight_pages_are_bounded(monkeypatch):
+    scraper = LinkedInJobsScraper(max_workers=3, requests_per_second=0)
+    state = serve_pages(monkeypatch, scraper, [25] * 20, delay=lambda page: 0.02)
+
+    assert len(scraper.scrape_jobs("python", "London", max_jobs=500)) == 500
+    assert state["peak"] == 3
+
+    state = serve_pages(monkeypatch, scraper, [25] * 20)
+    scraper.scrape_jobs("python", "London", max_jobs=50)
+    # Never more pages than max_jobs can use.
+    assert sorted(state["starts"]) == [0, 25]
+
+
+@pytest.mark.parametrize("status", [400, 403, 404])
+def test_client_errors_are_not_retried(status):
+    scraper = LinkedInJobsScraper(requests_per_second=0)
+    scraper.session = FakeSession([status] * ScraperConfig.MAX_PAGE_ATTEMPTS)
+
+    with pytest.raises(PageFailed):
+        scraper._scrape_page("python", "London", 0, threading.Event(), None)
+    assert scraper.session.calls == 1
+
+
+@pytest.mark.parametrize("status", [429, 999, 503])
+def test_throttling_and_server_errors_are_retried(status, monkeypatch):
+    monkeypatch.setattr(ScraperConfig, "RATE_LIMIT_DELAY", 0)
+    monkeypatch.setattr(ScraperConfig, "PAGE_BACKOFF", 0)
+    scraper = LinkedInJobsScraper(requests_per_second=0)
+    scraper.session = FakeSession([status] * ScraperConfig.MAX_PAGE_ATTEMPTS)
+
+    with pytest.raises(RuntimeError):
+        scraper._scrape_page("python", "London", 0, threading.Event(), None)
+    assert scraper.session.calls == ScraperConfig.MAX_PAGE_ATTEMPTS
+
+
+def test_save_results_writes_a_json_array(tmp_path):
+    scraper = LinkedInJobsScraper()
+    job = JobData("Engineer", "Acme", "London", "https://www.linkedin.com/jobs/view/1", "2024-12-01")
+
+    assert scraper.save_results([job], str(tmp_path / "jobs.json")) == 1
+    with open(tmp_path / "jobs.json", encoding="utf-8") as f:
+        assert json.load(f) == [vars(job)]
+
+
+@pytest.mark.parametrize("name", ["jobs.ndjson", "jobs.csv", "jobs.json"])
+def test_interrupted_save_keeps_the_jobs_written_so_far(tmp_path, name):
+    scraper = LinkedInJobsScraper()
+    filename = tmp_path / name
+
+    with pytest.raises(KeyboardInterrupt):
+        scraper.save_results(jobs_then(KeyboardInterrupt()), str(filename))
+
+    assert not (tmp_path / f"{name}.part").exists()
+    with open(filename, encoding="utf-8") as f:
+        if name.endswith(".ndjson"):
+            titles = [json.loads(line)["title"] for line in f]
+        elif name.endswith(".csv"):
+            titles = [row["title"] for row in csv.DictReader(f)]
+        else:
+            titles = [job["title"] for job in json.load(f)]
+    assert titles == ["Engineer 0", "Engineer 1", "Engineer 2"]
+
+
+def test_interrupted_save_without_jobs_writes_nothing(tmp_path):
+    scraper = LinkedInJobsScraper()
+
+    with pytest.raises(RuntimeError):
+        scraper.save_results(jobs_then(RuntimeError("page failed"), count=0), str(tmp_path / "jobs.json"))
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import COMPANY_URLS
+from linkedin_collect import collect_to_file, main, read_inputs
+from output_sinks import open_sink
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def cli_env(server, monkeypatch):
+    monkeypatch.setenv("BRIGHTDATA_API_TOKEN", "test-token")
+    monkeypatch.setenv("BRIGHTDATA_API_URL", server.url)
+    return server
+
+
+def test_read_inputs_jsonl(tmp_path):
+    path = tmp_path / "inputs.jsonl"
+    path.write_text('{"url": "a"}\n\n{"keyword": "b", "location": "c"}\n', encoding="utf-8")
+
+    assert list(read_inputs(str(path))) == [{"url": "a"}, {"keyword": "b", "location": "c"}]
+
+
+def test_read_inputs_csv_drops_empty_cells(tmp_path):
+    path = tmp_path / "inputs.csv"
+    path.write_text("keyword,location,country\nanalyst,London,\n,,\ndesigner,,FR\n", encoding="utf-8")
+
+    assert list(read_inputs(str(path))) == [
+        {"keyword": "analyst", "location": "London"},
+        {"keyword": "designer", "country": "FR"},
+    ]
+
+
+def test_read_inputs_url_list(tmp_path):
+    path = tmp_path / "urls.txt"
+    path.write_text("# companies\nhttps://a\n\n  https://b  \n", encoding="utf-8")
+
+    assert list(read_inputs(str(path))) == [{"url": "https://a"}, {"url": "https://b"}]
+
+
+def test_dataset_command_appends_every_chunk_to_one_file(cli_env, api, tmp_path):
+    inputs = tmp_path / "companies.txt"
+    inputs.write_text("\n".join(COMPANY_URLS), encoding="utf-8")
+    out = tmp_path / "companies.ndjson"
+
+    status = main(["company_info", "--input", str(inputs), "--out", str(out), "--chunk-size", "2"])
+
+    records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert status == 0
+    assert [record["input"]["url"] for record in records] == COMPANY_URLS
+    assert api.requests["trigger"] == 2
+
+
+def test_dataset_command_needs_a_token(monkeypatch, tmp_path):
+    monkeypatch.delenv("BRIGHTDATA_API_TOKEN", raising=False)
+    monkeypatch.delenv("API_TOKEN", raising=False)
+
+    with pytest.raises(SystemExit):
+        main(["company_info", "--input", str(tmp_path / "urls.txt")])
+
+
+class ChunkCollector:
+    """
+    collect_into() stand-in: one record per input, [] or None for marked chunks.
+    """
+
+    def __init__(self, results):
+        self.results = iter(results)
+
+    async def collect_into(self, chunk, sink):
+        result = next(self.results)
+        if result == "records":
+            sink.write_many(chunk)
+            return len(chunk)
+        return result
+
+
+def test_an_empty_chunk_keeps_the_chunks_already_written(tmp_path):
+    filename = tmp_path / "posts.ndjson"
+    rows = [{"url": str(i)} for i in range(6)]
+
+    count = asyncio.run(collect_to_file(ChunkCollector(["records", 0, "records"]), rows, str(filename), chunk_size=2))
+
+    assert count == 4
+    assert [json.loads(line)["url"] for line in filename.read_text(encoding="utf-8").splitlines()] == ["0", "1", "4", "5"]
+
+
+def test_a_failed_chunk_writes_nothing(tmp_path):
+    filename = tmp_path / "posts.ndjson"
+    rows = [{"url": str(i)} for i in range(4)]
+
+    count = asyncio.run(collect_to_file(ChunkCollector(["records", None]), rows, str(filename), chunk_size=2))
+
+    assert count is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_empty_snapshot_is_not_a_failure(make_collector, api, tmp_path):
+    from linkedin_posts_by_company_url import LinkedInPostsCollector
+
+    api.records_per_input = 0
+    collector = make_collector(LinkedInPostsCollector)
+    sink = open_sink(str(tmp_path / "posts.ndjson"))
+
+    assert asyncio.run(collector.collect_into([{"url": COMPANY_URLS[0]}], sink)) == 0
+    sink.abort()
+
+
+def test_free_jobs_command(jobs_site, tmp_path):
+    searches = tmp_path / "searches.jsonl"
+    searches.write_text('{"keywords": "engineer", "location": "London", "max_jobs": 30}\n', encoding="utf-8")
+    out = tmp_path / "jobs.ndjson"
+
+    assert main(["free_jobs", "--input", str(searches), "--out", str(out)]) == 0
+    assert len(out.read_text(encoding="utf-8").splitlines()) == 30
+
+
+def test_launcher_runs_the_command():
+    output = subprocess.run(
+        [sys.executable, str(ROOT / "linkedin-collect"), "--list"], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.splitlines()[0].split() == ["company_info", "company", "pages", "by", "URL"]
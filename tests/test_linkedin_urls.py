@@ -0,0 +1,53 @@
+import pytest
+
+from linkedin_urls import canonicalize_url, dedupe_inputs, entity_key, job_id, url_kind
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://uk.linkedin.com/in/John-Smith-123/?originalSubdomain=uk",
+            "https://www.linkedin.com/in/John-Smith-123",
+        ),
+        (
+            "linkedin.com/company/Bright-Data/about/?trk=public_profile",
+            "https://www.linkedin.com/company/Bright-Data",
+        ),
+        (
+            "https://www.linkedin.com/jobs/view/data-analyst-at-acme-4073552631/?refId=abc&trackingId=xyz",
+            "https://www.linkedin.com/jobs/view/data-analyst-at-acme-4073552631",
+        ),
+        (
+            "https://www.linkedin.com/jobs/search?location=London&keywords=data&trk=public_jobs&position=1",
+            "https://www.linkedin.com/jobs/search?keywords=data&location=London",
+        ),
+        (
+            "https://www.linkedin.com/search/results/people/?keywords=data%20scientist&origin=GLOBAL_SEARCH_HEADER&trkInfo=x",
+            "https://www.linkedin.com/search/results/people?keywords=data+scientist&origin=GLOBAL_SEARCH_HEADER",
+        ),
+        ("  https://example.com/Page?x=1  ", "https://example.com/Page?x=1"),
+    ],
+)
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_search_urls_with_different_keywords_stay_distinct():
+    people = "https://www.linkedin.com/search/results/people/?keywords={}"
+
+    assert canonicalize_url(people.format("python")) != canonicalize_url(people.format("java"))
+    assert dedupe_inputs([{"url": people.format("python")}, {"url": people.format("java")}]) == [
+        {"url": "https://www.linkedin.com/search/results/people?keywords=python"},
+        {"url": "https://www.linkedin.com/search/results/people?keywords=java"},
+    ]
+
+
+def test_jobs_are_keyed_by_id():
+    slugged = "https://it.linkedin.com/jobs/view/data-analyst-4073552631?trk=x"
+    bare = "https://www.linkedin.com/jobs/view/4073552631/"
+
+    assert job_id(slugged) == job_id(bare) == "4073552631"
+    assert entity_key(slugged) == entity_key(bare) == "job:4073552631"
+    assert url_kind(slugged) == "job"
+    assert url_kind("https://www.linkedin.com/jobs/search?keywords=data") == "job_search"
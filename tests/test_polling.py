@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+
+from polling import AdaptivePolling, linear_fit
+
+
+def no_jitter(**kwargs):
+    return AdaptivePolling(jitter=0, **kwargs)
+
+
+def test_linear_fit():
+    assert linear_fit([]) is None
+    assert linear_fit([(10, 5.0), (20, 7.0), (30, 9.0)]) == pytest.approx((3.0, 0.2))
+    # One input count only: the mean duration is all overhead.
+    assert linear_fit([(10, 4.0), (10, 6.0)]) == (5.0, 0.0)
+    # Neither part goes negative.
+    assert linear_fit([(10, 9.0), (20, 7.0)]) == (8.0, 0.0)
+
+
+def test_without_history_polls_back_off_from_the_initial_interval():
+    schedule = no_jitter(initial_interval=0.5, backoff_factor=2, max_interval=3).schedule("ds", 10)
+
+    assert [schedule.next_delay() for _ in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+    assert schedule.polls == 5
+
+
+def test_first_poll_lands_just_before_the_learned_eta():
+    polling = no_jitter(eta_lead=0.9)
+    for inputs, seconds in [(10, 5.0), (20, 7.0), (30, 9.0)]:
+        polling.record("ds", inputs, seconds, polls=2)
+
+    assert polling.estimate("ds", 50) == pytest.approx(13.0)
+    assert polling.estimate("other", 50) is None
+    schedule = polling.schedule("ds", 50)
+    schedule.started -= 2.0
+    assert schedule.next_delay() == pytest.approx(13.0 * 0.9 - 2.0, abs=0.01)
+
+
+def test_past_the_eta_polls_back_off():
+    polling = no_jitter(initial_interval=0.5, backoff_factor=2, eta_lead=0.9)
+    polling.record("ds", 10, 5.0, polls=1)
+    schedule = polling.schedule("ds", 10)
+    schedule.started -= 10.0
+
+    assert [schedule.next_delay() for _ in range(3)] == [0.5, 1.0, 2.0]
+
+
+def test_jitter_stays_within_bounds():
+    schedule = AdaptivePolling(initial_interval=1, backoff_factor=1, jitter=0.2).schedule("ds")
+
+    delays = [schedule.next_delay() for _ in range(200)]
+    assert all(0.8 <= delay <= 1.2 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_only_ready_recorded_schedules_add_history():
+    polling = no_jitter()
+    polling.schedule("ds", 5).finished("ready")
+    polling.schedule("ds", 5).finished("failed")
+    polling.schedule("ds", 5, record=False).finished("ready")
+
+    assert polling.stats()["ds"]["samples"] == 1
+
+
+def test_stats_and_history_file(tmp_path):
+    path = str(tmp_path / "polling.json")
+    polling = no_jitter(history_path=path)
+    polling.record("ds", 10, 5.0, polls=2)
+    polling.record("ds", 20, 7.0, polls=4)
+
+    stats = AdaptivePolling(history_path=path).stats()
+    assert stats == {
+        "ds": {
+            "samples": 2,
+            "overhead_seconds": 3.0,
+            "seconds_per_input": 0.2,
+            "mean_duration": 6.0,
+            "runs": 2,
+            "polls_per_run": 3.0,
+        }
+    }
+
+
+def test_stats_while_recording():
+    polling = no_jitter()
+    done = threading.Event()
+
+    def record():
+        for i in range(2000):
+            polling.record(f"ds{i % 7}", i % 50, 1.0 + i % 5, polls=1)
+        done.set()
+
+    thread = threading.Thread(target=record)
+    thread.start()
+    while not done.is_set():
+        for stats in polling.stats().values():
+            assert stats["runs"] >= stats["samples"] > 0
+    thread.join()
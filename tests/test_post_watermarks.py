@@ -0,0 +1,87 @@
+import asyncio
+
+from linkedin_posts_by_company_url import LinkedInPostsCollector
+from output_sinks import open_sink
+from post_watermarks import PostWatermarks
+
+COMPANY = "https://www.linkedin.com/company/lanieri"
+
+
+def post(post_id, date_posted, text="text"):
+    return {
+        "id": post_id,
+        "date_posted": date_posted,
+        "post_text": text,
+        "discovery_input": {"url": COMPANY},
+    }
+
+
+def test_filter_keeps_new_and_changed_posts(tmp_path):
+    watermarks = PostWatermarks(str(tmp_path / "watermarks.sqlite3"))
+    watermarks.filter([post("1", "2024-10-01T10:00:00.000Z"), post("2", "2024-10-02T10:00:00.000Z")])
+
+    fresh = watermarks.filter(
+        [
+            post("1", "2024-10-01T10:00:00.000Z"),
+            post("2", "2024-10-02T10:00:00.000Z", "edited"),
+            post("3", "2024-10-03T10:00:00.000Z"),
+        ]
+    )
+
+    assert [record["id"] for record in fresh] == ["2", "3"]
+
+
+def test_narrow_starts_just_before_the_watermark(tmp_path):
+    watermarks = PostWatermarks(str(tmp_path / "watermarks.sqlite3"))
+    watermarks.filter([post("1", "2024-10-05T10:00:00.000Z")])
+
+    narrowed = watermarks.narrow(
+        [{"url": "https://uk.linkedin.com/company/lanieri/", "start_date": "2024-01-01T00:00:00.000Z"}]
+    )
+
+    assert narrowed[0]["start_date"] == "2024-10-04T10:00:00.000Z"
+    assert watermarks.narrow([{"url": "https://www.linkedin.com/company/other"}]) == [
+        {"url": "https://www.linkedin.com/company/other"}
+    ]
+
+
+def test_select_records_nothing_until_commit(tmp_path):
+    watermarks = PostWatermarks(str(tmp_path / "watermarks.sqlite3"))
+    records = [post("1", "2024-10-01T10:00:00.000Z"), post("1", "2024-10-01T10:00:00.000Z")]
+
+    fresh, update = watermarks.select(records)
+
+    assert [record["id"] for record in fresh] == ["1"]
+    assert watermarks.watermark(COMPANY) is None
+    assert watermarks.select(records)[0] == fresh
+    watermarks.commit(update)
+    assert watermarks.select(records)[0] == []
+
+
+def test_posts_of_a_failed_save_are_collected_again(make_collector, tmp_path):
+    watermarks = PostWatermarks(str(tmp_path / "watermarks.sqlite3"))
+    collector = make_collector(LinkedInPostsCollector, watermarks=watermarks)
+    inputs = [{"url": COMPANY}]
+
+    assert collector.collect(inputs, str(tmp_path / "missing" / "posts.json")) is None
+    assert len(collector.collect(inputs, str(tmp_path / "posts.json"))) == 2
+    assert collector.collect(inputs, str(tmp_path / "posts.json")) == []
+
+
+def test_collect_into_marks_posts_seen_only_when_the_sink_closes(make_collector, tmp_path):
+    watermarks = PostWatermarks(str(tmp_path / "watermarks.sqlite3"))
+    collector = make_collector(LinkedInPostsCollector, watermarks=watermarks)
+    inputs = [{"url": COMPANY}]
+
+    async def collect(abort):
+        sink = open_sink(str(tmp_path / "posts.ndjson"))
+        count = await collector.collect_into(inputs, sink)
+        if abort:
+            sink.abort()
+        else:
+            sink.close()
+        return count
+
+    assert asyncio.run(collect(abort=True)) == 2
+    assert asyncio.run(collect(abort=False)) == 2
+    assert asyncio.run(collect(abort=False)) == 0
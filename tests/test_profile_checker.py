@@ -0,0 +1,39 @@
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from profile_checker import LinkedInUrlChecker, check_urls_to_file
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_check_urls_to_file(server, tmp_path):
+    urls = [f"{server.url}/in/jane-doe", f"{server.url}/company/missing-company"]
+    filename = tmp_path / "checked.ndjson"
+
+    counts = asyncio.run(
+        check_urls_to_file(urls, str(filename), LinkedInUrlChecker(requests_per_second=0))
+    )
+
+    assert counts == {"live": 1, "dead": 1, "unknown": 0}
+    results = [json.loads(line) for line in filename.read_text(encoding="utf-8").splitlines()]
+    # Results are written as checks complete, not in input order.
+    assert {result["url"]: result["status_code"] for result in results} == dict(zip(urls, [200, 404]))
+
+
+def test_checker_does_not_import_the_scraper_stack():
+    code = (
+        "import sys; import profile_checker; "
+        "print(sorted(m for m in ('bs4', 'requests', 'jobs_scraper', 'job_parsers') if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT / "free_scraper",
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip() == "[]"
@@ -0,0 +1,109 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from record_store import RecordStore
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "linkedin_scraper_api_data"
+JOBS = "gd_lpfll7v5hcqtkxl6l"
+POSTS = "gd_lyy3tktm25m4avu764"
+
+
+def job(job_id, timestamp, title="Data Analyst", summary="SQL and Python"):
+    return {
+        "job_posting_id": job_id,
+        "url": f"https://www.linkedin.com/jobs/view/{job_id}",
+        "company_id": "1441",
+        "job_title": title,
+        "job_summary": summary,
+        "timestamp": timestamp,
+    }
+
+
+def test_upsert_by_natural_key_keeps_the_newest_record(tmp_path):
+    store = RecordStore(str(tmp_path / "store.sqlite3"))
+    store.upsert(JOBS, [job("1", "2024-12-02T00:00:00.000Z", "New title")])
+    store.upsert(JOBS, [job("1", "2024-12-01T00:00:00.000Z", "Old title"), job("2", None)])
+
+    assert store.count(JOBS) == 2
+    assert store.get(JOBS, "1")["job_title"] == "New title"
+
+
+def test_records_without_a_key_are_skipped(tmp_path):
+    store = RecordStore(str(tmp_path / "store.sqlite3"))
+
+    assert store.upsert(JOBS, [{"error": "dead_page", "url": "https://www.linkedin.com/jobs/view/3"}]) == 0
+    assert store.skipped == 1
+
+
+def test_find_matches_url_variants(tmp_path):
+    store = RecordStore(str(tmp_path / "store.sqlite3"))
+    store.upsert(JOBS, [job("1", None), job("2", None)])
+
+    found = store.find(JOBS, url="https://uk.linkedin.com/jobs/view/2/?trk=public_jobs")
+
+    assert [record["job_posting_id"] for record in found] == ["2"]
+    assert len(store.find(JOBS, company_id="1441")) == 2
+
+
+def test_search_indexes_text_without_markup(tmp_path):
+    store = RecordStore(str(tmp_path / "store.sqlite3"))
+    store.upsert(
+        JOBS,
+        [
+            job("1", None, summary="<p>Kubernetes and <strong>Terraform</strong></p>"),
+            job("2", None, summary="Excel reporting"),
+        ],
+    )
+
+    assert store.search(JOBS, "terraform") == ["1"]
+    assert [record["job_posting_id"] for record in store.search_records(JOBS, "excel")] == ["2"]
+
+
+def test_search_follows_updates(tmp_path):
+    store = RecordStore(str(tmp_path / "store.sqlite3"))
+    store.upsert(JOBS, [job("1", "2024-12-01T00:00:00.000Z", summary="Excel reporting")])
+    store.upsert(JOBS, [job("1", "2024-12-02T00:00:00.000Z", summary="Spark pipelines")])
+
+    assert store.search(JOBS, "excel") == []
+    assert store.search(JOBS, "spark") == ["1"]
+
+
+def test_fixture_posts_round_trip(tmp_path):
+    with open(DATA_DIR / "linkedin_posts_company_url.json", encoding="utf-8") as f:
+        posts = json.load(f)
+    store = RecordStore(str(tmp_path / "store.sqlite3"))
+
+    store.upsert(POSTS, posts)
+
+    keyed = [post for post in posts if post.get("id")]
+    assert store.count(POSTS) == len({post["id"] for post in keyed})
+    assert store.skipped == len(posts) - len(keyed)
+    assert store.get(POSTS, keyed[0]["id"]) == keyed[0]
+
+
+def test_search_treats_user_text_literally(tmp_path):
+    store = RecordStore(str(tmp_path / "store.sqlite3"))
+    store.upsert(
+        JOBS,
+        [
+            job("1", None, summary="Senior AI/ML Engineer, C++ and Python"),
+            job("2", None, summary="Machine learning NOT required"),
+        ],
+    )
+
+    assert store.search(JOBS, "AI/ML Engineer") == ["1"]
+    assert store.search(JOBS, "c++") == ["1"]
+    assert store.search(JOBS, 'NOT "required') == ["2"]
+    assert store.search(JOBS, "   ") == []
+
+
+def test_raw_search_uses_fts5_syntax(tmp_path):
+    store = RecordStore(str(tmp_path / "store.sqlite3"))
+    store.upsert(JOBS, [job("1", None, summary="Kubernetes for juniors"), job("2", None, summary="Kubernetes")])
+
+    assert store.search(JOBS, "kubernetes NOT juniors", raw=True) == ["2"]
+    assert sorted(store.search(JOBS, "kube*", raw=True)) == ["1", "2"]
+    with pytest.raises(ValueError):
+        store.search(JOBS, "AI/ML", raw=True)
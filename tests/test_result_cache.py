@@ -0,0 +1,69 @@
+from conftest import COMPANY_URLS
+from linkedin_company_info_by_url import LinkedInCompanyInfo
+from linkedin_jobs_by_url import LinkedInJobsCollector
+from result_cache import ResultCache, input_key, record_input
+
+
+def test_input_key_ignores_url_variants_and_empty_fields():
+    assert input_key({"url": "https://uk.linkedin.com/company/lanieri/?trk=x", "country": ""}) == input_key(
+        {"url": "https://www.linkedin.com/company/lanieri"}
+    )
+
+
+def test_second_run_is_served_from_cache(make_collector, api, tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"))
+    collector = make_collector(LinkedInCompanyInfo, cache=cache)
+    inputs = [{"url": url} for url in COMPANY_URLS]
+
+    first = collector.collect(inputs, str(tmp_path / "first.json"))
+    second = collector.collect(inputs, str(tmp_path / "second.json"))
+
+    assert second == first
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert api.requests["trigger"] == 1
+
+
+def test_only_missing_inputs_are_triggered(make_collector, tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"))
+    collector = make_collector(LinkedInCompanyInfo, cache=cache)
+    collector.collect([{"url": COMPANY_URLS[0]}], str(tmp_path / "first.json"))
+
+    records = collector.collect([{"url": url} for url in COMPANY_URLS], str(tmp_path / "second.json"))
+
+    assert [record["input"]["url"] for record in records] == COMPANY_URLS
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_expired_entries_are_collected_again(make_collector, tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"), ttl=-1)
+    collector = make_collector(LinkedInCompanyInfo, cache=cache)
+    inputs = [{"url": COMPANY_URLS[0]}]
+
+    collector.collect(inputs, str(tmp_path / "first.json"))
+    collector.collect(inputs, str(tmp_path / "second.json"))
+
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_collect_records_with_empty_discovery_input_hit_the_cache(make_collector, api, tmp_path):
+    cache = ResultCache(str(tmp_path / "cache.sqlite3"))
+    collector = make_collector(LinkedInJobsCollector, cache=cache)
+    inputs = [
+        {"url": "https://www.linkedin.com/jobs/view/4073552631"},
+        {"url": "https://www.linkedin.com/jobs/view/4073729630"},
+    ]
+
+    first = collector.collect(inputs, str(tmp_path / "first.json"))
+    second = collector.collect(inputs, str(tmp_path / "second.json"))
+
+    assert first[0]["discovery_input"]["time_range"] is None
+    assert second == first
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert api.requests["trigger"] == 1
+
+
+def test_record_input_skips_empty_sources():
+    record = {"input": {"url": "https://www.linkedin.com/jobs/view/1"}, "discovery_input": {"remote": None}}
+
+    assert record_input(record) == {"url": "https://www.linkedin.com/jobs/view/1"}
+    assert record_input({"discovery_input": {"url": ""}}) is None
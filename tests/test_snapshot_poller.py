@@ -0,0 +1,87 @@
+import asyncio
+
+from brightdata_client import BrightDataClient
+from conftest import COMPANY_URLS
+from polling import FixedPolling
+from snapshot_poller import SnapshotPoller
+
+COMPANY_INFO = "gd_l1vikfnt1wgvvqz95w"
+PROFILES = "gd_l1viktl72bvl7bjuj0"
+
+
+def poll(server, watches, settle=0.0, **kwargs):
+    """
+    Trigger one snapshot per (dataset_id, watched_as) pair (None: an
+    unknown snapshot), wait `settle` seconds, then watch them all with one
+    poller and return their final statuses.
+    """
+    kwargs.setdefault("polling", FixedPolling(0.01))
+
+    async def run():
+        async with BrightDataClient("test-token", base_url=server.url) as client:
+            snapshot_ids = []
+            for dataset_id, _ in watches:
+                if dataset_id is None:
+                    snapshot_ids.append("s_missing")
+                else:
+                    response = await client.trigger(dataset_id, [{"url": COMPANY_URLS[0]}])
+                    snapshot_ids.append(response["snapshot_id"])
+            await asyncio.sleep(settle)
+            async with SnapshotPoller(client, **kwargs) as poller:
+                futures = [
+                    poller.watch(snapshot_id, watched_as)
+                    for snapshot_id, (_, watched_as) in zip(snapshot_ids, watches)
+                ]
+                statuses = await asyncio.gather(*futures)
+                assert poller.pending == 0
+                return statuses
+
+    return asyncio.run(run())
+
+
+def test_snapshots_of_one_dataset_share_a_listing_call(server, api):
+    # All three are ready before the first tick, so one listing resolves them.
+    statuses = poll(server, [(COMPANY_INFO, COMPANY_INFO)] * 3, settle=0.2)
+
+    assert statuses == ["ready"] * 3
+    assert api.requests["snapshots"] == 1
+    assert api.requests["progress"] == 0
+
+
+def test_single_and_unknown_dataset_snapshots_use_progress(server, api):
+    statuses = poll(server, [(COMPANY_INFO, COMPANY_INFO), (PROFILES, None)])
+
+    assert statuses == ["ready", "ready"]
+    assert api.requests["snapshots"] == 0
+    assert api.requests["progress"] > 0
+
+
+def test_snapshots_missing_from_the_listing_fall_back_to_progress(server, api):
+    # Watched under the wrong dataset, so the listing never contains them.
+    statuses = poll(server, [(COMPANY_INFO, PROFILES), (COMPANY_INFO, PROFILES)], settle=0.2)
+
+    assert statuses == ["ready", "ready"]
+    assert api.requests["snapshots"] >= 1
+    assert api.requests["progress"] == 2
+
+
+def test_max_errors_in_a_row_end_the_watch(server, api):
+    statuses = poll(server, [(None, None)], max_errors=2)
+
+    assert statuses == ["error"]
+    assert api.requests["progress"] == 2
+
+
+def test_callback_gets_the_final_status(server):
+    seen = []
+
+    async def run():
+        async with BrightDataClient("test-token", base_url=server.url) as client:
+            snapshot_id = (await client.trigger(COMPANY_INFO, [{"url": COMPANY_URLS[0]}]))["snapshot_id"]
+            async with SnapshotPoller(client, interval=0.01) as poller:
+                await poller.watch(snapshot_id, COMPANY_INFO, callback=lambda *args: seen.append(args))
+                await asyncio.sleep(0)
+                return snapshot_id
+
+    snapshot_id = asyncio.run(run())
+    assert seen == [(snapshot_id, "ready")]
@@ -0,0 +1,80 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from output_sinks import open_sink
+from snapshot_reader import SnapshotFile, iter_snapshot, map_snapshot
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "linkedin_scraper_api_data"
+FIXTURES = sorted(path.name for path in DATA_DIR.glob("*.json"))
+
+
+def post_id(record):
+    return record.get("id")
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_iter_snapshot_matches_json_load(name):
+    assert list(iter_snapshot(str(DATA_DIR / name))) == load(DATA_DIR / name)
+
+
+@pytest.mark.parametrize("format", ["json", "ndjson"])
+def test_iter_snapshot_reads_sink_output(tmp_path, format):
+    records = load(DATA_DIR / "linkedin_jobs_keyword.json")
+    filename = str(tmp_path / f"jobs.{format}")
+    with open_sink(filename) as sink:
+        sink.write_many(records)
+
+    assert list(iter_snapshot(filename)) == records
+
+
+def test_iter_snapshot_reads_compact_gzip(tmp_path):
+    records = load(DATA_DIR / "profiles_by_url.json")
+    filename = tmp_path / "profiles.json.gz"
+    with gzip.open(filename, "wt", encoding="utf-8") as f:
+        json.dump(records, f)
+
+    assert list(iter_snapshot(str(filename))) == records
+
+
+def test_map_snapshot_splits_indented_files(tmp_path):
+    records = load(DATA_DIR / "posts_by_profile.json")
+    filename = str(tmp_path / "posts.json")
+    with open_sink(filename) as sink:
+        sink.write_many(records)
+
+    with SnapshotFile(filename) as snapshot:
+        assert snapshot.indexable
+        assert len(snapshot.split(8)) > 1
+
+    assert list(map_snapshot(filename, post_id, workers=2, range_size=64 * 1024)) == [
+        record["id"] for record in records
+    ]
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_crlf_fixtures_are_indexable(name):
+    with SnapshotFile(str(DATA_DIR / name)) as snapshot:
+        assert (snapshot.newline, snapshot.indent) == (b"\r\n", b"  ")
+        assert list(snapshot.iter_range(0, snapshot.size)) == load(DATA_DIR / name)
+
+
+def test_map_snapshot_splits_crlf_files():
+    path = str(DATA_DIR / "linkedin_posts_company_url.json")
+    with SnapshotFile(path) as snapshot:
+        ranges = snapshot.split(8)
+    with open(path, "rb") as f:
+        content = f.read()
+    assert len(ranges) > 1
+    assert all(content.startswith(b"\r\n  {", start) for start, _ in ranges)
+
+    assert list(map_snapshot(path, post_id, workers=2, range_size=256 * 1024)) == [
+        record.get("id") for record in load(path) if record.get("id") is not None
+    ]
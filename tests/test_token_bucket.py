@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from async_jobs_scraper import AsyncLinkedInJobsScraper
+from jobs_scraper import LinkedInJobsScraper, ScraperConfig
+from token_bucket import AsyncTokenBucket, TokenBucket
+
+
+def bucket(rate=1.0, **kwargs):
+    kwargs.setdefault("min_rate", 0.25)
+    kwargs.setdefault("max_rate", 1.5)
+    kwargs.setdefault("increase", 0.2)
+    kwargs.setdefault("decrease", 0.5)
+    kwargs.setdefault("threshold", 3)
+    kwargs.setdefault("cooldown", 0.1)
+    return TokenBucket(rate, **kwargs)
+
+
+def test_success_increases_the_rate_additively_up_to_max_rate():
+    limiter = bucket()
+
+    limiter.success()
+    assert limiter.rate == pytest.approx(1.2)
+    for _ in range(5):
+        limiter.success()
+    assert limiter.rate == 1.5
+
+
+def test_throttled_decreases_the_rate_multiplicatively_down_to_min_rate():
+    limiter = bucket(threshold=100)
+
+    limiter.throttled()
+    assert limiter.rate == 0.5
+    for _ in range(5):
+        limiter.throttled()
+    assert limiter.rate == 0.25
+    assert limiter.throttles == 6
+
+
+def test_unlimited_rate_is_never_adjusted():
+    limiter = bucket(rate=0, threshold=100)
+
+    limiter.success()
+    limiter.throttled()
+    assert limiter.rate == 0
+    assert limiter._reserve() == 0
+
+
+def test_cooldown_after_threshold_throttles_in_a_row(caplog):
+    limiter = bucket(rate=0)
+
+    limiter.throttled()
+    limiter.success()
+    limiter.throttled()
+    limiter.throttled()
+    # The success broke the streak.
+    assert limiter.cooldowns == 0
+
+    with caplog.at_level(logging.WARNING):
+        limiter.throttled()
+    assert limiter.cooldowns == 1
+    assert limiter.consecutive_throttles == 0
+    assert "pausing 0.1s" in caplog.text
+    assert 0 < limiter.stats()["paused_for"] <= 0.1
+
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.05
+
+
+def test_async_bucket_honours_the_cooldown():
+    limiter = AsyncTokenBucket(0, threshold=1, cooldown=0.1)
+    limiter.throttled()
+
+    started = time.monotonic()
+    asyncio.run(limiter.acquire())
+    assert time.monotonic() - started >= 0.05
+
+
+def test_sync_scraper_retries_throttled_pages(jobs_site, api):
+    api.throttle_rate = 0.3
+    scraper = LinkedInJobsScraper(max_workers=1)
+
+    jobs = scraper.scrape_jobs("python", "London", max_jobs=100)
+
+    assert len(jobs) == 100
+    assert scraper.rate_limiter.throttles > 0
+    # Every request was either one of the 4 pages or a throttled attempt.
+    assert api.requests["jobs"] == 4 + scraper.rate_limiter.throttles
+
+
+def test_async_scraper_retries_throttled_pages(jobs_site, api):
+    api.throttle_rate = 0.3
+    scraper = AsyncLinkedInJobsScraper(max_concurrency=1, pages_per_query=1)
+
+    async def run():
+        async with scraper:
+            return await scraper.scrape_jobs("python", "London", max_jobs=100)
+
+    assert len(asyncio.run(run())) == 100
+    assert scraper.rate_limiter.throttles > 0
+    assert api.requests["jobs"] == 4 + scraper.rate_limiter.throttles
+
+
+def test_throttled_pages_slow_the_scraper_down(jobs_site, api, monkeypatch):
+    monkeypatch.setattr(ScraperConfig, "REQUESTS_PER_SECOND", 50)
+    monkeypatch.setattr(ScraperConfig, "MAX_REQUESTS_PER_SECOND", 50)
+    api.throttle_rate = 1.0
+    scraper = LinkedInJobsScraper(max_workers=1)
+
+    assert scraper.scrape_jobs("python", "London", max_jobs=25) == []
+    assert api.requests["jobs"] == ScraperConfig.MAX_PAGE_ATTEMPTS
+    assert scraper.current_rate == 50 * ScraperConfig.RATE_DECREASE ** ScraperConfig.MAX_PAGE_ATTEMPTS